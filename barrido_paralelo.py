@@ -0,0 +1,165 @@
+import argparse
+import math
+import random
+import time
+from cache_resultados import contadores_cache
+
+# ============================================================================
+# Ejecución en paralelo de los barridos de las tablas
+# ============================================================================
+#
+# Cada fila de una tabla (un valor de N) es un trabajo independiente, así que
+# se pueden repartir entre varios procesos. El costo crece con N, por eso los
+# trabajos se envían del más caro al más barato: así las filas de N = 10000
+# no quedan para el final. Los resultados se devuelven en el orden original,
+# y como cada fila se calcula con el mismo código, la salida es idéntica bit
+# a bit a la del cálculo secuencial (salvo en los métodos aleatorios).
+#
+# Con cronometrar=True también se mide cuánto tarda cada trabajo, dentro del
+# proceso que lo ejecuta (sin la espera en la cola ni el envío de resultados).
+# Si el trabajo salió entero de la caché en disco (ver cache_resultados.py) lo
+# medido sería la consulta a SQLite y no el método, así que su tiempo es NaN.
+
+
+def _reiniciar_semilla():
+    """
+    Inicializador de cada proceso: con fork todos los procesos heredan el mismo
+    estado del módulo random, así que se vuelve a sembrar para que las
+    particiones aleatorias y Monte Carlo no repitan la misma secuencia.
+    """
+    random.seed()
+
+
+def _trabajo_cronometrado(trabajo):
+    """
+    Ejecuta funcion(argumento) y mide cuánto tarda. Es una función de nivel de
+    módulo para poder enviarla a otro proceso.
+
+    Parámetros:
+    - trabajo: Tupla (funcion, argumento)
+
+    Retorna:
+    - (resultado, segundos); segundos es NaN si el resultado salió de la caché
+    """
+    funcion, argumento = trabajo
+    antes = contadores_cache()
+    inicio = time.perf_counter()
+    resultado = funcion(argumento)
+    segundos = time.perf_counter() - inicio
+    despues = contadores_cache()
+
+    if despues['aciertos'] > antes['aciertos'] and despues['calculos'] == antes['calculos']:
+        segundos = math.nan
+    return resultado, segundos
+
+
+def ejecutar_en_paralelo(funcion, argumentos, jobs=1, costo=None, cronometrar=False):
+    """
+    Evalúa funcion(argumento) para cada argumento, opcionalmente en un pool de procesos.
+
+    Parámetros:
+    - funcion: Función de nivel de módulo (tiene que poder enviarse a otro proceso)
+    - argumentos: Lista de argumentos, uno por trabajo
+    - jobs: Cantidad de procesos (1 = secuencial, en el proceso actual)
+    - costo: Función que estima el costo de un argumento; los trabajos se envían
+      de mayor a menor costo
+    - cronometrar: Si es True también se mide el tiempo de cada trabajo
+
+    Retorna:
+    - Lista con los resultados, en el mismo orden que argumentos; con
+      cronometrar=True, (resultados, segundos de cada trabajo)
+    """
+    argumentos = list(argumentos)
+
+    if cronometrar:
+        costo_trabajo = None if costo is None else (lambda trabajo: costo(trabajo[1]))
+        pares = ejecutar_en_paralelo(_trabajo_cronometrado, [(funcion, argumento) for argumento in argumentos],
+                                     jobs, costo_trabajo)
+        return [resultado for resultado, _ in pares], [segundos for _, segundos in pares]
+
+    if jobs is None or jobs <= 1 or len(argumentos) <= 1:
+        return [funcion(argumento) for argumento in argumentos]
+
+    # El pool (y con él multiprocessing) se importa solo si hace falta
+    from concurrent.futures import ProcessPoolExecutor
+
+    orden = list(range(len(argumentos)))
+    if costo is not None:
+        orden.sort(key=lambda i: costo(argumentos[i]), reverse=True)
+
+    resultados = [None] * len(argumentos)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_reiniciar_semilla) as ejecutor:
+        futuros = [(i, ejecutor.submit(funcion, argumentos[i])) for i in orden]
+        for i, futuro in futuros:
+            resultados[i] = futuro.result()
+
+    return resultados
+
+
+def _separar(resultados, grillas):
+    """
+    Corta una lista de resultados con la forma de grillas.
+    """
+    separados = []
+    inicio = 0
+    for grilla in grillas:
+        separados.append(resultados[inicio:inicio + len(grilla)])
+        inicio += len(grilla)
+
+    return separados
+
+
+def ejecutar_grillas(funcion, grillas, jobs=1, costo=None, cronometrar=False):
+    """
+    Como ejecutar_en_paralelo, pero para varias grillas a la vez (por ejemplo las
+    tres tablas). Todos los trabajos van a un único pool, así el orden de mayor
+    a menor costo vale para el conjunto y no tabla por tabla.
+
+    Parámetros:
+    - funcion: Función de nivel de módulo que calcula una fila
+    - grillas: Lista de listas de argumentos
+    - jobs: Cantidad de procesos
+    - costo: Función que estima el costo de un argumento
+    - cronometrar: Si es True también se mide el tiempo de cada trabajo
+
+    Retorna:
+    - Lista de listas de resultados, con la misma forma que grillas; con
+      cronometrar=True, (resultados, segundos) con esa misma forma
+    """
+    todos = [argumento for grilla in grillas for argumento in grilla]
+
+    if cronometrar:
+        resultados, segundos = ejecutar_en_paralelo(funcion, todos, jobs, costo, cronometrar=True)
+        return _separar(resultados, grillas), _separar(segundos, grillas)
+
+    return _separar(ejecutar_en_paralelo(funcion, todos, jobs, costo), grillas)
+
+
+def crear_parser(descripcion):
+    """
+    Crea el parser de línea de comandos de los scripts, con el parámetro --jobs.
+    Cada script puede agregarle sus propios parámetros.
+
+    Parámetros:
+    - descripcion: Descripción del script para la ayuda
+
+    Retorna:
+    - argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description=descripcion)
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Cantidad de procesos para calcular los barridos de las tablas (por defecto 1)')
+    return parser
+
+
+def leer_argumento_jobs(descripcion):
+    """
+    Lee el parámetro --jobs de la línea de comandos de los scripts.
+
+    Parámetros:
+    - descripcion: Descripción del script para la ayuda
+
+    Retorna:
+    - Cantidad de procesos pedida (por defecto 1)
+    """
+    return crear_parser(descripcion).parse_args().jobs
@@ -0,0 +1,241 @@
+import atexit
+import functools
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import time
+
+# ============================================================================
+# Caché en disco de las aproximaciones
+# ============================================================================
+#
+# Los métodos de integración son deterministas en N, así que no hace falta
+# recalcularlos en cada ejecución de los scripts. Los resultados se guardan en
+# un archivo SQLite local, con clave (módulo, método, tipo de partición, N,
+# semilla, dtype) y versión del kernel. Cuando se supera MAX_ENTRADAS se
+# eliminan las entradas usadas hace más tiempo (LRU).
+#
+# Una consulta tiene que costar menos que el cálculo que evita, así que:
+# - Los aciertos no escriben en el archivo: la fecha de último acceso se anota
+#   en memoria y se guarda de a ACCESOS_POR_ESCRITURA (y al terminar el proceso).
+# - El conteo de entradas y el desalojo se hacen cada INSERCIONES_POR_DESALOJO
+#   inserciones, así la caché puede pasarse de MAX_ENTRADAS por poco.
+# - Solo se decoran los cálculos caros (las rutas escalares y Monte Carlo);
+#   las versiones vectorizadas tardan menos que la consulta.
+#
+# Variables de entorno:
+# - CACHE_INTEGRALES: ruta del archivo de la caché (por defecto
+#   '.cache_integrales.sqlite' en el directorio de este módulo, no en el actual)
+# - CACHE_INTEGRALES_DESACTIVADA: si está definida no se lee ni se escribe la caché
+
+ARCHIVO_CACHE = os.environ.get('CACHE_INTEGRALES',
+                               os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_integrales.sqlite'))
+MAX_ENTRADAS = 100000
+ACCESOS_POR_ESCRITURA = 1000
+INSERCIONES_POR_DESALOJO = 1000
+
+_conexion = None
+_pid_conexion = None
+_versiones_verificadas = set()
+_contadores = {'aciertos': 0, 'calculos': 0}
+_accesos_pendientes = {}
+_inserciones_sin_desalojo = 0
+
+
+def cache_habilitada():
+    """
+    Indica si la caché en disco está activa.
+    """
+    return os.environ.get('CACHE_INTEGRALES_DESACTIVADA') is None
+
+
+def contadores_cache():
+    """
+    Cuántas llamadas memoizadas hizo este proceso: 'aciertos' (servidas desde la
+    caché) y 'calculos' (que ejecutaron el método, con la caché activa o no).
+    Comparando dos lecturas se sabe si un cálculo salió entero de la caché.
+    """
+    return dict(_contadores)
+
+
+def _obtener_conexion():
+    """
+    Abre (una vez por proceso) la conexión al archivo de la caché y crea la tabla.
+    Si el proceso fue creado con fork se abre una conexión nueva.
+    """
+    global _conexion, _pid_conexion, _inserciones_sin_desalojo
+
+    if _conexion is None or _pid_conexion != os.getpid():
+        # Los accesos anotados por el proceso padre los guarda el padre
+        _accesos_pendientes.clear()
+        _inserciones_sin_desalojo = 0
+        _conexion = sqlite3.connect(ARCHIVO_CACHE, timeout=30)
+        _conexion.execute(
+            "CREATE TABLE IF NOT EXISTS resultados ("
+            " clave TEXT PRIMARY KEY,"
+            " modulo TEXT NOT NULL,"
+            " metodo TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " valor TEXT NOT NULL,"
+            " ultimo_acceso REAL NOT NULL)"
+        )
+        _conexion.execute("CREATE INDEX IF NOT EXISTS idx_acceso ON resultados (ultimo_acceso)")
+        _conexion.commit()
+        _pid_conexion = os.getpid()
+        _versiones_verificadas.clear()
+
+    return _conexion
+
+
+def _invalidar_versiones_viejas(conexion, modulo, metodo, version):
+    """
+    Borra las entradas de (modulo, metodo) calculadas con otra versión del kernel.
+    Se hace una sola vez por proceso y por método.
+    """
+    if (modulo, metodo, version) in _versiones_verificadas:
+        return
+
+    conexion.execute("DELETE FROM resultados WHERE modulo = ? AND metodo = ? AND version != ?",
+                     (modulo, metodo, version))
+    conexion.commit()
+    _versiones_verificadas.add((modulo, metodo, version))
+
+
+def guardar_accesos():
+    """
+    Escribe en el archivo las fechas de último acceso anotadas en memoria.
+    Se llama sola cada ACCESOS_POR_ESCRITURA aciertos y al terminar el proceso.
+    """
+    if not _accesos_pendientes or _conexion is None or _pid_conexion != os.getpid():
+        return
+
+    _conexion.executemany("UPDATE resultados SET ultimo_acceso = ? WHERE clave = ?",
+                          [(momento, clave) for clave, momento in _accesos_pendientes.items()])
+    _conexion.commit()
+    _accesos_pendientes.clear()
+
+
+atexit.register(guardar_accesos)
+
+
+def _desalojar(conexion):
+    """
+    Si la caché supera MAX_ENTRADAS, elimina las entradas menos usadas recientemente.
+    Antes guarda los accesos pendientes, para que el orden LRU esté al día.
+    """
+    guardar_accesos()
+    (cantidad,) = conexion.execute("SELECT COUNT(*) FROM resultados").fetchone()
+    sobrantes = cantidad - MAX_ENTRADAS
+
+    if sobrantes > 0:
+        conexion.execute("DELETE FROM resultados WHERE clave IN "
+                         "(SELECT clave FROM resultados ORDER BY ultimo_acceso ASC LIMIT ?)",
+                         (sobrantes,))
+
+
+def _contar_insercion(conexion):
+    """
+    Cuenta una inserción y cada INSERCIONES_POR_DESALOJO llama a _desalojar.
+    """
+    global _inserciones_sin_desalojo
+
+    _inserciones_sin_desalojo += 1
+    if _inserciones_sin_desalojo >= INSERCIONES_POR_DESALOJO:
+        _desalojar(conexion)
+        _inserciones_sin_desalojo = 0
+
+
+def _decodificar(valor):
+    """
+    Convierte el valor guardado en JSON al tipo que devuelve el método
+    (las tuplas se guardan como listas).
+    """
+    resultado = json.loads(valor)
+    if isinstance(resultado, list):
+        return tuple(resultado)
+    return resultado
+
+
+def memoizar_en_disco(version, cacheable=None):
+    """
+    Decorador que guarda en disco el resultado de un método de integración.
+
+    Parámetros:
+    - version: Versión del kernel. Al cambiarla se descartan los resultados viejos del método
+    - cacheable: Función opcional que recibe el diccionario de argumentos y devuelve
+      False cuando el resultado no es determinista (por ejemplo, partición aleatoria sin semilla)
+
+    La clave incluye el módulo, el método, el tipo de partición, N, la semilla y el dtype
+    (los argumentos que no existen en el método quedan como None / 'float64').
+    """
+    version = str(version)
+
+    def decorador(funcion_original):
+        firma = inspect.signature(funcion_original)
+        metodo = funcion_original.__qualname__
+
+        @functools.wraps(funcion_original)
+        def envoltura(*args, **kwargs):
+            if not cache_habilitada():
+                _contadores['calculos'] += 1
+                return funcion_original(*args, **kwargs)
+
+            argumentos = firma.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            argumentos = dict(argumentos.arguments)
+
+            if cacheable is not None and not cacheable(argumentos):
+                _contadores['calculos'] += 1
+                return funcion_original(*args, **kwargs)
+
+            modulo_archivo = getattr(sys.modules.get(funcion_original.__module__), '__file__', None)
+            modulo = os.path.splitext(os.path.basename(modulo_archivo))[0] if modulo_archivo else funcion_original.__module__
+
+            clave = json.dumps({
+                'modulo': modulo,
+                'metodo': metodo,
+                'tipo_particion': argumentos.pop('tipo_particion', None),
+                'n': argumentos.pop('n', None),
+                'seed': argumentos.pop('seed', None),
+                'dtype': str(argumentos.pop('dtype', 'float64')),
+                'otros': argumentos,
+                'version': version,
+            }, sort_keys=True, default=repr)
+
+            conexion = _obtener_conexion()
+            _invalidar_versiones_viejas(conexion, modulo, metodo, version)
+
+            fila = conexion.execute("SELECT valor FROM resultados WHERE clave = ?", (clave,)).fetchone()
+            if fila is not None:
+                _accesos_pendientes[clave] = time.time()
+                if len(_accesos_pendientes) >= ACCESOS_POR_ESCRITURA:
+                    guardar_accesos()
+                _contadores['aciertos'] += 1
+                return _decodificar(fila[0])
+
+            _contadores['calculos'] += 1
+            resultado = funcion_original(*args, **kwargs)
+
+            conexion.execute("INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?, ?)",
+                             (clave, modulo, metodo, version, json.dumps(resultado), time.time()))
+            _contar_insercion(conexion)
+            conexion.commit()
+
+            return resultado
+
+        return envoltura
+
+    return decorador
+
+
+def limpiar_cache():
+    """
+    Elimina todas las entradas de la caché en disco.
+    """
+    conexion = _obtener_conexion()
+    _accesos_pendientes.clear()
+    conexion.execute("DELETE FROM resultados")
+    conexion.commit()
+    _versiones_verificadas.clear()
@@ -1,23 +1,33 @@
-from math import sqrt
 import math
 import csv
-import matplotlib.pyplot as plt
 import numpy as np
+from cache_resultados import memoizar_en_disco
+from barrido_paralelo import ejecutar_en_paralelo, ejecutar_grillas, leer_argumento_jobs
+from renderizado import figura, linea, crear_ejecutor_renderizado, enviar_figuras, esperar_figuras
+from integrandos import obtener_integrando, evaluar, puntos_de_giro, ruta_escalar_cacheable
+from resultados_columnares import guardar_barridos
 
 
-#funcion que estamos estudiando
-def funcion (x) :
-    result = 2 * (sqrt(1-(x**2)))
-    return result
-
 #Ejercicio 1.1
 
-def suma_inferior(n):
+@memoizar_en_disco(version=3, cacheable=ruta_escalar_cacheable)
+def suma_inferior(n, integrando='semicirculo', vectorizado=False):
     """
-    Para f(x) = 2*sqrt(1-x^2), el mínimo en cada subintervalo
-    está en el extremo más alejado de x=0.
+    Suma inferior de Darboux con n puntos equiespaciados en el dominio del integrando.
+    En cada tramo monótono de f el mínimo de un subintervalo está en uno de sus
+    extremos; si el subintervalo contiene un punto de giro (para el semicírculo,
+    x=0) también se lo tiene en cuenta.
+    Por defecto recorre los subintervalos con la versión escalar de f (el
+    cálculo de referencia); con vectorizado=True, si el integrando tiene
+    versión vectorizada, usa suma_inferior_vectorizada.
     """
-    a, b = -1, 1
+    integrando = obtener_integrando(integrando)
+    if vectorizado and integrando['vectorizada'] is not None:
+        return suma_inferior_vectorizada(n, integrando)
+    
+    f = integrando['escalar']
+    giros = puntos_de_giro(integrando)
+    a, b = integrando['dominio']
     dx = (b - a) / (n - 1)
     suma = 0
     
@@ -25,22 +35,29 @@ def suma_inferior(n):
         x_izq = a + i * dx
         x_der = a + (i + 1) * dx
         
-        # El mínimo está en el punto más alejado de 0
-        if abs(x_izq) > abs(x_der):
-            min_val = funcion(x_izq)
-        else:
-            min_val = funcion(x_der)
-        
-        suma += min_val * dx
+        # El mínimo está en un extremo o en un punto de giro interior
+        candidatos = [f(x_izq), f(x_der)] + [f(t) for t in giros if x_izq < t < x_der]
+        suma += min(candidatos) * dx
     
     return suma
 
-def suma_superior(n):
+@memoizar_en_disco(version=3, cacheable=ruta_escalar_cacheable)
+def suma_superior(n, integrando='semicirculo', vectorizado=False):
     """
-    Para f(x) = 2*sqrt(1-x^2), el máximo en cada subintervalo
-    está en el punto más cercano a x=0.
+    Suma superior de Darboux con n puntos equiespaciados en el dominio del integrando.
+    El máximo de cada subintervalo está en uno de sus extremos o, si lo contiene,
+    en un punto de giro (para el semicírculo, f(0) en el subintervalo que contiene a 0).
+    Por defecto recorre los subintervalos con la versión escalar de f (el
+    cálculo de referencia); con vectorizado=True, si el integrando tiene
+    versión vectorizada, usa suma_superior_vectorizada.
     """
-    a, b = -1, 1
+    integrando = obtener_integrando(integrando)
+    if vectorizado and integrando['vectorizada'] is not None:
+        return suma_superior_vectorizada(n, integrando)
+    
+    f = integrando['escalar']
+    giros = puntos_de_giro(integrando)
+    a, b = integrando['dominio']
     dx = (b - a) / (n - 1)
     suma = 0
     
@@ -48,22 +65,190 @@ def suma_superior(n):
         x_izq = a + i * dx
         x_der = a + (i + 1) * dx
         
-        # El máximo está en el punto más cercano a 0
-        # Si 0 está en el intervalo, ese es el máximo
-        if x_izq <= 0 <= x_der:
-            max_val = funcion(0)
-        elif abs(x_izq) < abs(x_der):
-            max_val = funcion(x_izq)
-        else:
-            max_val = funcion(x_der)
-        
-        suma += max_val * dx
+        # El máximo está en un extremo o en un punto de giro interior
+        candidatos = [f(x_izq), f(x_der)] + [f(t) for t in giros if x_izq < t < x_der]
+        suma += max(candidatos) * dx
     
     return suma
 
+#Versión vectorizada (NumPy) de las sumas de Darboux
+
+def nodos_particion(n, dominio=(-1.0, 1.0)):
+    """
+    Construye una sola vez la grilla de n nodos equiespaciados en el dominio
+    (por defecto [-1, 1]), con la misma fórmula a + i*dx que usan suma_inferior
+    y suma_superior.
+
+    Retorna:
+    - (nodos, dx)
+    """
+    a, b = dominio
+    dx = (b - a) / (n - 1)
+    nodos = a + np.arange(n, dtype=np.float64) * dx
+    return nodos, dx
+
+def _extremos_subintervalos(nodos, valores, integrando):
+    """
+    Mínimo y máximo de f en cada subintervalo [x_i, x_i+1]. Dentro de un tramo
+    monótono son los valores en los extremos; en los subintervalos que contienen
+    un punto de giro se compara además con f en ese punto.
+
+    Retorna:
+    - (minimos, maximos), arreglos de largo n - 1
+    """
+    minimos = np.minimum(valores[:-1], valores[1:])
+    maximos = np.maximum(valores[:-1], valores[1:])
+    
+    for t in puntos_de_giro(integrando):
+        k = int(np.searchsorted(nodos, t, side='right')) - 1
+        if 0 <= k < len(nodos) - 1 and nodos[k] != t:
+            f_t = integrando['escalar'](t)
+            minimos[k] = min(minimos[k], f_t)
+            maximos[k] = max(maximos[k], f_t)
+    
+    return minimos, maximos
+
+def suma_inferior_vectorizada(n, integrando='semicirculo'):
+    """
+    Igual que suma_inferior pero con arreglos: se evalúa f en todos los nodos
+    y el mínimo de cada subintervalo es el menor de sus dos extremos (o f en
+    el punto de giro que contenga).
+    """
+    integrando = obtener_integrando(integrando)
+    nodos, dx = nodos_particion(n, integrando['dominio'])
+    minimos, _ = _extremos_subintervalos(nodos, evaluar(integrando, nodos), integrando)
+    return float(minimos.sum() * dx)
+
+def suma_superior_vectorizada(n, integrando='semicirculo'):
+    """
+    Igual que suma_superior pero con arreglos: el máximo de cada subintervalo
+    es el mayor de sus extremos, salvo en los subintervalos que contienen un
+    punto de giro (para el semicírculo, el que contiene a 0, donde es f(0)).
+    """
+    integrando = obtener_integrando(integrando)
+    nodos, dx = nodos_particion(n, integrando['dominio'])
+    _, maximos = _extremos_subintervalos(nodos, evaluar(integrando, nodos), integrando)
+    return float(maximos.sum() * dx)
+
+def _oscilacion_telescopica(nodos, valores, integrando):
+    """
+    Suma de (máximo - mínimo) sobre todos los subintervalos, en O(puntos de giro).
+    
+    Entre dos puntos de giro f es monótona, así que las oscilaciones de los
+    subintervalos de ese tramo telescopan a |f(último nodo) - f(primer nodo)|.
+    Solo los subintervalos que contienen un punto de giro se suman aparte.
+    """
+    f = integrando['escalar']
+    interiores = {}  # subintervalo k -> valores de f en los puntos de giro dentro de (x_k, x_k+1)
+    cortes = set()   # índices de los nodos donde termina un tramo
+    
+    for t in puntos_de_giro(integrando):
+        k = int(np.searchsorted(nodos, t, side='right')) - 1
+        if nodos[k] == t:
+            cortes.add(k)
+        elif 0 <= k < len(nodos) - 1:
+            interiores.setdefault(k, []).append(f(t))
+    
+    total = 0.0
+    inicio = 0
+    for k in sorted(cortes | set(interiores)):
+        total += abs(valores[k] - valores[inicio])
+        inicio = k
+        if k in interiores:
+            candidatos = [valores[k], valores[k + 1]] + interiores[k]
+            total += max(candidatos) - min(candidatos)
+            inicio = k + 1
+    
+    return total + abs(valores[-1] - valores[inicio])
+
+def sumas_darboux(n, integrando='semicirculo'):
+    """
+    Calcula en una sola pasada la suma inferior, la superior y su diferencia.
+    Cada nodo se evalúa una única vez.
+
+    En cada tramo monótono de f la diferencia entre máximo y mínimo de los
+    subintervalos telescopa (ver _oscilacion_telescopica), así que una vez
+    conocida la suma inferior la superior cuesta O(1) por punto de giro. Para
+    el semicírculo:
+    - Si 0 es un nodo: diferencia = dx * (2*f(0) - f(-1) - f(1))
+    - Si 0 cae dentro de [x_k, x_k+1]: diferencia = dx * (f(0) + max(f(x_k), f(x_k+1)) - f(-1) - f(1))
+
+    Parámetros:
+    - n: Cantidad de puntos de la partición
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+
+    Retorna:
+    - (suma_inferior, suma_superior, diferencia)
+    """
+    integrando = obtener_integrando(integrando)
+    nodos, dx = nodos_particion(n, integrando['dominio'])
+    valores = evaluar(integrando, nodos)
+    minimos, _ = _extremos_subintervalos(nodos, valores, integrando)
+    inferior = float(minimos.sum() * dx)
+    diferencia = dx * _oscilacion_telescopica(nodos, valores, integrando)
+
+    return inferior, float(inferior + diferencia), float(diferencia)
+
 #Ejercicio 1.2
 
-def generar_tabla_individual(n_inicio, n_fin, incremento, numero_tabla):
+def _armar_barrido(n_inicio, n_fin, incremento, filas, tiempos):
+    """
+    Arma el diccionario del barrido a partir de los resultados de sumas_darboux
+    y de los segundos que tardó cada fila.
+    """
+    valor_pi = math.pi
+    barrido = {'n_inicio': n_inicio, 'n_fin': n_fin, 'incremento': incremento,
+               'n': [], 'inferior': [], 'superior': [], 'residuo_inf': [], 'residuo_sup': [],
+               'tiempo': list(tiempos)}
+    
+    for n, (inf, sup, _) in zip(range(n_inicio, n_fin + 1, incremento), filas):
+        barrido['n'].append(n)
+        barrido['inferior'].append(inf)
+        barrido['superior'].append(sup)
+        barrido['residuo_inf'].append(abs(inf - valor_pi))
+        barrido['residuo_sup'].append(abs(sup - valor_pi))
+    
+    return barrido
+
+def calcular_barrido(n_inicio, n_fin, incremento, jobs=1):
+    """
+    Calcula una sola vez las sumas inferior y superior para cada N del rango.
+    El resultado lo leen la tabla por consola, el CSV y las gráficas,
+    así no se vuelve a integrar lo mismo tres veces.
+    
+    Parámetros:
+    - n_inicio: Valor inicial de N
+    - n_fin: Valor final de N
+    - incremento: Paso entre valores consecutivos de N
+    - jobs: Cantidad de procesos para calcular las filas (por defecto 1)
+    
+    Retorna:
+    - Diccionario con las listas 'n', 'inferior', 'superior', 'residuo_inf',
+      'residuo_sup' y 'tiempo' (segundos de cada fila)
+    """
+    n_valores = list(range(n_inicio, n_fin + 1, incremento))
+    filas, tiempos = ejecutar_en_paralelo(sumas_darboux, n_valores, jobs, costo=lambda n: n, cronometrar=True)
+    return _armar_barrido(n_inicio, n_fin, incremento, filas, tiempos)
+
+def calcular_barridos(jobs=1):
+    """
+    Calcula los barridos de las tres tablas (10 a 100, 100 a 1000 y 1000 a 10000).
+    Con jobs > 1 las filas de las tres tablas se reparten en un único pool de
+    procesos, empezando por los N más grandes.
+    
+    Parámetros:
+    - jobs: Cantidad de procesos (por defecto 1)
+    
+    Retorna:
+    - Lista con los tres barridos, en el orden de las tablas
+    """
+    rangos = [(10, 100, 10), (100, 1000, 100), (1000, 10000, 1000)]
+    grillas = [list(range(n_inicio, n_fin + 1, incremento)) for n_inicio, n_fin, incremento in rangos]
+    filas, tiempos = ejecutar_grillas(sumas_darboux, grillas, jobs, costo=lambda n: n, cronometrar=True)
+    return [_armar_barrido(*rango, filas_rango, tiempos_rango)
+            for rango, filas_rango, tiempos_rango in zip(rangos, filas, tiempos)]
+
+def generar_tabla_individual(n_inicio, n_fin, incremento, numero_tabla, barrido=None):
     """
     Genera una tabla comparativa individual para un rango específico de N.
     
@@ -72,8 +257,10 @@ def generar_tabla_individual(n_inicio, n_fin, incremento, numero_tabla):
     - n_fin: Valor final de N (se sumará el incremento para incluirlo)
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para el título
+    - barrido: Resultado de calcular_barrido ya calculado (si es None se calcula)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido(n_inicio, n_fin, incremento)
     
     print("\n" + "=" * 90)
     print(f"TABLA {numero_tabla}: N variando de {n_inicio} a {n_fin} (incremento de {incremento})")
@@ -81,33 +268,36 @@ def generar_tabla_individual(n_inicio, n_fin, incremento, numero_tabla):
     print(f"{'N':>6} | {'Suma Inferior':>15} | {'Residuo Inf':>15} | {'Suma Superior':>15} | {'Residuo Sup':>15}")
     print("-" * 90)
     
-    for n in range(n_inicio, n_fin + 1, incremento):
-        inf = suma_inferior(n)
-        sup = suma_superior(n)
-        residuo_inf = abs(inf - valor_pi)
-        residuo_sup = abs(sup - valor_pi)
+    for n, inf, residuo_inf, sup, residuo_sup in zip(barrido['n'], barrido['inferior'], barrido['residuo_inf'],
+                                                      barrido['superior'], barrido['residuo_sup']):
         print(f"{n:6d} | {inf:15.10f} | {residuo_inf:15.10f} | {sup:15.10f} | {residuo_sup:15.10f}")
 
-def generar_tablas_comparativas():
+def generar_tablas_comparativas(barridos=None):
     """
     Genera tres tablas comparativas variando el tamaño de la partición.
     Muestra la aproximación y el residuo para ambas sumas.
+    
+    Parámetros:
+    - barridos: Resultado de calcular_barridos (si es None se calcula)
     """
+    if barridos is None:
+        barridos = calcular_barridos()
+    
     # Tabla 1: N de 10 a 100, variando de 10 en 10
-    generar_tabla_individual(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1)
+    generar_tabla_individual(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, barrido=barridos[0])
     
     # Tabla 2: N de 100 a 1000, variando de 100 en 100
-    generar_tabla_individual(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2)
+    generar_tabla_individual(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, barrido=barridos[1])
     
     # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-    generar_tabla_individual(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3)
+    generar_tabla_individual(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, barrido=barridos[2])
     
     # Mostrar valor de referencia de π
     print("\n" + "=" * 90)
     print(f"Valor de π (referencia): {math.pi:.10f}")
     print("=" * 90)
 
-def generar_tabla_individual_csv(archivo_csv, n_inicio, n_fin, incremento, numero_tabla):
+def generar_tabla_individual_csv(archivo_csv, n_inicio, n_fin, incremento, numero_tabla, barrido=None):
     """
     Genera una tabla comparativa individual y la escribe en un archivo CSV.
     
@@ -117,29 +307,32 @@ def generar_tabla_individual_csv(archivo_csv, n_inicio, n_fin, incremento, numer
     - n_fin: Valor final de N
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para identificación
+    - barrido: Resultado de calcular_barrido ya calculado (si es None se calcula)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido(n_inicio, n_fin, incremento)
     
     # Escribir encabezado de la tabla
     archivo_csv.writerow([])  # Línea en blanco
     archivo_csv.writerow([f"TABLA {numero_tabla}: N variando de {n_inicio} a {n_fin} (incremento de {incremento})"])
     archivo_csv.writerow(['N', 'Suma Inferior', 'Residuo Inf', 'Suma Superior', 'Residuo Sup'])
     
-    # Calcular y escribir los datos
-    for n in range(n_inicio, n_fin + 1, incremento):
-        inf = suma_inferior(n)
-        sup = suma_superior(n)
-        residuo_inf = abs(inf - valor_pi)
-        residuo_sup = abs(sup - valor_pi)
+    # Escribir los datos
+    for n, inf, residuo_inf, sup, residuo_sup in zip(barrido['n'], barrido['inferior'], barrido['residuo_inf'],
+                                                      barrido['superior'], barrido['residuo_sup']):
         archivo_csv.writerow([n, inf, residuo_inf, sup, residuo_sup])
 
-def generar_tablas_csv(nombre_archivo='tablas_comparativas.csv'):
+def generar_tablas_csv(nombre_archivo='tablas_comparativas.csv', barridos=None):
     """
     Genera un archivo CSV con las tres tablas comparativas.
     
     Parámetros:
     - nombre_archivo: Nombre del archivo CSV a crear (por defecto 'tablas_comparativas.csv')
+    - barridos: Resultado de calcular_barridos (si es None se calcula)
     """
+    if barridos is None:
+        barridos = calcular_barridos()
+    
     with open(nombre_archivo, 'w', newline='', encoding='utf-8') as archivo:
         writer = csv.writer(archivo)
         
@@ -148,110 +341,106 @@ def generar_tablas_csv(nombre_archivo='tablas_comparativas.csv'):
         writer.writerow([f'Valor de π (referencia): {math.pi:.10f}'])
         
         # Tabla 1: N de 10 a 100, variando de 10 en 10
-        generar_tabla_individual_csv(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1)
+        generar_tabla_individual_csv(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, barrido=barridos[0])
         
         # Tabla 2: N de 100 a 1000, variando de 100 en 100
-        generar_tabla_individual_csv(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2)
+        generar_tabla_individual_csv(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, barrido=barridos[1])
         
         # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-        generar_tabla_individual_csv(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3)
+        generar_tabla_individual_csv(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, barrido=barridos[2])
     
     print(f"\n✓ Archivo CSV generado: {nombre_archivo}")
 
+def generar_tablas_columnares(directorio='tablas_comparativas_columnas', barridos=None):
+    """
+    Escribe las tres tablas en formato columnar: un .npy por columna (N, método,
+    estimación, residuo, tiempo...) con los valores en precisión completa, que
+    se abren con resultados_columnares.leer_columnas sin parsear texto.
+    
+    Parámetros:
+    - directorio: Directorio de salida (por defecto 'tablas_comparativas_columnas')
+    - barridos: Resultado de calcular_barridos (si es None se calcula)
+    """
+    if barridos is None:
+        barridos = calcular_barridos()
+    
+    guardar_barridos(directorio, barridos,
+                     {'suma_inferior': ('inferior', 'residuo_inf', None),
+                      'suma_superior': ('superior', 'residuo_sup', None)},
+                     {'descripcion': 'Sumas de Darboux de f(x) = 2√(1-x²) en [-1, 1]', 'valor_exacto': math.pi})
+    
+    print(f"\n✓ Resultados columnares generados: {directorio}")
+
 #Ejercicio 1.3
 
-def graficar_convergencia():
+def graficar_convergencia(barridos=None, ejecutor=None, esperar=True):
     """
     Genera gráficas mostrando la convergencia de las sumas inferior y superior hacia π.
     Crea tres gráficas separadas, una para cada rango de N.
+    
+    Las gráficas se describen con especificaciones (ver renderizado.py) y se
+    dibujan con el lienzo Agg, en paralelo si se pasa un ejecutor.
+    
+    Parámetros:
+    - barridos: Resultado de calcular_barridos (si es None se calcula)
+    - ejecutor: Pool de crear_ejecutor_renderizado para dibujar en paralelo (opcional)
+    - esperar: Si es False no espera a que se terminen de dibujar (ver esperar_figuras)
+    
+    Retorna:
+    - Lista de figuras pendientes (ver enviar_figuras)
     """
     valor_pi = math.pi
     
-    # Configuración general de estilo
-    plt.style.use('seaborn-v0_8-darkgrid')
-    
-    # Gráfica 1: N de 10 a 100
-    n_valores_1 = list(range(10, 101, 10))
-    suma_inf_1 = [suma_inferior(n) for n in n_valores_1]
-    suma_sup_1 = [suma_superior(n) for n in n_valores_1]
-    pi_valores_1 = [valor_pi] * len(n_valores_1)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_1, suma_inf_1, 'b-o', label='Suma Inferior', linewidth=2, markersize=6)
-    plt.plot(n_valores_1, suma_sup_1, 'r-s', label='Suma Superior', linewidth=2, markersize=6)
-    plt.plot(n_valores_1, pi_valores_1, 'g--', label='π (teórico)', linewidth=2)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de Sumas de Riemann hacia π\n(N = 10 a 100)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_convergencia_10_100.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_convergencia_10_100.png")
-    
-    # Gráfica 2: N de 100 a 1000
-    n_valores_2 = list(range(100, 1001, 100))
-    suma_inf_2 = [suma_inferior(n) for n in n_valores_2]
-    suma_sup_2 = [suma_superior(n) for n in n_valores_2]
-    pi_valores_2 = [valor_pi] * len(n_valores_2)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_2, suma_inf_2, 'b-o', label='Suma Inferior', linewidth=2, markersize=6)
-    plt.plot(n_valores_2, suma_sup_2, 'r-s', label='Suma Superior', linewidth=2, markersize=6)
-    plt.plot(n_valores_2, pi_valores_2, 'g--', label='π (teórico)', linewidth=2)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de Sumas de Riemann hacia π\n(N = 100 a 1000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_convergencia_100_1000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_convergencia_100_1000.png")
-    
-    # Gráfica 3: N de 1000 a 10000
-    n_valores_3 = list(range(1000, 10001, 1000))
-    suma_inf_3 = [suma_inferior(n) for n in n_valores_3]
-    suma_sup_3 = [suma_superior(n) for n in n_valores_3]
-    pi_valores_3 = [valor_pi] * len(n_valores_3)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_3, suma_inf_3, 'b-o', label='Suma Inferior', linewidth=2, markersize=6)
-    plt.plot(n_valores_3, suma_sup_3, 'r-s', label='Suma Superior', linewidth=2, markersize=6)
-    plt.plot(n_valores_3, pi_valores_3, 'g--', label='π (teórico)', linewidth=2)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de Sumas de Riemann hacia π\n(N = 1000 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_convergencia_1000_10000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_convergencia_1000_10000.png")
+    if barridos is None:
+        barridos = calcular_barridos()
+    
+    figuras = []
+    
+    # Gráficas 1 a 3: una por rango de N
+    rangos = ['N = 10 a 100', 'N = 100 a 1000', 'N = 1000 a 10000']
+    archivos = ['grafica_convergencia_10_100.png', 'grafica_convergencia_100_1000.png',
+                'grafica_convergencia_1000_10000.png']
+    
+    for barrido, rango, archivo in zip(barridos, rangos, archivos):
+        n_valores = barrido['n']
+        pi_valores = [valor_pi] * len(n_valores)
+        
+        figuras.append(figura(archivo, (10, 6), [
+            linea(n_valores, barrido['inferior'], 'b-o', label='Suma Inferior', linewidth=2, markersize=6),
+            linea(n_valores, barrido['superior'], 'r-s', label='Suma Superior', linewidth=2, markersize=6),
+            linea(n_valores, pi_valores, 'g--', label='π (teórico)', linewidth=2),
+        ], titulo=f'Convergencia de Sumas de Riemann hacia π\n({rango})',
+            xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+            leyenda={'fontsize': 10}, grilla={'alpha': 0.3}))
     
     # Gráfica combinada con todos los valores
-    n_valores_todos = n_valores_1 + n_valores_2 + n_valores_3
-    suma_inf_todos = suma_inf_1 + suma_inf_2 + suma_inf_3
-    suma_sup_todos = suma_sup_1 + suma_sup_2 + suma_sup_3
+    n_valores_todos = barridos[0]['n'] + barridos[1]['n'] + barridos[2]['n']
+    suma_inf_todos = barridos[0]['inferior'] + barridos[1]['inferior'] + barridos[2]['inferior']
+    suma_sup_todos = barridos[0]['superior'] + barridos[1]['superior'] + barridos[2]['superior']
     pi_valores_todos = [valor_pi] * len(n_valores_todos)
     
-    plt.figure(figsize=(12, 7))
-    plt.plot(n_valores_todos, suma_inf_todos, 'b-o', label='Suma Inferior', linewidth=2, markersize=4)
-    plt.plot(n_valores_todos, suma_sup_todos, 'r-s', label='Suma Superior', linewidth=2, markersize=4)
-    plt.plot(n_valores_todos, pi_valores_todos, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de Sumas de Riemann hacia π\n(Visión completa: N = 10 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_convergencia_completa.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_convergencia_completa.png")
+    figuras.append(figura('grafica_convergencia_completa.png', (12, 7), [
+        linea(n_valores_todos, suma_inf_todos, 'b-o', label='Suma Inferior', linewidth=2, markersize=4),
+        linea(n_valores_todos, suma_sup_todos, 'r-s', label='Suma Superior', linewidth=2, markersize=4),
+        linea(n_valores_todos, pi_valores_todos, 'g--', label='π (teórico)', linewidth=2.5),
+    ], titulo='Convergencia de Sumas de Riemann hacia π\n(Visión completa: N = 10 a 10000)',
+        xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+        leyenda={'fontsize': 11}, grilla={'alpha': 0.3}))
     
-    print("\n" + "=" * 70)
-    print("Todas las gráficas han sido generadas exitosamente")
-    print("=" * 70)
+    pendientes = enviar_figuras(figuras, ejecutor)
+    
+    if esperar:
+        esperar_figuras(pendientes)
+        print("\n" + "=" * 70)
+        print("Todas las gráficas han sido generadas exitosamente")
+        print("=" * 70)
+    
+    return pendientes
 
 # Prueba de las funciones
 if __name__ == "__main__":
+    jobs = leer_argumento_jobs("Ejercicio 1: sumas inferior y superior de Darboux")
+    
     print("Convergencia de sumas inferior y superior")
     print("=" * 50)
     
@@ -259,9 +448,7 @@ if __name__ == "__main__":
     n_valores = [10, 50, 100, 500, 1000]
     
     for n in n_valores:
-        inf = suma_inferior(n)
-        sup = suma_superior(n)
-        diferencia = sup - inf
+        inf, sup, diferencia = sumas_darboux(n)
         print(f"\nn = {n:4d}:")
         print(f"  Suma inferior:  {inf:.10f}")
         print(f"  Suma superior:  {sup:.10f}")
@@ -270,17 +457,36 @@ if __name__ == "__main__":
     # Ejercicio 1.2: Generar tablas comparativas
     print("\n\n")
     print("EJERCICIO 1.2: TABLAS COMPARATIVAS")
-    generar_tablas_comparativas()
+    # Los barridos se calculan una sola vez y los usan las tablas, el CSV y las gráficas
+    barridos = calcular_barridos(jobs)
+    
+    # Las gráficas se empiezan a dibujar en paralelo mientras se escriben las tablas
+    ejecutor = crear_ejecutor_renderizado(jobs)
+    graficas = graficar_convergencia(barridos, ejecutor, esperar=False)
+    
+    generar_tablas_comparativas(barridos)
     
     # Generar también archivo CSV con las tablas
     try:
-        generar_tablas_csv('tablas_comparativas.csv')
+        generar_tablas_csv('tablas_comparativas.csv', barridos)
     except PermissionError:
         print("\n⚠ No se pudo generar el archivo CSV (el archivo puede estar abierto en otro programa)")
     
+    # Y en formato columnar (un .npy por columna), para analizar los resultados sin parsear texto
+    try:
+        generar_tablas_columnares('tablas_comparativas_columnas', barridos)
+    except PermissionError:
+        print("\n⚠ No se pudieron generar los resultados columnares (sin permiso de escritura)")
+    
     # Ejercicio 1.3: Generar gráficas de convergencia
     print("\n\n")
     print("EJERCICIO 1.3: GRÁFICAS DE CONVERGENCIA")
     print("=" * 50)
-    graficar_convergencia()
+    esperar_figuras(graficas)
+    if ejecutor is not None:
+        ejecutor.shutdown()
+    
+    print("\n" + "=" * 70)
+    print("Todas las gráficas han sido generadas exitosamente")
+    print("=" * 70)
 
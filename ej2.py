@@ -1,31 +1,28 @@
 import math
 import random
 import csv
-import matplotlib.pyplot as plt
 import numpy as np
-
-# Función que estamos estudiando
-def funcion(x):
-    """
-    Calcula f(x) = 2 * sqrt(1 - x^2)
-    Esta función representa un semicírculo de radio 1.
-    """
-    result = 2 * (math.sqrt(1 - (x**2)))
-    return result
+from cache_resultados import memoizar_en_disco
+from barrido_paralelo import ejecutar_en_paralelo, ejecutar_grillas, leer_argumento_jobs
+from integrandos import obtener_integrando, evaluar, integrando_cacheable
+from resultados_columnares import guardar_barridos
+from renderizado import (figura, linea, rectangulos, diezmar_rectangulos, crear_ejecutor_renderizado,
+                         enviar_figuras, esperar_figuras)
 
 # ============================================================================
 # EJERCICIO 2.1: Funciones para generar particiones
 # ============================================================================
 
-def particion_equiespaciada(n):
+def particion_equiespaciada(n, dominio=(-1.0, 1.0)):
     """
-    Genera una partición equiespaciada del intervalo [-1, 1].
+    Genera una partición equiespaciada del intervalo [-1, 1] (o del dominio indicado).
     
     Parámetros:
     - n: Cantidad de puntos de la partición (incluyendo los extremos)
+    - dominio: Intervalo (a, b) a particionar (por defecto [-1, 1])
     
     Retorna:
-    - Lista ordenada de n puntos equiespaciados en [-1, 1]
+    - Lista ordenada de n puntos equiespaciados en [a, b]
     
     Ejemplo:
     - n=5 genera: [-1.0, -0.5, 0.0, 0.5, 1.0]
@@ -33,26 +30,29 @@ def particion_equiespaciada(n):
     if n < 2:
         raise ValueError("n debe ser al menos 2 para incluir los extremos")
     
-    # El paso entre puntos consecutivos
-    delta_x = 2.0 / (n - 1)  # 2.0 porque el intervalo tiene longitud 2 (de -1 a 1)
+    a, b = dominio
+    
+    # El paso entre puntos consecutivos (2.0 / (n - 1) en [-1, 1])
+    delta_x = (b - a) / (n - 1)
     
     # Generar los puntos
-    particion = [-1.0 + i * delta_x for i in range(n)]
+    particion = [a + i * delta_x for i in range(n)]
     
     return particion
 
 
-def particion_aleatoria_uniforme(n):
+def particion_aleatoria_uniforme(n, dominio=(-1.0, 1.0)):
     """
-    Genera una partición aleatoria uniforme del intervalo [-1, 1].
+    Genera una partición aleatoria uniforme del intervalo [-1, 1] (o del dominio indicado).
     Los puntos se generan aleatoriamente y luego se ordenan.
-    Siempre incluye los extremos -1 y 1.
+    Siempre incluye los extremos (-1 y 1 por defecto).
     
     Parámetros:
     - n: Cantidad de puntos de la partición (incluyendo los extremos)
+    - dominio: Intervalo (a, b) a particionar (por defecto [-1, 1])
     
     Retorna:
-    - Lista ordenada de n puntos aleatorios en [-1, 1]
+    - Lista ordenada de n puntos aleatorios en [a, b]
     
     Nota:
     - Usa random.uniform() para generar números reales uniformemente distribuidos
@@ -60,23 +60,27 @@ def particion_aleatoria_uniforme(n):
     if n < 2:
         raise ValueError("n debe ser al menos 2 para incluir los extremos")
     
+    a, b = dominio
+    
     # Generar n-2 puntos aleatorios en el interior del intervalo
-    puntos_interiores = [random.uniform(-1.0, 1.0) for _ in range(n - 2)]
+    puntos_interiores = [random.uniform(a, b) for _ in range(n - 2)]
     
     # Agregar los extremos y ordenar
-    particion = [-1.0] + puntos_interiores + [1.0]
+    particion = [a] + puntos_interiores + [b]
     particion.sort()
     
     return particion
 
 
-def particion_coseno(n):
+def particion_coseno(n, dominio=(-1.0, 1.0)):
     """
     Genera una partición usando la función coseno: xi = cos(i*π/N).
     Esta partición tiene más puntos concentrados cerca de los extremos.
     
     Parámetros:
     - n: Cantidad de puntos de la partición (tamaño N)
+    - dominio: Intervalo (a, b) a particionar (por defecto [-1, 1]); los puntos
+      se trasladan como m + h*cos(i*π/N), con m el centro y h el semiancho
     
     Retorna:
     - Lista ordenada de n puntos generados con xi = cos(i*π/N) para i = 0, 1, ..., n-1
@@ -88,8 +92,11 @@ def particion_coseno(n):
     if n < 1:
         raise ValueError("n debe ser al menos 1")
     
+    a, b = dominio
+    centro, semiancho = (a + b) / 2.0, (b - a) / 2.0
+    
     # Generar los puntos usando la fórmula xi = cos(i*π/N)
-    particion = [math.cos(i * math.pi / n) for i in range(n + 1)]
+    particion = [centro + semiancho * math.cos(i * math.pi / n) for i in range(n + 1)]
     
     # Ordenar de menor a mayor (cos genera puntos en orden decreciente)
     particion.sort()
@@ -137,17 +144,52 @@ def mostrar_particiones_ejemplo(n=10):
 # EJERCICIO 2.2: Cálculo de aproximaciones usando diferentes particiones
 # ============================================================================
 
-def calcular_suma_riemann(particion):
+# Los puntos medios a menos de esta fracción del semiancho del dominio de un punto
+# singular no se evalúan (altura 0). Para el semicírculo equivale a |x| < 0.9999.
+MARGEN_SINGULAR = 1e-4
+
+
+def _evaluable(x, integrando):
+    """
+    Indica si f se evalúa en x: dentro del dominio y lejos de los puntos singulares.
+    """
+    a, b = integrando['dominio']
+    margen = MARGEN_SINGULAR * (b - a) / 2.0
+    return a <= x <= b and all(abs(x - p) > margen for p in integrando['puntos_singulares'])
+
+
+def calcular_suma_riemann(particion, integrando='semicirculo'):
     """
     Calcula la suma de Riemann para una partición dada.
     Usa el punto medio de cada subintervalo para evaluar la función.
+    Si el integrando tiene versión vectorizada, todos los puntos medios se
+    evalúan con una sola llamada.
     
     Parámetros:
     - particion: Lista ordenada de puntos que definen la partición
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
     
     Retorna:
     - Valor aproximado de la integral (aproximación de π)
     """
+    integrando = obtener_integrando(integrando)
+    
+    if integrando['vectorizada'] is not None:
+        nodos = np.asarray(particion, dtype=np.float64)
+        x_medio = (nodos[:-1] + nodos[1:]) / 2.0
+        
+        # Misma regla que _evaluable, para todos los puntos medios a la vez
+        a, b = integrando['dominio']
+        margen = MARGEN_SINGULAR * (b - a) / 2.0
+        validos = (x_medio >= a) & (x_medio <= b)
+        for p in integrando['puntos_singulares']:
+            validos &= np.abs(x_medio - p) > margen
+        
+        altura = np.zeros_like(x_medio)
+        altura[validos] = evaluar(integrando, x_medio[validos])
+        return float(np.sum(altura * np.diff(nodos)))
+    
+    f = integrando['escalar']
     suma = 0.0
     
     # Para cada subintervalo [x_i, x_{i+1}]
@@ -162,10 +204,10 @@ def calcular_suma_riemann(particion):
         x_medio = (x_izq + x_der) / 2.0
         
         # Evaluar la función en el punto medio (evitando valores fuera del dominio)
-        if -1.0 <= x_medio <= 1.0 and abs(x_medio) < 0.9999:
-            altura = funcion(x_medio)
+        if _evaluable(x_medio, integrando):
+            altura = f(x_medio)
         else:
-            # Si estamos muy cerca de los extremos, usar 0
+            # Si estamos muy cerca de una singularidad, usar 0
             altura = 0.0
         
         # Área del rectángulo
@@ -174,34 +216,115 @@ def calcular_suma_riemann(particion):
     return suma
 
 
-def aproximar_pi_con_particion(n, tipo_particion):
+# La partición aleatoria no es determinista, así que no se guarda en la caché
+@memoizar_en_disco(version=2, cacheable=lambda argumentos: (argumentos['tipo_particion'] != 'aleatoria'
+                                                            and integrando_cacheable(argumentos)))
+def aproximar_pi_con_particion(n, tipo_particion, integrando='semicirculo'):
     """
-    Aproxima el valor de π usando una partición específica.
+    Aproxima el valor de π (o la integral del integrando indicado) usando una
+    partición específica de su dominio.
     
     Parámetros:
     - n: Cantidad de puntos de la partición
     - tipo_particion: 'equiespaciada', 'aleatoria', o 'coseno'
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
     
     Retorna:
     - Aproximación de π usando la partición especificada
     """
+    integrando = obtener_integrando(integrando)
+    dominio = integrando['dominio']
+    
     # Generar la partición según el tipo
     if tipo_particion == 'equiespaciada':
-        particion = particion_equiespaciada(n)
+        particion = particion_equiespaciada(n, dominio)
     elif tipo_particion == 'aleatoria':
-        particion = particion_aleatoria_uniforme(n)
+        particion = particion_aleatoria_uniforme(n, dominio)
     elif tipo_particion == 'coseno':
-        particion = particion_coseno(n)
+        particion = particion_coseno(n, dominio)
     else:
         raise ValueError(f"Tipo de partición desconocido: {tipo_particion}")
     
     # Calcular la suma de Riemann
-    aproximacion = calcular_suma_riemann(particion)
+    aproximacion = calcular_suma_riemann(particion, integrando)
     
     return aproximacion
 
 
-def generar_tabla_comparativa_particiones(n_inicio, n_fin, incremento, numero_tabla):
+def _fila_particiones(n):
+    """
+    Aproximaciones con las tres particiones para un N (una fila de la tabla).
+    Es una función de nivel de módulo para poder enviarla a otro proceso.
+    """
+    return (aproximar_pi_con_particion(n, 'equiespaciada'),
+            aproximar_pi_con_particion(n, 'aleatoria'),
+            aproximar_pi_con_particion(n, 'coseno'))
+
+
+def _armar_barrido_particiones(n_inicio, n_fin, incremento, filas, tiempos):
+    """
+    Arma el diccionario del barrido a partir de las filas calculadas y de los
+    segundos que tardó cada una.
+    """
+    valor_pi = math.pi
+    barrido = {'n_inicio': n_inicio, 'n_fin': n_fin, 'incremento': incremento,
+               'n': [], 'equiespaciada': [], 'aleatoria': [], 'coseno': [],
+               'residuo_equi': [], 'residuo_alea': [], 'residuo_cos': [], 'tiempo': list(tiempos)}
+    
+    for n, (aprox_equi, aprox_alea, aprox_cos) in zip(range(n_inicio, n_fin + 1, incremento), filas):
+        barrido['n'].append(n)
+        barrido['equiespaciada'].append(aprox_equi)
+        barrido['aleatoria'].append(aprox_alea)
+        barrido['coseno'].append(aprox_cos)
+        barrido['residuo_equi'].append(abs(aprox_equi - valor_pi))
+        barrido['residuo_alea'].append(abs(aprox_alea - valor_pi))
+        barrido['residuo_cos'].append(abs(aprox_cos - valor_pi))
+    
+    return barrido
+
+
+def calcular_barrido_particiones(n_inicio, n_fin, incremento, jobs=1):
+    """
+    Calcula una sola vez las aproximaciones con las tres particiones para cada N
+    del rango. El resultado lo leen la tabla por consola, el CSV y las gráficas,
+    así no se vuelve a integrar lo mismo tres veces.
+    
+    Parámetros:
+    - n_inicio: Valor inicial de N
+    - n_fin: Valor final de N
+    - incremento: Paso entre valores consecutivos de N
+    - jobs: Cantidad de procesos para calcular las filas (por defecto 1)
+    
+    Retorna:
+    - Diccionario con las listas 'n', 'equiespaciada', 'aleatoria', 'coseno'
+      y sus residuos ('residuo_equi', 'residuo_alea', 'residuo_cos'), más
+      'tiempo' (segundos de cada fila)
+    """
+    n_valores = list(range(n_inicio, n_fin + 1, incremento))
+    filas, tiempos = ejecutar_en_paralelo(_fila_particiones, n_valores, jobs, costo=lambda n: n, cronometrar=True)
+    return _armar_barrido_particiones(n_inicio, n_fin, incremento, filas, tiempos)
+
+
+def calcular_barridos_particiones(jobs=1):
+    """
+    Calcula los barridos de las tres tablas (10 a 100, 100 a 1000 y 1000 a 10000).
+    Con jobs > 1 las filas de las tres tablas se reparten en un único pool de
+    procesos, empezando por los N más grandes.
+    
+    Parámetros:
+    - jobs: Cantidad de procesos (por defecto 1)
+    
+    Retorna:
+    - Lista con los tres barridos, en el orden de las tablas
+    """
+    rangos = [(10, 100, 10), (100, 1000, 100), (1000, 10000, 1000)]
+    grillas = [list(range(n_inicio, n_fin + 1, incremento)) for n_inicio, n_fin, incremento in rangos]
+    filas, tiempos = ejecutar_grillas(_fila_particiones, grillas, jobs, costo=lambda n: n, cronometrar=True)
+    return [_armar_barrido_particiones(*rango, filas_rango, tiempos_rango)
+            for rango, filas_rango, tiempos_rango in zip(rangos, filas, tiempos)]
+
+
+def generar_tabla_comparativa_particiones(n_inicio, n_fin, incremento, numero_tabla, barrido=None):
     """
     Genera una tabla comparativa de las tres particiones para un rango de N.
     
@@ -210,8 +333,10 @@ def generar_tabla_comparativa_particiones(n_inicio, n_fin, incremento, numero_ta
     - n_fin: Valor final de N
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para el título
+    - barrido: Resultado de calcular_barrido_particiones (si es None se calcula)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido_particiones(n_inicio, n_fin, incremento)
     
     print("\n" + "=" * 110)
     print(f"TABLA {numero_tabla}: Comparación de particiones - N variando de {n_inicio} a {n_fin} (incremento de {incremento})")
@@ -219,32 +344,32 @@ def generar_tabla_comparativa_particiones(n_inicio, n_fin, incremento, numero_ta
     print(f"{'N':>6} | {'Equiespaciada':>15} | {'Residuo':>12} | {'Aleatoria':>15} | {'Residuo':>12} | {'Coseno':>15} | {'Residuo':>12}")
     print("-" * 110)
     
-    for n in range(n_inicio, n_fin + 1, incremento):
-        # Calcular aproximaciones con cada tipo de partición
-        aprox_equi = aproximar_pi_con_particion(n, 'equiespaciada')
-        aprox_alea = aproximar_pi_con_particion(n, 'aleatoria')
-        aprox_cos = aproximar_pi_con_particion(n, 'coseno')
-        
-        # Calcular residuos
-        residuo_equi = abs(aprox_equi - valor_pi)
-        residuo_alea = abs(aprox_alea - valor_pi)
-        residuo_cos = abs(aprox_cos - valor_pi)
+    for i, n in enumerate(barrido['n']):
+        aprox_equi, residuo_equi = barrido['equiespaciada'][i], barrido['residuo_equi'][i]
+        aprox_alea, residuo_alea = barrido['aleatoria'][i], barrido['residuo_alea'][i]
+        aprox_cos, residuo_cos = barrido['coseno'][i], barrido['residuo_cos'][i]
         
         print(f"{n:6d} | {aprox_equi:15.10f} | {residuo_equi:12.10f} | {aprox_alea:15.10f} | {residuo_alea:12.10f} | {aprox_cos:15.10f} | {residuo_cos:12.10f}")
 
 
-def generar_tablas_comparativas_particiones():
+def generar_tablas_comparativas_particiones(barridos=None):
     """
     Genera tres tablas comparativas de las particiones.
+    
+    Parámetros:
+    - barridos: Resultado de calcular_barridos_particiones (si es None se calcula)
     """
+    if barridos is None:
+        barridos = calcular_barridos_particiones()
+    
     # Tabla 1: N de 10 a 100, variando de 10 en 10
-    generar_tabla_comparativa_particiones(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1)
+    generar_tabla_comparativa_particiones(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, barrido=barridos[0])
     
     # Tabla 2: N de 100 a 1000, variando de 100 en 100
-    generar_tabla_comparativa_particiones(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2)
+    generar_tabla_comparativa_particiones(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, barrido=barridos[1])
     
     # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-    generar_tabla_comparativa_particiones(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3)
+    generar_tabla_comparativa_particiones(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, barrido=barridos[2])
     
     # Mostrar valor de referencia de π
     print("\n" + "=" * 110)
@@ -252,7 +377,7 @@ def generar_tablas_comparativas_particiones():
     print("=" * 110)
 
 
-def generar_tabla_individual_csv_particiones(archivo_csv, n_inicio, n_fin, incremento, numero_tabla):
+def generar_tabla_individual_csv_particiones(archivo_csv, n_inicio, n_fin, incremento, numero_tabla, barrido=None):
     """
     Genera una tabla comparativa de particiones y la escribe en un archivo CSV.
     
@@ -262,34 +387,34 @@ def generar_tabla_individual_csv_particiones(archivo_csv, n_inicio, n_fin, incre
     - n_fin: Valor final de N
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para identificación
+    - barrido: Resultado de calcular_barrido_particiones (si es None se calcula)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido_particiones(n_inicio, n_fin, incremento)
     
     # Escribir encabezado de la tabla
     archivo_csv.writerow([])  # Línea en blanco
     archivo_csv.writerow([f"TABLA {numero_tabla}: N variando de {n_inicio} a {n_fin} (incremento de {incremento})"])
     archivo_csv.writerow(['N', 'Equiespaciada', 'Residuo Equi', 'Aleatoria', 'Residuo Alea', 'Coseno', 'Residuo Cos'])
     
-    # Calcular y escribir los datos
-    for n in range(n_inicio, n_fin + 1, incremento):
-        aprox_equi = aproximar_pi_con_particion(n, 'equiespaciada')
-        aprox_alea = aproximar_pi_con_particion(n, 'aleatoria')
-        aprox_cos = aproximar_pi_con_particion(n, 'coseno')
-        
-        residuo_equi = abs(aprox_equi - valor_pi)
-        residuo_alea = abs(aprox_alea - valor_pi)
-        residuo_cos = abs(aprox_cos - valor_pi)
-        
-        archivo_csv.writerow([n, aprox_equi, residuo_equi, aprox_alea, residuo_alea, aprox_cos, residuo_cos])
+    # Escribir los datos
+    for i, n in enumerate(barrido['n']):
+        archivo_csv.writerow([n, barrido['equiespaciada'][i], barrido['residuo_equi'][i],
+                              barrido['aleatoria'][i], barrido['residuo_alea'][i],
+                              barrido['coseno'][i], barrido['residuo_cos'][i]])
 
 
-def generar_tablas_csv_particiones(nombre_archivo='tablas_particiones.csv'):
+def generar_tablas_csv_particiones(nombre_archivo='tablas_particiones.csv', barridos=None):
     """
     Genera un archivo CSV con las tres tablas comparativas de particiones.
     
     Parámetros:
     - nombre_archivo: Nombre del archivo CSV a crear
+    - barridos: Resultado de calcular_barridos_particiones (si es None se calcula)
     """
+    if barridos is None:
+        barridos = calcular_barridos_particiones()
+    
     with open(nombre_archivo, 'w', newline='', encoding='utf-8') as archivo:
         writer = csv.writer(archivo)
         
@@ -298,290 +423,315 @@ def generar_tablas_csv_particiones(nombre_archivo='tablas_particiones.csv'):
         writer.writerow([f'Valor de π (referencia): {math.pi:.10f}'])
         
         # Tabla 1: N de 10 a 100, variando de 10 en 10
-        generar_tabla_individual_csv_particiones(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1)
+        generar_tabla_individual_csv_particiones(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, barrido=barridos[0])
         
         # Tabla 2: N de 100 a 1000, variando de 100 en 100
-        generar_tabla_individual_csv_particiones(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2)
+        generar_tabla_individual_csv_particiones(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, barrido=barridos[1])
         
         # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-        generar_tabla_individual_csv_particiones(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3)
+        generar_tabla_individual_csv_particiones(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, barrido=barridos[2])
     
     print(f"\n✓ Archivo CSV generado: {nombre_archivo}")
 
 
+def generar_tablas_columnares_particiones(directorio='tablas_particiones_columnas', barridos=None):
+    """
+    Escribe las tres tablas de particiones en formato columnar (ver
+    resultados_columnares.py), con los valores en precisión completa y el
+    tiempo de cada fila.
+    
+    Parámetros:
+    - directorio: Directorio de salida
+    - barridos: Resultado de calcular_barridos_particiones (si es None se calcula)
+    """
+    if barridos is None:
+        barridos = calcular_barridos_particiones()
+    
+    guardar_barridos(directorio, barridos,
+                     {'equiespaciada': ('equiespaciada', 'residuo_equi', None),
+                      'aleatoria': ('aleatoria', 'residuo_alea', None),
+                      'coseno': ('coseno', 'residuo_cos', None)},
+                     {'descripcion': 'Sumas de Riemann de f(x) = 2√(1-x²) con distintas particiones',
+                      'valor_exacto': math.pi})
+    
+    print(f"\n✓ Resultados columnares generados: {directorio}")
+
+
+# ============================================================================
+# Integración de Clenshaw-Curtis sobre los nodos de particion_coseno
+# ============================================================================
+
+def _integral_clenshaw_curtis(valores):
+    """
+    Integra en [-1, 1] el interpolante de Chebyshev de los valores dados.
+    
+    Los valores son f(cos(j*π/n)) para j = 0, ..., n (el orden de particion_coseno
+    antes de ordenar). Los coeficientes de Chebyshev se obtienen con una DCT-I,
+    calculada como FFT de la extensión par de los valores, en O(n log n):
+    
+        f(x) ≈ Σ'' a_k T_k(x),   ∫ T_k = 2 / (1 - k^2) para k par (0 si k es impar)
+    
+    Parámetros:
+    - valores: Arreglo con los n+1 valores de la función en los nodos coseno
+    
+    Retorna:
+    - Aproximación de la integral
+    """
+    n = len(valores) - 1
+    
+    # Extensión par de largo 2n: f_0, ..., f_n, f_{n-1}, ..., f_1
+    extendido = np.concatenate([valores, valores[-2:0:-1]])
+    coeficientes = np.fft.rfft(extendido).real / n
+    
+    k = np.arange(0, n + 1, 2)
+    a = coeficientes[k]
+    a[0] /= 2.0
+    if n % 2 == 0:
+        a[-1] /= 2.0
+    
+    return float(np.sum(a * 2.0 / (1.0 - k * k)))
+
+
+def _trasladar_coseno(integrando):
+    """
+    Centro y semiancho del dominio: los nodos coseno de [-1, 1] se llevan al
+    dominio como m + h*x, y la integral se multiplica por h.
+    """
+    a, b = integrando['dominio']
+    return (a + b) / 2.0, (b - a) / 2.0
+
+
+def metodo_clenshaw_curtis(n, integrando='semicirculo'):
+    """
+    Cuadratura de Clenshaw-Curtis evaluando f exactamente en los nodos de
+    particion_coseno(n), xi = cos(i*π/N). En vez de la suma de Riemann de
+    punto medio (primer orden) integra el polinomio interpolante de Chebyshev.
+    
+    Parámetros:
+    - n: Tamaño N de la partición coseno (se usan n+1 nodos)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Aproximación de π usando Clenshaw-Curtis
+    """
+    if n < 1:
+        raise ValueError("n debe ser al menos 1")
+    
+    integrando = obtener_integrando(integrando)
+    centro, semiancho = _trasladar_coseno(integrando)
+    
+    nodos = np.cos(np.arange(n + 1) * math.pi / n)
+    return semiancho * _integral_clenshaw_curtis(evaluar(integrando, centro + semiancho * nodos))
+
+
+def refinar_clenshaw_curtis(n_inicial=2, niveles=10, integrando='semicirculo'):
+    """
+    Clenshaw-Curtis con duplicación anidada: los nodos cos(j*π/N) son los nodos
+    pares de la partición de tamaño 2N, así que al duplicar N solo se evalúa f
+    en los N nodos nuevos (los impares) y se reutilizan todos los anteriores.
+    
+    Parámetros:
+    - n_inicial: Tamaño N del primer nivel
+    - niveles: Cantidad de niveles a generar
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Genera:
+    - Tuplas (n, aproximacion, evaluaciones) para cada nivel, donde evaluaciones
+      es la cantidad acumulada de llamadas a la función
+    """
+    if n_inicial < 1:
+        raise ValueError("n_inicial debe ser al menos 1")
+    
+    integrando = obtener_integrando(integrando)
+    centro, semiancho = _trasladar_coseno(integrando)
+    
+    n = n_inicial
+    valores = evaluar(integrando, centro + semiancho * np.cos(np.arange(n + 1) * math.pi / n))
+    evaluaciones = n + 1
+    yield n, semiancho * _integral_clenshaw_curtis(valores), evaluaciones
+    
+    for _ in range(niveles - 1):
+        # Nodos nuevos: cos((2i+1)*π/(2N)) para i = 0, ..., N-1
+        nuevos = evaluar(integrando, centro + semiancho * np.cos((2 * np.arange(n) + 1) * math.pi / (2 * n)))
+        
+        combinados = np.empty(2 * n + 1)
+        combinados[0::2] = valores
+        combinados[1::2] = nuevos
+        
+        valores = combinados
+        evaluaciones += n
+        n = 2 * n
+        yield n, semiancho * _integral_clenshaw_curtis(valores), evaluaciones
+
+
 # ============================================================================
 # EJERCICIO 2.3: Gráficas de convergencia de las particiones
 # ============================================================================
 
-def graficar_convergencia_particiones():
+def _series_particiones(barrido, tamano_marcador):
+    """
+    Series de las tres particiones y la referencia π para un barrido.
+    """
+    n_valores = barrido['n']
+    return [
+        linea(n_valores, barrido['equiespaciada'], 'b-o', label='Equiespaciada', linewidth=2, markersize=tamano_marcador),
+        linea(n_valores, barrido['aleatoria'], 'r-s', label='Aleatoria', linewidth=2, markersize=tamano_marcador),
+        linea(n_valores, barrido['coseno'], 'm-^', label='Coseno', linewidth=2, markersize=tamano_marcador),
+        linea(n_valores, [math.pi] * len(n_valores), 'g--', label='π (teórico)', linewidth=2.5),
+    ]
+
+
+def graficar_convergencia_particiones(barridos=None, ejecutor=None, esperar=True):
     """
     Genera gráficas mostrando la convergencia de las tres particiones hacia π.
     Crea gráficas separadas para diferentes rangos de N.
+    
+    Las gráficas se describen con especificaciones (ver renderizado.py) y se
+    dibujan con el lienzo Agg, en paralelo si se pasa un ejecutor.
+    
+    Parámetros:
+    - barridos: Resultado de calcular_barridos_particiones (si es None se calcula)
+    - ejecutor: Pool de crear_ejecutor_renderizado para dibujar en paralelo (opcional)
+    - esperar: Si es False no espera a que se terminen de dibujar (ver esperar_figuras)
+    
+    Retorna:
+    - Lista de figuras pendientes (ver enviar_figuras)
     """
     valor_pi = math.pi
     
-    # Configuración general de estilo
-    plt.style.use('seaborn-v0_8-darkgrid')
+    if barridos is None:
+        barridos = calcular_barridos_particiones()
     
-    # Gráfica 1: N de 10 a 100, variando de 10 en 10
     print("\nGenerando gráficas de convergencia...")
-    n_valores_1 = list(range(10, 101, 10))
-    aprox_equi_1 = [aproximar_pi_con_particion(n, 'equiespaciada') for n in n_valores_1]
-    aprox_alea_1 = [aproximar_pi_con_particion(n, 'aleatoria') for n in n_valores_1]
-    aprox_cos_1 = [aproximar_pi_con_particion(n, 'coseno') for n in n_valores_1]
-    pi_valores_1 = [valor_pi] * len(n_valores_1)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_1, aprox_equi_1, 'b-o', label='Equiespaciada', linewidth=2, markersize=6)
-    plt.plot(n_valores_1, aprox_alea_1, 'r-s', label='Aleatoria', linewidth=2, markersize=6)
-    plt.plot(n_valores_1, aprox_cos_1, 'm-^', label='Coseno', linewidth=2, markersize=6)
-    plt.plot(n_valores_1, pi_valores_1, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de diferentes particiones hacia π\n(N = 10 a 100)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_particiones_10_100.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_particiones_10_100.png")
-    
-    # Gráfica 2: N de 100 a 1000, variando de 100 en 100
-    n_valores_2 = list(range(100, 1001, 100))
-    aprox_equi_2 = [aproximar_pi_con_particion(n, 'equiespaciada') for n in n_valores_2]
-    aprox_alea_2 = [aproximar_pi_con_particion(n, 'aleatoria') for n in n_valores_2]
-    aprox_cos_2 = [aproximar_pi_con_particion(n, 'coseno') for n in n_valores_2]
-    pi_valores_2 = [valor_pi] * len(n_valores_2)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_2, aprox_equi_2, 'b-o', label='Equiespaciada', linewidth=2, markersize=6)
-    plt.plot(n_valores_2, aprox_alea_2, 'r-s', label='Aleatoria', linewidth=2, markersize=6)
-    plt.plot(n_valores_2, aprox_cos_2, 'm-^', label='Coseno', linewidth=2, markersize=6)
-    plt.plot(n_valores_2, pi_valores_2, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de diferentes particiones hacia π\n(N = 100 a 1000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_particiones_100_1000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_particiones_100_1000.png")
-    
-    # Gráfica 3: N de 1000 a 10000, variando de 1000 en 1000
-    n_valores_3 = list(range(1000, 10001, 1000))
-    aprox_equi_3 = [aproximar_pi_con_particion(n, 'equiespaciada') for n in n_valores_3]
-    aprox_alea_3 = [aproximar_pi_con_particion(n, 'aleatoria') for n in n_valores_3]
-    aprox_cos_3 = [aproximar_pi_con_particion(n, 'coseno') for n in n_valores_3]
-    pi_valores_3 = [valor_pi] * len(n_valores_3)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_3, aprox_equi_3, 'b-o', label='Equiespaciada', linewidth=2, markersize=6)
-    plt.plot(n_valores_3, aprox_alea_3, 'r-s', label='Aleatoria', linewidth=2, markersize=6)
-    plt.plot(n_valores_3, aprox_cos_3, 'm-^', label='Coseno', linewidth=2, markersize=6)
-    plt.plot(n_valores_3, pi_valores_3, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de diferentes particiones hacia π\n(N = 1000 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_particiones_1000_10000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_particiones_1000_10000.png")
+    
+    figuras = []
+    
+    # Gráficas 1 a 3: una por rango de N
+    rangos = ['N = 10 a 100', 'N = 100 a 1000', 'N = 1000 a 10000']
+    archivos = ['grafica_particiones_10_100.png', 'grafica_particiones_100_1000.png',
+                'grafica_particiones_1000_10000.png']
+    
+    for barrido, rango, archivo in zip(barridos, rangos, archivos):
+        figuras.append(figura(archivo, (10, 6), _series_particiones(barrido, 6),
+                              titulo=f'Convergencia de diferentes particiones hacia π\n({rango})',
+                              xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+                              leyenda={'fontsize': 10}, grilla={'alpha': 0.3}))
     
     # Gráfica 4: Visión completa con todos los valores
-    n_valores_todos = n_valores_1 + n_valores_2 + n_valores_3
-    aprox_equi_todos = aprox_equi_1 + aprox_equi_2 + aprox_equi_3
-    aprox_alea_todos = aprox_alea_1 + aprox_alea_2 + aprox_alea_3
-    aprox_cos_todos = aprox_cos_1 + aprox_cos_2 + aprox_cos_3
-    pi_valores_todos = [valor_pi] * len(n_valores_todos)
-    
-    plt.figure(figsize=(12, 7))
-    plt.plot(n_valores_todos, aprox_equi_todos, 'b-o', label='Equiespaciada', linewidth=2, markersize=4)
-    plt.plot(n_valores_todos, aprox_alea_todos, 'r-s', label='Aleatoria', linewidth=2, markersize=4)
-    plt.plot(n_valores_todos, aprox_cos_todos, 'm-^', label='Coseno', linewidth=2, markersize=4)
-    plt.plot(n_valores_todos, pi_valores_todos, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de diferentes particiones hacia π\n(Visión completa: N = 10 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_particiones_completa.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_particiones_completa.png")
+    barrido_todos = {clave: barridos[0][clave] + barridos[1][clave] + barridos[2][clave]
+                     for clave in ('n', 'equiespaciada', 'aleatoria', 'coseno',
+                                   'residuo_equi', 'residuo_alea', 'residuo_cos')}
+    
+    figuras.append(figura('grafica_particiones_completa.png', (12, 7), _series_particiones(barrido_todos, 4),
+                          titulo='Convergencia de diferentes particiones hacia π\n(Visión completa: N = 10 a 10000)',
+                          xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+                          leyenda={'fontsize': 11}, grilla={'alpha': 0.3}))
     
     # Gráfica 5: Zoom en rango pequeño (10 a 50) para ver mejor el comportamiento inicial
-    n_valores_zoom = list(range(10, 51, 5))
-    aprox_equi_zoom = [aproximar_pi_con_particion(n, 'equiespaciada') for n in n_valores_zoom]
-    aprox_alea_zoom = [aproximar_pi_con_particion(n, 'aleatoria') for n in n_valores_zoom]
-    aprox_cos_zoom = [aproximar_pi_con_particion(n, 'coseno') for n in n_valores_zoom]
-    pi_valores_zoom = [valor_pi] * len(n_valores_zoom)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_zoom, aprox_equi_zoom, 'b-o', label='Equiespaciada', linewidth=2, markersize=7)
-    plt.plot(n_valores_zoom, aprox_alea_zoom, 'r-s', label='Aleatoria', linewidth=2, markersize=7)
-    plt.plot(n_valores_zoom, aprox_cos_zoom, 'm-^', label='Coseno', linewidth=2, markersize=7)
-    plt.plot(n_valores_zoom, pi_valores_zoom, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de diferentes particiones hacia π\n(Zoom: N = 10 a 50, para observar comportamiento inicial)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_particiones_zoom_10_50.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_particiones_zoom_10_50.png")
+    barrido_zoom = calcular_barrido_particiones(n_inicio=10, n_fin=50, incremento=5)
+    
+    figuras.append(figura('grafica_particiones_zoom_10_50.png', (10, 6), _series_particiones(barrido_zoom, 7),
+                          titulo='Convergencia de diferentes particiones hacia π\n(Zoom: N = 10 a 50, para observar comportamiento inicial)',
+                          xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+                          leyenda={'fontsize': 10}, grilla={'alpha': 0.3}))
     
     # Gráfica 6: Gráfica de residuos (errores) - escala logarítmica
-    residuos_equi = [abs(aprox - valor_pi) for aprox in aprox_equi_todos]
-    residuos_alea = [abs(aprox - valor_pi) for aprox in aprox_alea_todos]
-    residuos_cos = [abs(aprox - valor_pi) for aprox in aprox_cos_todos]
-    
-    plt.figure(figsize=(12, 7))
-    plt.semilogy(n_valores_todos, residuos_equi, 'b-o', label='Equiespaciada', linewidth=2, markersize=4)
-    plt.semilogy(n_valores_todos, residuos_alea, 'r-s', label='Aleatoria', linewidth=2, markersize=4)
-    plt.semilogy(n_valores_todos, residuos_cos, 'm-^', label='Coseno', linewidth=2, markersize=4)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Residuo (error) - Escala logarítmica', fontsize=12)
-    plt.title('Evolución del residuo |aproximación - π| con diferentes particiones\n(Escala logarítmica)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3, which='both')
-    plt.tight_layout()
-    plt.savefig('grafica_residuos_particiones.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_residuos_particiones.png")
+    n_valores_todos = barrido_todos['n']
     
-    print("\n" + "=" * 70)
-    print("Todas las gráficas han sido generadas exitosamente")
-    print("=" * 70)
+    figuras.append(figura('grafica_residuos_particiones.png', (12, 7), [
+        linea(n_valores_todos, barrido_todos['residuo_equi'], 'b-o', label='Equiespaciada', linewidth=2, markersize=4),
+        linea(n_valores_todos, barrido_todos['residuo_alea'], 'r-s', label='Aleatoria', linewidth=2, markersize=4),
+        linea(n_valores_todos, barrido_todos['residuo_cos'], 'm-^', label='Coseno', linewidth=2, markersize=4),
+    ], titulo='Evolución del residuo |aproximación - π| con diferentes particiones\n(Escala logarítmica)',
+        xlabel='N (tamaño de partición)', ylabel='Residuo (error) - Escala logarítmica',
+        leyenda={'fontsize': 11}, grilla={'alpha': 0.3, 'which': 'both'}, escala_y='log'))
+    
+    pendientes = enviar_figuras(figuras, ejecutor)
+    
+    if esperar:
+        esperar_figuras(pendientes)
+        print("\n" + "=" * 70)
+        print("Todas las gráficas han sido generadas exitosamente")
+        print("=" * 70)
+    
+    return pendientes
+
 
+# Cantidad máxima de rectángulos por gráfica: del orden de las columnas de píxeles
+# del eje (12 pulgadas a 300 dpi). Con más subintervalos los contiguos se unen.
+MAX_RECTANGULOS = 3000
 
-def graficar_funcion_con_rectangulos(n=100):
+
+def graficar_funcion_con_rectangulos(n=100, ejecutor=None, esperar=True, max_rectangulos=MAX_RECTANGULOS,
+                                     integrando='semicirculo'):
     """
-    Grafica la función f(x) = 2*sqrt(1-x²) junto con los rectángulos de aproximación
+    Grafica la función f(x) = 2*sqrt(1-x²) (o el integrando indicado) junto con los rectángulos de aproximación
     para cada tipo de partición (equiespaciada, aleatoria, coseno) con N puntos.
+    Los rectángulos de cada partición se dibujan como una sola PolyCollection. Si
+    hay más de max_rectangulos se unen los contiguos (ver diezmar_rectangulos),
+    conservando el área, así el costo del dibujo no depende de N.
     
     Parámetros:
     - n: Cantidad de puntos de la partición (por defecto 100)
+    - ejecutor: Pool de crear_ejecutor_renderizado para dibujar en paralelo (opcional)
+    - esperar: Si es False no espera a que se terminen de dibujar (ver esperar_figuras)
+    - max_rectangulos: Cantidad máxima de rectángulos dibujados por gráfica
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Lista de figuras pendientes (ver enviar_figuras)
     """
     print(f"\nGenerando gráficas de la función con rectángulos de aproximación (N={n})...")
     
+    nombre_integrando = integrando if isinstance(integrando, str) else None
+    sufijo = '' if nombre_integrando in (None, 'semicirculo') else f'_{nombre_integrando}'
+    integrando = obtener_integrando(integrando)
+    dominio = integrando['dominio']
+    
     # Valores para graficar la función continua
-    x_continuo = np.linspace(-1, 1, 1000)
-    y_continuo = [funcion(x) for x in x_continuo]
-    
-    # Generar las tres particiones
-    particion_equi = particion_equiespaciada(n)
-    particion_alea = particion_aleatoria_uniforme(n)
-    particion_cos = particion_coseno(n)
-    
-    # ========================================================================
-    # Gráfica 1: Partición Equiespaciada
-    # ========================================================================
-    plt.figure(figsize=(12, 8))
-    
-    # Graficar la función continua
-    plt.plot(x_continuo, y_continuo, 'b-', linewidth=2, label='f(x) = 2√(1-x²)', zorder=3)
-    
-    # Graficar los rectángulos
-    for i in range(len(particion_equi) - 1):
-        x_izq = particion_equi[i]
-        x_der = particion_equi[i + 1]
-        x_medio = (x_izq + x_der) / 2.0
+    x_continuo = np.linspace(dominio[0], dominio[1], 1000)
+    y_continuo = evaluar(integrando, x_continuo)
+    
+    # Las tres particiones, con el nombre del archivo, el título y los colores de sus rectángulos
+    particiones = [
+        (particion_equiespaciada(n, dominio), 'equiespaciada', 'Partición Equiespaciada', 'red', 'lightcoral'),
+        (particion_aleatoria_uniforme(n, dominio), 'aleatoria', 'Partición Aleatoria Uniforme', 'green', 'lightgreen'),
+        (particion_coseno(n, dominio), 'coseno', 'Partición Coseno', 'purple', 'plum'),
+    ]
+    
+    figuras = []
+    
+    for particion, nombre, titulo, color_borde, color in particiones:
+        # Rectángulos de punto medio: altura f(x_medio) sobre cada subintervalo
+        nodos = np.asarray(particion)
+        altura = evaluar(integrando, (nodos[:-1] + nodos[1:]) / 2.0)
+        izquierda, derecha, altura = diezmar_rectangulos(nodos, altura, max_rectangulos)
         
-        # Verificar que el punto medio esté en el dominio
-        if -1.0 <= x_medio <= 1.0:
-            altura = funcion(x_medio)
-            ancho = x_der - x_izq
-            
-            # Dibujar rectángulo
-            plt.bar(x_medio, altura, width=ancho, alpha=0.3, 
-                   edgecolor='red', color='lightcoral', align='center', zorder=1)
-    
-    plt.xlabel('x', fontsize=12)
-    plt.ylabel('f(x)', fontsize=12)
-    plt.title(f'Aproximación con Partición Equiespaciada (N={n})', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=11)
-    plt.tight_layout()
-    
-    nombre_archivo = f'grafica_rectangulos_equiespaciada_n{n}.png'
-    plt.savefig(nombre_archivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"✓ Gráfica guardada: {nombre_archivo}")
-    
-    # ========================================================================
-    # Gráfica 2: Partición Aleatoria Uniforme
-    # ========================================================================
-    plt.figure(figsize=(12, 8))
-    
-    # Graficar la función continua
-    plt.plot(x_continuo, y_continuo, 'b-', linewidth=2, label='f(x) = 2√(1-x²)', zorder=3)
-    
-    # Graficar los rectángulos
-    for i in range(len(particion_alea) - 1):
-        x_izq = particion_alea[i]
-        x_der = particion_alea[i + 1]
-        x_medio = (x_izq + x_der) / 2.0
+        titulo_figura = f'Aproximación con {titulo} (N={n})'
+        if len(altura) < len(nodos) - 1:
+            titulo_figura += f'\n({len(altura)} rectángulos dibujados, unidos conservando el área)'
         
-        # Verificar que el punto medio esté en el dominio
-        if -1.0 <= x_medio <= 1.0:
-            altura = funcion(x_medio)
-            ancho = x_der - x_izq
-            
-            # Dibujar rectángulo
-            plt.bar(x_medio, altura, width=ancho, alpha=0.3, 
-                   edgecolor='green', color='lightgreen', align='center', zorder=1)
-    
-    plt.xlabel('x', fontsize=12)
-    plt.ylabel('f(x)', fontsize=12)
-    plt.title(f'Aproximación con Partición Aleatoria Uniforme (N={n})', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=11)
-    plt.tight_layout()
-    
-    nombre_archivo = f'grafica_rectangulos_aleatoria_n{n}.png'
-    plt.savefig(nombre_archivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"✓ Gráfica guardada: {nombre_archivo}")
-    
-    # ========================================================================
-    # Gráfica 3: Partición Coseno
-    # ========================================================================
-    plt.figure(figsize=(12, 8))
-    
-    # Graficar la función continua
-    plt.plot(x_continuo, y_continuo, 'b-', linewidth=2, label='f(x) = 2√(1-x²)', zorder=3)
-    
-    # Graficar los rectángulos
-    for i in range(len(particion_cos) - 1):
-        x_izq = particion_cos[i]
-        x_der = particion_cos[i + 1]
-        x_medio = (x_izq + x_der) / 2.0
-        
-        # Verificar que el punto medio esté en el dominio
-        if -1.0 <= x_medio <= 1.0:
-            altura = funcion(x_medio)
-            ancho = x_der - x_izq
-            
-            # Dibujar rectángulo
-            plt.bar(x_medio, altura, width=ancho, alpha=0.3, 
-                   edgecolor='purple', color='plum', align='center', zorder=1)
-    
-    plt.xlabel('x', fontsize=12)
-    plt.ylabel('f(x)', fontsize=12)
-    plt.title(f'Aproximación con Partición Coseno (N={n})', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=11)
-    plt.tight_layout()
-    
-    nombre_archivo = f'grafica_rectangulos_coseno_n{n}.png'
-    plt.savefig(nombre_archivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"✓ Gráfica guardada: {nombre_archivo}")
-    
-    print("\n" + "="*70)
-    print("Todas las gráficas con rectángulos han sido generadas exitosamente")
-    print("="*70)
+        figuras.append(figura(f'grafica_rectangulos_{nombre}{sufijo}_n{n}.png', (12, 8), [
+            linea(x_continuo, y_continuo, 'b-', linewidth=2, label=integrando['nombre'], zorder=3),
+            rectangulos(izquierda, derecha, altura, alpha=0.3, edgecolor=color_borde, facecolor=color,
+                        zorder=1),
+        ], titulo=titulo_figura, xlabel='x', ylabel='f(x)',
+            leyenda={'fontsize': 11}, grilla={'alpha': 0.3}, guardar={'bbox_inches': 'tight'}))
+    
+    pendientes = enviar_figuras(figuras, ejecutor)
+    
+    if esperar:
+        esperar_figuras(pendientes)
+        print("\n" + "="*70)
+        print("Todas las gráficas con rectángulos han sido generadas exitosamente")
+        print("="*70)
+    
+    return pendientes
 
 
 if __name__ == "__main__":
+    jobs = leer_argumento_jobs("Ejercicio 2: aproximación de π con diferentes particiones")
+    
     # EJERCICIO 2.1: Probar las funciones de particiones con ejemplos
     print("\n")
     print("=" * 80)
@@ -596,24 +746,47 @@ if __name__ == "__main__":
     print("=" * 80)
     print("EJERCICIO 2.2: TABLAS COMPARATIVAS DE PARTICIONES")
     print("=" * 80)
-    generar_tablas_comparativas_particiones()
+    # Los barridos se calculan una sola vez y los usan las tablas, el CSV y las gráficas
+    barridos = calcular_barridos_particiones(jobs)
+    
+    # Las gráficas se empiezan a dibujar en paralelo mientras se escriben las tablas
+    ejecutor = crear_ejecutor_renderizado(jobs)
+    graficas = graficar_convergencia_particiones(barridos, ejecutor, esperar=False)
+    graficas_rectangulos = graficar_funcion_con_rectangulos(100, ejecutor, esperar=False)
+    graficas_rectangulos += graficar_funcion_con_rectangulos(100000, ejecutor, esperar=False)
+    
+    generar_tablas_comparativas_particiones(barridos)
     
     # Generar también archivo CSV con las tablas
     try:
-        generar_tablas_csv_particiones('tablas_particiones.csv')
+        generar_tablas_csv_particiones('tablas_particiones.csv', barridos)
     except PermissionError:
         print("\n⚠ No se pudo generar el archivo CSV (el archivo puede estar abierto en otro programa)")
     
+    # Y en formato columnar (un .npy por columna), para analizar los resultados sin parsear texto
+    try:
+        generar_tablas_columnares_particiones('tablas_particiones_columnas', barridos)
+    except PermissionError:
+        print("\n⚠ No se pudieron generar los resultados columnares (sin permiso de escritura)")
+    
     # EJERCICIO 2.3: Generar gráficas de convergencia de particiones
     print("\n\n")
     print("=" * 80)
     print("EJERCICIO 2.3: GRÁFICAS DE CONVERGENCIA DE PARTICIONES")
     print("=" * 80)
-    graficar_convergencia_particiones()
+    esperar_figuras(graficas)
+    print("\n" + "=" * 70)
+    print("Todas las gráficas han sido generadas exitosamente")
+    print("=" * 70)
     
     # EJERCICIO 2.4: Graficar función con rectángulos de aproximación
     print("\n\n")
     print("=" * 80)
     print("EJERCICIO 2.4: FUNCIÓN CON RECTÁNGULOS DE APROXIMACIÓN")
     print("=" * 80)
-    graficar_funcion_con_rectangulos(n=100)
\ No newline at end of file
+    esperar_figuras(graficas_rectangulos)
+    if ejecutor is not None:
+        ejecutor.shutdown()
+    print("\n" + "="*70)
+    print("Todas las gráficas con rectángulos han sido generadas exitosamente")
+    print("="*70)
\ No newline at end of file
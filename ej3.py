@@ -1,51 +1,65 @@
 import math
 import csv
-import matplotlib.pyplot as plt
+import heapq
+import os
 import numpy as np
-from math import sqrt
-
-# Función que estamos estudiando
-def funcion(x):
-    """
-    Calcula f(x) = 2 * sqrt(1 - x^2)
-    Esta función representa un semicírculo de radio 1.
-    """
-    result = 2 * (sqrt(1 - (x**2)))
-    return result
-
+from cache_resultados import memoizar_en_disco
+from barrido_paralelo import ejecutar_en_paralelo, ejecutar_grillas, leer_argumento_jobs
+from integrandos import obtener_integrando, evaluar, ruta_escalar_cacheable
+from resultados_columnares import guardar_barridos
+from renderizado import figura, linea, crear_ejecutor_renderizado, enviar_figuras, esperar_figuras
 
 # ============================================================================
 # EJERCICIO 3: Comparación de métodos de integración numérica
 # ============================================================================
 
-def particion_equiespaciada(n):
+def particion_equiespaciada(n, dominio=(-1.0, 1.0)):
     """
-    Genera una partición equiespaciada del intervalo [-1, 1].
+    Genera una partición equiespaciada del intervalo [-1, 1] (o del dominio indicado).
     (Importada de ej2.py)
     
     Parámetros:
     - n: Cantidad de puntos de la partición (incluyendo los extremos)
+    - dominio: Intervalo (a, b) a particionar (por defecto [-1, 1])
     
     Retorna:
-    - Lista ordenada de n puntos equiespaciados en [-1, 1]
+    - Lista ordenada de n puntos equiespaciados en [a, b]
     """
     if n < 2:
         raise ValueError("n debe ser al menos 2")
     
-    # El paso entre puntos consecutivos
-    delta_x = 2.0 / (n - 1)  # 2.0 porque el intervalo tiene longitud 2 (de -1 a 1)
+    a, b = dominio
+    
+    # El paso entre puntos consecutivos (2.0 / (n - 1) en [-1, 1])
+    delta_x = (b - a) / (n - 1)
     
     # Generar los puntos
-    particion = [-1.0 + i * delta_x for i in range(n)]
+    particion = [a + i * delta_x for i in range(n)]
     
     return particion
 
 
+def _nodos_equiespaciados(n, dominio):
+    """
+    Los mismos puntos que particion_equiespaciada, como arreglo de NumPy.
+    """
+    if n < 2:
+        raise ValueError("n debe ser al menos 2")
+    
+    a, b = dominio
+    return a + np.arange(n, dtype=np.float64) * ((b - a) / (n - 1))
+
+
 # ============================================================================
 # MÉTODOS DE INTEGRACIÓN NUMÉRICA
 # ============================================================================
+#
+# Todos los métodos reciben integrando= (ver integrandos.py), por defecto el
+# semicírculo. Si el integrando tiene versión vectorizada se usa la rama con
+# arreglos; si no, el recorrido por subintervalos con la versión escalar.
 
-def metodo_rectangulos(n):
+@memoizar_en_disco(version=2, cacheable=ruta_escalar_cacheable)
+def metodo_rectangulos(n, integrando='semicirculo'):
     """
     Método de rectángulos: usa el valor de la función en el extremo izquierdo
     de cada subintervalo para calcular el área.
@@ -54,11 +68,19 @@ def metodo_rectangulos(n):
     
     Parámetros:
     - n: Cantidad de puntos de la partición equiespaciada
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
     
     Retorna:
     - Aproximación de π usando el método de rectángulos
     """
-    particion = particion_equiespaciada(n)
+    integrando = obtener_integrando(integrando)
+    
+    if integrando['vectorizada'] is not None:
+        nodos = _nodos_equiespaciados(n, integrando['dominio'])
+        return float(np.sum(evaluar(integrando, nodos[:-1]) * np.diff(nodos)))
+    
+    f = integrando['escalar']
+    particion = particion_equiespaciada(n, integrando['dominio'])
     suma = 0.0
     
     # Para cada subintervalo [x_i, x_{i+1}]
@@ -69,13 +91,14 @@ def metodo_rectangulos(n):
         dx = x_der - x_izq
         
         # Usar el extremo izquierdo para calcular la altura
-        altura = funcion(x_izq)
+        altura = f(x_izq)
         suma += altura * dx
     
     return suma
 
 
-def metodo_trapecio(n):
+@memoizar_en_disco(version=2, cacheable=ruta_escalar_cacheable)
+def metodo_trapecio(n, integrando='semicirculo'):
     """
     Método del trapecio: en vez de áreas de rectángulos se suman áreas de
     trapecios definidos por los extremos de cada subintervalo.
@@ -84,11 +107,20 @@ def metodo_trapecio(n):
     
     Parámetros:
     - n: Cantidad de puntos de la partición equiespaciada
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
     
     Retorna:
     - Aproximación de π usando el método del trapecio
     """
-    particion = particion_equiespaciada(n)
+    integrando = obtener_integrando(integrando)
+    
+    if integrando['vectorizada'] is not None:
+        nodos = _nodos_equiespaciados(n, integrando['dominio'])
+        valores = evaluar(integrando, nodos)
+        return float(np.sum(np.diff(nodos) * (valores[:-1] + valores[1:]) / 2.0))
+    
+    f = integrando['escalar']
+    particion = particion_equiespaciada(n, integrando['dominio'])
     suma = 0.0
     
     # Para cada subintervalo [x_i, x_{i+1}]
@@ -99,8 +131,8 @@ def metodo_trapecio(n):
         dx = x_der - x_izq
         
         # Calcular alturas en ambos extremos
-        altura_izq = funcion(x_izq)
-        altura_der = funcion(x_der)
+        altura_izq = f(x_izq)
+        altura_der = f(x_der)
         
         # Área del trapecio = base * (altura_izq + altura_der) / 2
         area_trapecio = dx * (altura_izq + altura_der) / 2.0
@@ -109,7 +141,8 @@ def metodo_trapecio(n):
     return suma
 
 
-def metodo_punto_medio(n):
+@memoizar_en_disco(version=2, cacheable=ruta_escalar_cacheable)
+def metodo_punto_medio(n, integrando='semicirculo'):
     """
     Método del punto medio: evalúa la función en el centro de cada subintervalo.
     
@@ -118,11 +151,21 @@ def metodo_punto_medio(n):
     
     Parámetros:
     - n: Cantidad de puntos de la partición equiespaciada
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
     
     Retorna:
     - Aproximación de π usando el método del punto medio
     """
-    particion = particion_equiespaciada(n)
+    integrando = obtener_integrando(integrando)
+    a, b = integrando['dominio']
+    
+    if integrando['vectorizada'] is not None:
+        nodos = _nodos_equiespaciados(n, (a, b))
+        puntos_medios = (nodos[:-1] + nodos[1:]) / 2.0
+        return float(np.sum(evaluar(integrando, puntos_medios) * np.diff(nodos)))
+    
+    f = integrando['escalar']
+    particion = particion_equiespaciada(n, (a, b))
     suma = 0.0
     
     # Para cada subintervalo [x_i, x_{i+1}]
@@ -136,69 +179,567 @@ def metodo_punto_medio(n):
         x_medio = (x_izq + x_der) / 2.0
         
         # Verificar que el punto medio esté en el dominio
-        if -1.0 <= x_medio <= 1.0:
-            altura = funcion(x_medio)
+        if a <= x_medio <= b:
+            altura = f(x_medio)
             suma += altura * dx
     
     return suma
 
 
+def metodos_fusionados(n, integrando='semicirculo'):
+    """
+    Rectángulos, trapecio, punto medio y Simpson sobre la misma partición
+    equiespaciada, armándola una sola vez y evaluando la función una sola vez
+    en cada nodo y en cada punto medio (n + (n - 1) evaluaciones en total,
+    en vez de las 3n - 2 de llamar a los tres métodos por separado).
+    
+    Simpson compuesto sale gratis de los otros dos: S = (T + 2 M) / 3, con T el
+    trapecio y M el punto medio sobre los mismos n - 1 subintervalos.
+    
+    Parámetros:
+    - n: Cantidad de puntos de la partición equiespaciada
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Tupla (rectángulos, trapecio, punto medio, simpson)
+    """
+    integrando = obtener_integrando(integrando)
+    
+    if integrando['vectorizada'] is not None:
+        nodos = _nodos_equiespaciados(n, integrando['dominio'])
+        dx = np.diff(nodos)
+        valores = evaluar(integrando, nodos)
+        valores_medios = evaluar(integrando, (nodos[:-1] + nodos[1:]) / 2.0)
+        
+        # Mismas expresiones que metodo_rectangulos, metodo_trapecio y metodo_punto_medio
+        rectangulos = float(np.sum(valores[:-1] * dx))
+        trapecio = float(np.sum(dx * (valores[:-1] + valores[1:]) / 2.0))
+        punto_medio = float(np.sum(valores_medios * dx))
+    else:
+        f = integrando['escalar']
+        particion = particion_equiespaciada(n, integrando['dominio'])
+        valores = [f(x) for x in particion]
+        rectangulos = trapecio = punto_medio = 0.0
+        
+        # Para cada subintervalo [x_i, x_{i+1}], con los valores ya calculados en los nodos
+        for i in range(len(particion) - 1):
+            dx = particion[i + 1] - particion[i]
+            rectangulos += valores[i] * dx
+            trapecio += dx * (valores[i] + valores[i + 1]) / 2.0
+            punto_medio += f((particion[i] + particion[i + 1]) / 2.0) * dx
+    
+    simpson = (trapecio + 2.0 * punto_medio) / 3.0
+    
+    return rectangulos, trapecio, punto_medio, simpson
+
+
+def refinar_trapecio(n_inicial=2, niveles=10, integrando='semicirculo'):
+    """
+    Método del trapecio sobre particiones anidadas, reutilizando las evaluaciones.
+    
+    Al pasar de n a 2n-1 puntos, la partición nueva contiene todos los nodos de
+    la anterior más los puntos medios de cada subintervalo. Por eso solo se
+    evalúa la función en los puntos medios nuevos:
+    
+        T(2n-1) = T(n) / 2 + (dx / 2) * suma de f en los puntos medios
+    
+    Así toda la sucesión hasta N cuesta O(N) evaluaciones en total.
+    
+    Parámetros:
+    - n_inicial: Cantidad de puntos de la primera partición (al menos 2)
+    - niveles: Cantidad de niveles de refinamiento a generar
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Genera:
+    - Tuplas (n, aproximacion, evaluaciones) para cada nivel, donde evaluaciones
+      es la cantidad acumulada de llamadas a la función
+    """
+    integrando = obtener_integrando(integrando)
+    a, b = integrando['dominio']
+    
+    particion = np.array(particion_equiespaciada(n_inicial, (a, b)))
+    valores = evaluar(integrando, particion)
+    
+    n = n_inicial
+    dx = (b - a) / (n - 1)
+    suma = dx * (valores.sum() - (valores[0] + valores[-1]) / 2.0)
+    evaluaciones = n
+    yield n, float(suma), evaluaciones
+    
+    for _ in range(niveles - 1):
+        # Puntos medios de los n-1 subintervalos del nivel actual
+        puntos_medios = a + (np.arange(n - 1) + 0.5) * dx
+        suma_medios = evaluar(integrando, puntos_medios).sum()
+        
+        evaluaciones += n - 1
+        n = 2 * n - 1
+        dx = dx / 2.0
+        suma = suma / 2.0 + dx * suma_medios
+        yield n, float(suma), evaluaciones
+
+
+# ============================================================================
+# EXTRAPOLACIÓN DE RICHARDSON (MÉTODO DE ROMBERG)
+# ============================================================================
+
+def exponentes_richardson(cantidad, singularidad_raiz=True):
+    """
+    Devuelve los exponentes p_1 < p_2 < ... del desarrollo del error del trapecio,
+    E(h) = c_1 h^p_1 + c_2 h^p_2 + ..., que la tabla de Romberg va eliminando.
+    
+    Para un integrando suave son 2, 4, 6, ... (Euler-Maclaurin). Con singularidades
+    del tipo sqrt(1 - x) en los extremos (como f(x) = 2*sqrt(1-x^2)) aparecen además
+    los términos h^1.5, h^2.5, h^3.5, ... (desarrollo de Navot), y si no se eliminan
+    la extrapolación clásica no mejora el orden del trapecio.
+    
+    Parámetros:
+    - cantidad: Cantidad de exponentes a generar
+    - singularidad_raiz: Si es True incluye los exponentes j + 1.5
+    
+    Retorna:
+    - Lista ordenada de exponentes
+    """
+    pares = [2.0 * k for k in range(1, cantidad + 1)]
+    if not singularidad_raiz:
+        return pares
+    
+    semienteros = [j + 1.5 for j in range(cantidad)]
+    return sorted(pares + semienteros)[:cantidad]
+
+
+def metodo_romberg(tol=1e-12, max_niveles=20, n_inicial=2, singularidad_raiz=None, integrando='semicirculo'):
+    """
+    Método de Romberg: construye la tabla de extrapolación de Richardson a partir
+    de los niveles anidados del trapecio (ver refinar_trapecio) y se detiene en
+    cuanto la diagonal de la tabla converge a la tolerancia pedida.
+    
+    Cada columna j de la tabla se obtiene de la anterior como
+    
+        R[k][j] = R[k][j-1] + (R[k][j-1] - R[k-1][j-1]) / (2^p_j - 1)
+    
+    con los exponentes p_j de exponentes_richardson.
+    
+    Parámetros:
+    - tol: Tolerancia absoluta buscada
+    - max_niveles: Cantidad máxima de niveles del trapecio
+    - n_inicial: Cantidad de puntos del primer nivel
+    - singularidad_raiz: Usar los exponentes para singularidades sqrt en los extremos
+      (si es None, se usan cuando el integrando declara puntos singulares)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Diccionario con:
+      - 'aproximacion': Último valor de la diagonal
+      - 'error_estimado': |R[k][k] - R[k-1][k-1]|
+      - 'convergio': True si error_estimado < tol
+      - 'niveles': Cantidad de niveles calculados
+      - 'evaluaciones': Llamadas a la función en total
+      - 'tabla': Tabla de Romberg (lista de filas)
+      - 'errores_columna': Estimación del error de cada columna, |R[k][j] - R[k-1][j]| en la última fila
+      - 'orden_observado': Orden de convergencia del trapecio medido en los últimos tres niveles
+    """
+    integrando = obtener_integrando(integrando)
+    if singularidad_raiz is None:
+        singularidad_raiz = bool(integrando['puntos_singulares'])
+    
+    exponentes = exponentes_richardson(max_niveles, singularidad_raiz)
+    tabla = []
+    trapecios = []
+    error_estimado = math.inf
+    evaluaciones = 0
+    
+    for k, (n, aproximacion, evaluaciones) in enumerate(refinar_trapecio(n_inicial, max_niveles, integrando)):
+        trapecios.append(aproximacion)
+        fila = [aproximacion]
+        for j in range(1, k + 1):
+            p = exponentes[j - 1]
+            fila.append(fila[j - 1] + (fila[j - 1] - tabla[k - 1][j - 1]) / (2.0 ** p - 1.0))
+        tabla.append(fila)
+        
+        if k >= 2:
+            error_estimado = abs(fila[k] - tabla[k - 1][k - 1])
+            if error_estimado < tol:
+                break
+    
+    ultima = tabla[-1]
+    anterior = tabla[-2] if len(tabla) > 1 else []
+    errores_columna = [abs(ultima[j] - anterior[j]) for j in range(len(anterior))]
+    
+    # Orden observado: log2 del cociente entre diferencias sucesivas del trapecio
+    orden_observado = None
+    if len(trapecios) >= 3:
+        diferencia_1 = abs(trapecios[-2] - trapecios[-3])
+        diferencia_2 = abs(trapecios[-1] - trapecios[-2])
+        if diferencia_1 > 0 and diferencia_2 > 0:
+            orden_observado = math.log2(diferencia_1 / diferencia_2)
+    
+    return {
+        'aproximacion': ultima[-1],
+        'error_estimado': error_estimado,
+        'convergio': error_estimado < tol,
+        'niveles': len(tabla),
+        'evaluaciones': evaluaciones,
+        'tabla': tabla,
+        'errores_columna': errores_columna,
+        'orden_observado': orden_observado,
+    }
+
+
+# ============================================================================
+# CUADRATURA ADAPTATIVA (SIMPSON CON COLA DE PRIORIDAD)
+# ============================================================================
+
+def _simpson_intervalo(a, b, fa, fm, fb, f_izq, f_der, singular):
+    """
+    Simpson compuesto sobre [a, b] con dos mitades y su estimación de error.
+    
+    Parámetros:
+    - a, b: Extremos del intervalo
+    - fa, fm, fb: f en a, en el punto medio y en b
+    - f_izq, f_der: f en los puntos medios de cada mitad
+    - singular: True si el intervalo toca un punto singular
+    
+    Retorna:
+    - (aproximacion, error_estimado)
+    """
+    h = b - a
+    simpson_grueso = h * (fa + 4.0 * fm + fb) / 6.0
+    simpson_fino = h * (fa + 4.0 * f_izq + 2.0 * fm + 4.0 * f_der + fb) / 12.0
+    
+    # Si f es suave el error de la regla fina es ~|fino - grueso| / 15. Junto a una
+    # singularidad sqrt el orden baja y ese factor subestima el error, así que
+    # se usa la diferencia completa.
+    diferencia = abs(simpson_fino - simpson_grueso)
+    error = diferencia if singular else diferencia / 15.0
+    
+    return simpson_fino, error
+
+
+def metodo_adaptativo(tol=1e-10, max_evals=100000, subintervalos_iniciales=2, puntos_singulares=None,
+                      integrando='semicirculo'):
+    """
+    Cuadratura adaptativa de Simpson con cola de prioridad: en cada paso se
+    subdivide el intervalo con mayor error estimado, de modo que los puntos se
+    concentran cerca de las singularidades de f en x = ±1, donde está casi todo
+    el error, en vez de repartirse uniformemente.
+    
+    Parámetros:
+    - tol: Tolerancia absoluta buscada para el error total
+    - max_evals: Cantidad máxima de evaluaciones de la función
+    - subintervalos_iniciales: En cuántos intervalos iguales se divide el dominio al empezar
+    - puntos_singulares: Puntos donde f no es suave (se usa una estimación de error conservadora
+      en los intervalos que los tocan); por defecto los que declara el integrando
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Diccionario con 'aproximacion', 'error_estimado', 'evaluaciones',
+      'intervalos' (cantidad final de subintervalos) y 'convergio'
+    """
+    integrando = obtener_integrando(integrando)
+    if puntos_singulares is None:
+        puntos_singulares = integrando['puntos_singulares']
+    f = integrando['escalar']
+    a_dominio, b_dominio = integrando['dominio']
+    evaluaciones = 0
+    
+    def evaluar_contando(x):
+        nonlocal evaluaciones
+        evaluaciones += 1
+        return f(x)
+    
+    def toca_singularidad(a, b):
+        return any(a <= c <= b for c in puntos_singulares)
+    
+    def agregar(a, b, fa, fm, fb):
+        m = (a + b) / 2.0
+        f_izq = evaluar_contando((a + m) / 2.0)
+        f_der = evaluar_contando((m + b) / 2.0)
+        aproximacion, error = _simpson_intervalo(a, b, fa, fm, fb, f_izq, f_der, toca_singularidad(a, b))
+        heapq.heappush(cola, (-error, a, b, fa, f_izq, fm, f_der, fb, aproximacion))
+        return aproximacion, error
+    
+    # Intervalos iniciales
+    cola = []
+    ancho = b_dominio - a_dominio
+    nodos = [a_dominio + ancho * i / subintervalos_iniciales for i in range(subintervalos_iniciales + 1)]
+    valores_nodos = [evaluar_contando(x) for x in nodos]
+    for i in range(subintervalos_iniciales):
+        a, b = nodos[i], nodos[i + 1]
+        agregar(a, b, valores_nodos[i], evaluar_contando((a + b) / 2.0), valores_nodos[i + 1])
+    
+    error_total = sum(-item[0] for item in cola)
+    
+    # Subdividir el peor intervalo mientras no se alcance la tolerancia
+    while error_total > tol and evaluaciones + 4 <= max_evals:
+        menos_error, a, b, fa, f_izq, fm, f_der, fb, _ = heapq.heappop(cola)
+        m = (a + b) / 2.0
+        _, error_izq = agregar(a, m, fa, f_izq, fm)
+        _, error_der = agregar(m, b, fm, f_der, fb)
+        error_total += menos_error + error_izq + error_der
+    
+    # Se vuelven a sumar al final para no arrastrar el redondeo de las actualizaciones
+    error_total = math.fsum(-item[0] for item in cola)
+    
+    return {
+        'aproximacion': math.fsum(item[-1] for item in cola),
+        'error_estimado': error_total,
+        'evaluaciones': evaluaciones,
+        'intervalos': len(cola),
+        'convergio': error_total <= tol,
+    }
+
+
+# ============================================================================
+# CUADRATURA GAUSSIANA (LEGENDRE Y CHEBYSHEV DE SEGUNDA ESPECIE)
+# ============================================================================
+
+# Nodos y pesos ya calculados, por (tipo, orden)
+_nodos_pesos_gauss = {}
+
+
+def nodos_pesos_gauss(tipo, n, directorio_cache=None):
+    """
+    Devuelve los nodos y pesos de la cuadratura gaussiana de orden n en [-1, 1].
+    Se calculan una sola vez por orden y quedan en memoria; si se indica un
+    directorio también se guardan en disco (archivos .npz) para otros procesos.
+    
+    Parámetros:
+    - tipo: 'legendre' (peso 1) o 'chebyshev' (segunda especie, peso sqrt(1 - x^2))
+    - n: Cantidad de nodos
+    - directorio_cache: Directorio donde leer/guardar las tablas (opcional)
+    
+    Retorna:
+    - (nodos, pesos) como arreglos de NumPy de solo lectura
+    """
+    if n < 1:
+        raise ValueError("n debe ser al menos 1")
+    
+    archivo = None
+    if directorio_cache is not None:
+        archivo = os.path.join(directorio_cache, f'gauss_{tipo}_{n}.npz')
+    
+    clave = (tipo, n)
+    if clave in _nodos_pesos_gauss:
+        # Ya están en memoria, pero puede que todavía no estén en este directorio
+        nodos, pesos = _nodos_pesos_gauss[clave]
+    elif archivo is not None and os.path.exists(archivo):
+        with np.load(archivo) as datos:
+            nodos, pesos = datos['nodos'], datos['pesos']
+    elif tipo == 'legendre':
+        nodos, pesos = np.polynomial.legendre.leggauss(n)
+    elif tipo == 'chebyshev':
+        # x_i = cos(i*π/(n+1)), w_i = π/(n+1) * sin^2(i*π/(n+1)), i = 1, ..., n
+        theta = np.arange(1, n + 1) * math.pi / (n + 1)
+        nodos = np.cos(theta)
+        pesos = math.pi / (n + 1) * np.sin(theta) ** 2
+    else:
+        raise ValueError(f"Tipo de cuadratura gaussiana desconocido: {tipo}")
+    
+    if archivo is not None and not os.path.exists(archivo):
+        # Se escribe aparte y se renombra, así otro proceso nunca lee un .npz a medias
+        os.makedirs(directorio_cache, exist_ok=True)
+        temporal = f'{archivo}.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as salida:
+            np.savez(salida, nodos=nodos, pesos=pesos)
+        os.replace(temporal, archivo)
+    
+    nodos.setflags(write=False)
+    pesos.setflags(write=False)
+    _nodos_pesos_gauss[clave] = (nodos, pesos)
+    
+    return nodos, pesos
+
+
+def _trasladar_gauss(integrando):
+    """
+    Centro y semiancho del dominio: los nodos de [-1, 1] se llevan al dominio
+    como m + h*x, y la integral se multiplica por h.
+    """
+    a, b = integrando['dominio']
+    return (a + b) / 2.0, (b - a) / 2.0
+
+
+def metodo_gauss_legendre(n, directorio_cache=None, integrando='semicirculo'):
+    """
+    Cuadratura de Gauss-Legendre con n nodos: integral ≈ Σ w_i f(x_i).
+    Tiene convergencia espectral para integrandos suaves; con f(x) = 2*sqrt(1-x^2)
+    la singularidad en los extremos la limita, pero sigue superando a los
+    métodos de la tabla con muchos menos puntos.
+    
+    Parámetros:
+    - n: Cantidad de nodos
+    - directorio_cache: Directorio para persistir los nodos y pesos (opcional)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Aproximación de π usando Gauss-Legendre
+    """
+    integrando = obtener_integrando(integrando)
+    centro, semiancho = _trasladar_gauss(integrando)
+    
+    nodos, pesos = nodos_pesos_gauss('legendre', n, directorio_cache)
+    return semiancho * float(pesos @ evaluar(integrando, centro + semiancho * nodos))
+
+
+def metodo_gauss_chebyshev(n, directorio_cache=None, integrando='semicirculo'):
+    """
+    Cuadratura de Gauss-Chebyshev de segunda especie con n nodos:
+    integral de sqrt(1-x^2) g(x) ≈ Σ w_i g(x_i), con g(x) = f(x) / sqrt(1-x^2).
+    
+    Para el semicírculo g(x) = 2 es constante, así que la regla es exacta
+    (salvo redondeo) ya con n = 1. En otro dominio se traslada a [-1, 1] y el
+    peso queda en la variable trasladada.
+    
+    Parámetros:
+    - n: Cantidad de nodos
+    - directorio_cache: Directorio para persistir los nodos y pesos (opcional)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Aproximación de π usando Gauss-Chebyshev de segunda especie
+    """
+    integrando = obtener_integrando(integrando)
+    centro, semiancho = _trasladar_gauss(integrando)
+    
+    nodos, pesos = nodos_pesos_gauss('chebyshev', n, directorio_cache)
+    g = evaluar(integrando, centro + semiancho * nodos) / np.sqrt(1.0 - nodos * nodos)
+    return semiancho * float(pesos @ g)
+
+
 # ============================================================================
 # EJERCICIO 3.2: Tablas comparativas de los métodos
 # ============================================================================
 
-def generar_tabla_comparativa_metodos(n_inicio, n_fin, incremento, numero_tabla):
+def _fila_metodos(n):
+    """
+    Aproximaciones de los tres métodos y de Simpson para un N (una fila de la
+    tabla), con una sola partición y una sola evaluación por punto.
+    Es una función de nivel de módulo para poder enviarla a otro proceso.
+    """
+    return metodos_fusionados(n)
+
+
+def _armar_barrido_metodos(n_inicio, n_fin, incremento, filas, tiempos):
+    """
+    Arma el diccionario del barrido a partir de las filas calculadas y de los
+    segundos que tardó cada una.
+    """
+    valor_pi = math.pi
+    barrido = {'n_inicio': n_inicio, 'n_fin': n_fin, 'incremento': incremento,
+               'n': [], 'rectangulos': [], 'trapecio': [], 'punto_medio': [], 'simpson': [],
+               'residuo_rect': [], 'residuo_trap': [], 'residuo_medio': [], 'residuo_simpson': [],
+               'tiempo': list(tiempos)}
+    
+    for n, (aprox_rect, aprox_trap, aprox_medio, aprox_simpson) in zip(range(n_inicio, n_fin + 1, incremento), filas):
+        barrido['n'].append(n)
+        barrido['rectangulos'].append(aprox_rect)
+        barrido['trapecio'].append(aprox_trap)
+        barrido['punto_medio'].append(aprox_medio)
+        barrido['simpson'].append(aprox_simpson)
+        barrido['residuo_rect'].append(abs(aprox_rect - valor_pi))
+        barrido['residuo_trap'].append(abs(aprox_trap - valor_pi))
+        barrido['residuo_medio'].append(abs(aprox_medio - valor_pi))
+        barrido['residuo_simpson'].append(abs(aprox_simpson - valor_pi))
+    
+    return barrido
+
+
+def calcular_barrido_metodos(n_inicio, n_fin, incremento, jobs=1):
+    """
+    Calcula una sola vez las aproximaciones de los tres métodos (y Simpson) para
+    cada N del rango con metodos_fusionados. El resultado lo leen la tabla por
+    consola, el CSV y las gráficas, así no se vuelve a integrar lo mismo tres veces.
+    
+    Parámetros:
+    - n_inicio: Valor inicial de N
+    - n_fin: Valor final de N
+    - incremento: Paso entre valores consecutivos de N
+    - jobs: Cantidad de procesos para calcular las filas (por defecto 1)
+    
+    Retorna:
+    - Diccionario con las listas 'n', 'rectangulos', 'trapecio', 'punto_medio',
+      'simpson' y sus residuos ('residuo_rect', 'residuo_trap', 'residuo_medio',
+      'residuo_simpson'), más 'tiempo' (segundos de cada fila)
+    """
+    n_valores = list(range(n_inicio, n_fin + 1, incremento))
+    filas, tiempos = ejecutar_en_paralelo(_fila_metodos, n_valores, jobs, costo=lambda n: n, cronometrar=True)
+    return _armar_barrido_metodos(n_inicio, n_fin, incremento, filas, tiempos)
+
+
+def calcular_barridos_metodos(jobs=1):
+    """
+    Calcula los barridos de las tres tablas (10 a 100, 100 a 1000 y 1000 a 10000).
+    Con jobs > 1 las filas de las tres tablas se reparten en un único pool de
+    procesos, empezando por los N más grandes.
+    
+    Parámetros:
+    - jobs: Cantidad de procesos (por defecto 1)
+    
+    Retorna:
+    - Lista con los tres barridos, en el orden de las tablas
+    """
+    rangos = [(10, 100, 10), (100, 1000, 100), (1000, 10000, 1000)]
+    grillas = [list(range(n_inicio, n_fin + 1, incremento)) for n_inicio, n_fin, incremento in rangos]
+    filas, tiempos = ejecutar_grillas(_fila_metodos, grillas, jobs, costo=lambda n: n, cronometrar=True)
+    return [_armar_barrido_metodos(*rango, filas_rango, tiempos_rango)
+            for rango, filas_rango, tiempos_rango in zip(rangos, filas, tiempos)]
+
+
+def generar_tabla_comparativa_metodos(n_inicio, n_fin, incremento, numero_tabla, barrido=None):
     """
-    Genera una tabla comparativa de los tres métodos para un rango específico de N.
+    Genera una tabla comparativa de los tres métodos (y Simpson) para un rango específico de N.
     
     Parámetros:
     - n_inicio: Valor inicial de N
     - n_fin: Valor final de N
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para el título
+    - barrido: Resultado de calcular_barrido_metodos (si es None se calcula)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido_metodos(n_inicio, n_fin, incremento)
     
-    print("\n" + "=" * 120)
+    print("\n" + "=" * 155)
     print(f"TABLA {numero_tabla}: Comparación de métodos - N variando de {n_inicio} a {n_fin} (incremento de {incremento})")
-    print("=" * 120)
-    print(f"{'N':>6} | {'Rectángulos':>15} | {'Residuo':>12} | {'Trapecio':>15} | {'Residuo':>12} | {'Punto Medio':>15} | {'Residuo':>12}")
-    print("-" * 120)
-    
-    for n in range(n_inicio, n_fin + 1, incremento):
-        # Calcular aproximaciones con cada método
-        aprox_rect = metodo_rectangulos(n)
-        aprox_trap = metodo_trapecio(n)
-        aprox_medio = metodo_punto_medio(n)
-        
-        # Calcular residuos
-        residuo_rect = abs(aprox_rect - valor_pi)
-        residuo_trap = abs(aprox_trap - valor_pi)
-        residuo_medio = abs(aprox_medio - valor_pi)
+    print("=" * 155)
+    print(f"{'N':>6} | {'Rectángulos':>15} | {'Residuo':>12} | {'Trapecio':>15} | {'Residuo':>12} | {'Punto Medio':>15} | {'Residuo':>12} | {'Simpson':>15} | {'Residuo':>12}")
+    print("-" * 155)
+    
+    for i, n in enumerate(barrido['n']):
+        aprox_rect, residuo_rect = barrido['rectangulos'][i], barrido['residuo_rect'][i]
+        aprox_trap, residuo_trap = barrido['trapecio'][i], barrido['residuo_trap'][i]
+        aprox_medio, residuo_medio = barrido['punto_medio'][i], barrido['residuo_medio'][i]
+        aprox_simpson, residuo_simpson = barrido['simpson'][i], barrido['residuo_simpson'][i]
         
-        print(f"{n:6d} | {aprox_rect:15.10f} | {residuo_rect:12.10f} | {aprox_trap:15.10f} | {residuo_trap:12.10f} | {aprox_medio:15.10f} | {residuo_medio:12.10f}")
+        print(f"{n:6d} | {aprox_rect:15.10f} | {residuo_rect:12.10f} | {aprox_trap:15.10f} | {residuo_trap:12.10f} | {aprox_medio:15.10f} | {residuo_medio:12.10f} | {aprox_simpson:15.10f} | {residuo_simpson:12.10f}")
 
 
-def generar_tablas_comparativas_metodos():
+def generar_tablas_comparativas_metodos(barridos=None):
     """
     Genera tres tablas comparativas de los métodos de integración.
+    
+    Parámetros:
+    - barridos: Resultado de calcular_barridos_metodos (si es None se calcula)
     """
+    if barridos is None:
+        barridos = calcular_barridos_metodos()
+    
     # Tabla 1: N de 10 a 100, variando de 10 en 10
-    generar_tabla_comparativa_metodos(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1)
+    generar_tabla_comparativa_metodos(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, barrido=barridos[0])
     
     # Tabla 2: N de 100 a 1000, variando de 100 en 100
-    generar_tabla_comparativa_metodos(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2)
+    generar_tabla_comparativa_metodos(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, barrido=barridos[1])
     
     # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-    generar_tabla_comparativa_metodos(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3)
+    generar_tabla_comparativa_metodos(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, barrido=barridos[2])
     
     # Mostrar valor de referencia de π
-    print("\n" + "=" * 120)
+    print("\n" + "=" * 155)
     print(f"Valor de π (referencia): {math.pi:.10f}")
-    print("=" * 120)
+    print("=" * 155)
 
 
-def generar_tabla_individual_csv_metodos(archivo_csv, n_inicio, n_fin, incremento, numero_tabla):
+def generar_tabla_individual_csv_metodos(archivo_csv, n_inicio, n_fin, incremento, numero_tabla, barrido=None):
     """
     Genera una tabla comparativa de métodos y la escribe en un archivo CSV.
     
@@ -208,34 +749,36 @@ def generar_tabla_individual_csv_metodos(archivo_csv, n_inicio, n_fin, increment
     - n_fin: Valor final de N
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para identificación
+    - barrido: Resultado de calcular_barrido_metodos (si es None se calcula)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido_metodos(n_inicio, n_fin, incremento)
     
     # Escribir encabezado de la tabla
     archivo_csv.writerow([])  # Línea en blanco
     archivo_csv.writerow([f"TABLA {numero_tabla}: N variando de {n_inicio} a {n_fin} (incremento de {incremento})"])
-    archivo_csv.writerow(['N', 'Rectángulos', 'Residuo Rect', 'Trapecio', 'Residuo Trap', 'Punto Medio', 'Residuo Medio'])
-    
-    # Calcular y escribir los datos
-    for n in range(n_inicio, n_fin + 1, incremento):
-        aprox_rect = metodo_rectangulos(n)
-        aprox_trap = metodo_trapecio(n)
-        aprox_medio = metodo_punto_medio(n)
-        
-        residuo_rect = abs(aprox_rect - valor_pi)
-        residuo_trap = abs(aprox_trap - valor_pi)
-        residuo_medio = abs(aprox_medio - valor_pi)
-        
-        archivo_csv.writerow([n, aprox_rect, residuo_rect, aprox_trap, residuo_trap, aprox_medio, residuo_medio])
+    archivo_csv.writerow(['N', 'Rectángulos', 'Residuo Rect', 'Trapecio', 'Residuo Trap', 'Punto Medio', 'Residuo Medio',
+                          'Simpson', 'Residuo Simpson'])
+    
+    # Escribir los datos
+    for i, n in enumerate(barrido['n']):
+        archivo_csv.writerow([n, barrido['rectangulos'][i], barrido['residuo_rect'][i],
+                              barrido['trapecio'][i], barrido['residuo_trap'][i],
+                              barrido['punto_medio'][i], barrido['residuo_medio'][i],
+                              barrido['simpson'][i], barrido['residuo_simpson'][i]])
 
 
-def generar_tablas_csv_metodos(nombre_archivo='tablas_metodos.csv'):
+def generar_tablas_csv_metodos(nombre_archivo='tablas_metodos.csv', barridos=None):
     """
     Genera un archivo CSV con las tres tablas comparativas de métodos.
     
     Parámetros:
     - nombre_archivo: Nombre del archivo CSV a crear
+    - barridos: Resultado de calcular_barridos_metodos (si es None se calcula)
     """
+    if barridos is None:
+        barridos = calcular_barridos_metodos()
+    
     with open(nombre_archivo, 'w', newline='', encoding='utf-8') as archivo:
         writer = csv.writer(archivo)
         
@@ -244,158 +787,127 @@ def generar_tablas_csv_metodos(nombre_archivo='tablas_metodos.csv'):
         writer.writerow([f'Valor de π (referencia): {math.pi:.10f}'])
         
         # Tabla 1: N de 10 a 100, variando de 10 en 10
-        generar_tabla_individual_csv_metodos(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1)
+        generar_tabla_individual_csv_metodos(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, barrido=barridos[0])
         
         # Tabla 2: N de 100 a 1000, variando de 100 en 100
-        generar_tabla_individual_csv_metodos(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2)
+        generar_tabla_individual_csv_metodos(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, barrido=barridos[1])
         
         # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-        generar_tabla_individual_csv_metodos(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3)
+        generar_tabla_individual_csv_metodos(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, barrido=barridos[2])
     
     print(f"\n✓ Archivo CSV generado: {nombre_archivo}")
 
 
+def generar_tablas_columnares_metodos(directorio='tablas_metodos_columnas', barridos=None):
+    """
+    Escribe las tres tablas de métodos en formato columnar (ver
+    resultados_columnares.py), con los valores en precisión completa y el
+    tiempo de cada fila (los cuatro métodos de un N se calculan juntos).
+    
+    Parámetros:
+    - directorio: Directorio de salida
+    - barridos: Resultado de calcular_barridos_metodos (si es None se calcula)
+    """
+    if barridos is None:
+        barridos = calcular_barridos_metodos()
+    
+    guardar_barridos(directorio, barridos,
+                     {'rectangulos': ('rectangulos', 'residuo_rect', None),
+                      'trapecio': ('trapecio', 'residuo_trap', None),
+                      'punto_medio': ('punto_medio', 'residuo_medio', None),
+                      'simpson': ('simpson', 'residuo_simpson', None)},
+                     {'descripcion': 'Métodos de integración de f(x) = 2√(1-x²) en [-1, 1]', 'valor_exacto': math.pi})
+    
+    print(f"\n✓ Resultados columnares generados: {directorio}")
+
+
 # ============================================================================
 # EJERCICIO 3.3: Gráficas de convergencia de los métodos
 # ============================================================================
 
-def graficar_convergencia_metodos():
+def _series_metodos(barrido, tamano_marcador, claves=('rectangulos', 'trapecio', 'punto_medio'), referencia=True):
+    """
+    Series de los tres métodos (y la referencia π) para un barrido.
+    Rectángulos usa un marcador un punto más grande, como en las gráficas originales.
+    """
+    n_valores = barrido['n']
+    series = [
+        linea(n_valores, barrido[claves[0]], 'b-o', label='Rectángulos', linewidth=2.5, markersize=tamano_marcador + 1, alpha=0.7),
+        linea(n_valores, barrido[claves[1]], 'r--s', label='Trapecio', linewidth=2, markersize=tamano_marcador, alpha=0.8),
+        linea(n_valores, barrido[claves[2]], 'm-^', label='Punto Medio', linewidth=2, markersize=tamano_marcador),
+    ]
+    if referencia:
+        series.append(linea(n_valores, [math.pi] * len(n_valores), 'g--', label='π (teórico)', linewidth=2.5))
+    return series
+
+
+def graficar_convergencia_metodos(barridos=None, ejecutor=None, esperar=True):
     """
     Genera gráficas mostrando la convergencia de los tres métodos hacia π.
     Crea gráficas separadas para diferentes rangos de N.
-    """
-    valor_pi = math.pi
     
-    # Configuración general de estilo
-    plt.style.use('seaborn-v0_8-darkgrid')
+    Las gráficas se describen con especificaciones (ver renderizado.py) y se
+    dibujan con el lienzo Agg, en paralelo si se pasa un ejecutor.
+    
+    Parámetros:
+    - barridos: Resultado de calcular_barridos_metodos (si es None se calcula)
+    - ejecutor: Pool de crear_ejecutor_renderizado para dibujar en paralelo (opcional)
+    - esperar: Si es False no espera a que se terminen de dibujar (ver esperar_figuras)
+    
+    Retorna:
+    - Lista de figuras pendientes (ver enviar_figuras)
+    """
+    if barridos is None:
+        barridos = calcular_barridos_metodos()
     
-    # Gráfica 1: N de 10 a 100, variando de 10 en 10
     print("\nGenerando gráficas de convergencia...")
-    n_valores_1 = list(range(10, 101, 10))
-    aprox_rect_1 = [metodo_rectangulos(n) for n in n_valores_1]
-    aprox_trap_1 = [metodo_trapecio(n) for n in n_valores_1]
-    aprox_medio_1 = [metodo_punto_medio(n) for n in n_valores_1]
-    pi_valores_1 = [valor_pi] * len(n_valores_1)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_1, aprox_rect_1, 'b-o', label='Rectángulos', linewidth=2.5, markersize=7, alpha=0.7)
-    plt.plot(n_valores_1, aprox_trap_1, 'r--s', label='Trapecio', linewidth=2, markersize=6, alpha=0.8)
-    plt.plot(n_valores_1, aprox_medio_1, 'm-^', label='Punto Medio', linewidth=2, markersize=6)
-    plt.plot(n_valores_1, pi_valores_1, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de métodos de integración hacia π\n(N = 10 a 100)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_metodos_10_100.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_metodos_10_100.png")
-    
-    # Gráfica 2: N de 100 a 1000, variando de 100 en 100
-    n_valores_2 = list(range(100, 1001, 100))
-    aprox_rect_2 = [metodo_rectangulos(n) for n in n_valores_2]
-    aprox_trap_2 = [metodo_trapecio(n) for n in n_valores_2]
-    aprox_medio_2 = [metodo_punto_medio(n) for n in n_valores_2]
-    pi_valores_2 = [valor_pi] * len(n_valores_2)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_2, aprox_rect_2, 'b-o', label='Rectángulos', linewidth=2.5, markersize=7, alpha=0.7)
-    plt.plot(n_valores_2, aprox_trap_2, 'r--s', label='Trapecio', linewidth=2, markersize=6, alpha=0.8)
-    plt.plot(n_valores_2, aprox_medio_2, 'm-^', label='Punto Medio', linewidth=2, markersize=6)
-    plt.plot(n_valores_2, pi_valores_2, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de métodos de integración hacia π\n(N = 100 a 1000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_metodos_100_1000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_metodos_100_1000.png")
-    
-    # Gráfica 3: N de 1000 a 10000, variando de 1000 en 1000
-    n_valores_3 = list(range(1000, 10001, 1000))
-    aprox_rect_3 = [metodo_rectangulos(n) for n in n_valores_3]
-    aprox_trap_3 = [metodo_trapecio(n) for n in n_valores_3]
-    aprox_medio_3 = [metodo_punto_medio(n) for n in n_valores_3]
-    pi_valores_3 = [valor_pi] * len(n_valores_3)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_3, aprox_rect_3, 'b-o', label='Rectángulos', linewidth=2.5, markersize=7, alpha=0.7)
-    plt.plot(n_valores_3, aprox_trap_3, 'r--s', label='Trapecio', linewidth=2, markersize=6, alpha=0.8)
-    plt.plot(n_valores_3, aprox_medio_3, 'm-^', label='Punto Medio', linewidth=2, markersize=6)
-    plt.plot(n_valores_3, pi_valores_3, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de métodos de integración hacia π\n(N = 1000 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_metodos_1000_10000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_metodos_1000_10000.png")
+    figuras = []
+    
+    # Gráficas 1 a 3: una por rango de N
+    rangos = ['N = 10 a 100', 'N = 100 a 1000', 'N = 1000 a 10000']
+    archivos = ['grafica_metodos_10_100.png', 'grafica_metodos_100_1000.png', 'grafica_metodos_1000_10000.png']
+    
+    for barrido, rango, archivo in zip(barridos, rangos, archivos):
+        figuras.append(figura(archivo, (10, 6), _series_metodos(barrido, 6),
+                              titulo=f'Convergencia de métodos de integración hacia π\n({rango})',
+                              xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+                              leyenda={'fontsize': 10}, grilla={'alpha': 0.3}))
     
     # Gráfica 4: Visión completa con todos los valores
-    n_valores_todos = n_valores_1 + n_valores_2 + n_valores_3
-    aprox_rect_todos = aprox_rect_1 + aprox_rect_2 + aprox_rect_3
-    aprox_trap_todos = aprox_trap_1 + aprox_trap_2 + aprox_trap_3
-    aprox_medio_todos = aprox_medio_1 + aprox_medio_2 + aprox_medio_3
-    pi_valores_todos = [valor_pi] * len(n_valores_todos)
-    
-    plt.figure(figsize=(12, 7))
-    plt.plot(n_valores_todos, aprox_rect_todos, 'b-o', label='Rectángulos', linewidth=2.5, markersize=5, alpha=0.7)
-    plt.plot(n_valores_todos, aprox_trap_todos, 'r--s', label='Trapecio', linewidth=2, markersize=4, alpha=0.8)
-    plt.plot(n_valores_todos, aprox_medio_todos, 'm-^', label='Punto Medio', linewidth=2, markersize=4)
-    plt.plot(n_valores_todos, pi_valores_todos, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de métodos de integración hacia π\n(Visión completa: N = 10 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_metodos_completa.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_metodos_completa.png")
+    barrido_todos = {clave: barridos[0][clave] + barridos[1][clave] + barridos[2][clave]
+                     for clave in ('n', 'rectangulos', 'trapecio', 'punto_medio', 'simpson',
+                                   'residuo_rect', 'residuo_trap', 'residuo_medio', 'residuo_simpson')}
+    
+    figuras.append(figura('grafica_metodos_completa.png', (12, 7), _series_metodos(barrido_todos, 4),
+                          titulo='Convergencia de métodos de integración hacia π\n(Visión completa: N = 10 a 10000)',
+                          xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+                          leyenda={'fontsize': 11}, grilla={'alpha': 0.3}))
     
     # Gráfica 5: Zoom en rango pequeño (10 a 50) para ver mejor el comportamiento inicial
-    n_valores_zoom = list(range(10, 51, 5))
-    aprox_rect_zoom = [metodo_rectangulos(n) for n in n_valores_zoom]
-    aprox_trap_zoom = [metodo_trapecio(n) for n in n_valores_zoom]
-    aprox_medio_zoom = [metodo_punto_medio(n) for n in n_valores_zoom]
-    pi_valores_zoom = [valor_pi] * len(n_valores_zoom)
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(n_valores_zoom, aprox_rect_zoom, 'b-o', label='Rectángulos', linewidth=2.5, markersize=8, alpha=0.7)
-    plt.plot(n_valores_zoom, aprox_trap_zoom, 'r--s', label='Trapecio', linewidth=2, markersize=7, alpha=0.8)
-    plt.plot(n_valores_zoom, aprox_medio_zoom, 'm-^', label='Punto Medio', linewidth=2, markersize=7)
-    plt.plot(n_valores_zoom, pi_valores_zoom, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia de métodos de integración hacia π\n(Zoom: N = 10 a 50, para observar comportamiento inicial)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_metodos_zoom_10_50.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_metodos_zoom_10_50.png")
+    barrido_zoom = calcular_barrido_metodos(n_inicio=10, n_fin=50, incremento=5)
     
-    # Gráfica 6: Gráfica de residuos (errores) - escala logarítmica
-    residuos_rect = [abs(aprox - valor_pi) for aprox in aprox_rect_todos]
-    residuos_trap = [abs(aprox - valor_pi) for aprox in aprox_trap_todos]
-    residuos_medio = [abs(aprox - valor_pi) for aprox in aprox_medio_todos]
-    
-    plt.figure(figsize=(12, 7))
-    plt.semilogy(n_valores_todos, residuos_rect, 'b-o', label='Rectángulos', linewidth=2.5, markersize=5, alpha=0.7)
-    plt.semilogy(n_valores_todos, residuos_trap, 'r--s', label='Trapecio', linewidth=2, markersize=4, alpha=0.8)
-    plt.semilogy(n_valores_todos, residuos_medio, 'm-^', label='Punto Medio', linewidth=2, markersize=4)
-    plt.xlabel('N (tamaño de partición)', fontsize=12)
-    plt.ylabel('Residuo (error) - Escala logarítmica', fontsize=12)
-    plt.title('Evolución del residuo |aproximación - π| con diferentes métodos\n(Escala logarítmica)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3, which='both')
-    plt.tight_layout()
-    plt.savefig('grafica_residuos_metodos.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_residuos_metodos.png")
+    figuras.append(figura('grafica_metodos_zoom_10_50.png', (10, 6), _series_metodos(barrido_zoom, 7),
+                          titulo='Convergencia de métodos de integración hacia π\n(Zoom: N = 10 a 50, para observar comportamiento inicial)',
+                          xlabel='N (tamaño de partición)', ylabel='Valor de la aproximación',
+                          leyenda={'fontsize': 10}, grilla={'alpha': 0.3}))
     
-    print("\n" + "=" * 70)
-    print("Todas las gráficas han sido generadas exitosamente")
-    print("=" * 70)
+    # Gráfica 6: Gráfica de residuos (errores) - escala logarítmica
+    figuras.append(figura('grafica_residuos_metodos.png', (12, 7),
+                          _series_metodos(barrido_todos, 4, ('residuo_rect', 'residuo_trap', 'residuo_medio'),
+                                          referencia=False),
+                          titulo='Evolución del residuo |aproximación - π| con diferentes métodos\n(Escala logarítmica)',
+                          xlabel='N (tamaño de partición)', ylabel='Residuo (error) - Escala logarítmica',
+                          leyenda={'fontsize': 11}, grilla={'alpha': 0.3, 'which': 'both'}, escala_y='log'))
+    
+    pendientes = enviar_figuras(figuras, ejecutor)
+    
+    if esperar:
+        esperar_figuras(pendientes)
+        print("\n" + "=" * 70)
+        print("Todas las gráficas han sido generadas exitosamente")
+        print("=" * 70)
+    
+    return pendientes
 
 
 # ============================================================================
@@ -403,6 +915,8 @@ def graficar_convergencia_metodos():
 # ============================================================================
 
 if __name__ == "__main__":
+    jobs = leer_argumento_jobs("Ejercicio 3: comparación de métodos de integración numérica")
+    
     # EJERCICIO 3.1: Prueba inicial de los tres métodos
     print("\n")
     print("=" * 80)
@@ -418,19 +932,19 @@ if __name__ == "__main__":
     
     n_valores = [10, 50, 100, 500, 1000, 5000, 10000]
     
-    print(f"\n{'N':>6} | {'Rectángulos':>15} | {'Residuo':>12} | {'Trapecio':>15} | {'Residuo':>12} | {'Pto Medio':>15} | {'Residuo':>12}")
-    print("-" * 110)
+    print(f"\n{'N':>6} | {'Rectángulos':>15} | {'Residuo':>12} | {'Trapecio':>15} | {'Residuo':>12} | {'Pto Medio':>15} | {'Residuo':>12} | {'Simpson':>15} | {'Residuo':>12}")
+    print("-" * 145)
     
     for n in n_valores:
-        rect = metodo_rectangulos(n)
-        trap = metodo_trapecio(n)
-        medio = metodo_punto_medio(n)
+        # Los tres métodos (y Simpson) comparten la partición y las evaluaciones
+        rect, trap, medio, simpson = metodos_fusionados(n)
         
         res_rect = abs(rect - valor_pi)
         res_trap = abs(trap - valor_pi)
         res_medio = abs(medio - valor_pi)
+        res_simpson = abs(simpson - valor_pi)
         
-        print(f"{n:6d} | {rect:15.10f} | {res_rect:12.10f} | {trap:15.10f} | {res_trap:12.10f} | {medio:15.10f} | {res_medio:12.10f}")
+        print(f"{n:6d} | {rect:15.10f} | {res_rect:12.10f} | {trap:15.10f} | {res_trap:12.10f} | {medio:15.10f} | {res_medio:12.10f} | {simpson:15.10f} | {res_simpson:12.10f}")
     
     print("\n" + "=" * 80)
     print(f"Valor de π (referencia): {valor_pi:.10f}")
@@ -441,18 +955,36 @@ if __name__ == "__main__":
     print("=" * 80)
     print("EJERCICIO 3.2: TABLAS COMPARATIVAS DE MÉTODOS")
     print("=" * 80)
-    generar_tablas_comparativas_metodos()
+    # Los barridos se calculan una sola vez y los usan las tablas, el CSV y las gráficas
+    barridos = calcular_barridos_metodos(jobs)
+    
+    # Las gráficas se empiezan a dibujar en paralelo mientras se escriben las tablas
+    ejecutor = crear_ejecutor_renderizado(jobs)
+    graficas = graficar_convergencia_metodos(barridos, ejecutor, esperar=False)
+    
+    generar_tablas_comparativas_metodos(barridos)
     
     # Generar también archivo CSV con las tablas
     try:
-        generar_tablas_csv_metodos('tablas_metodos.csv')
+        generar_tablas_csv_metodos('tablas_metodos.csv', barridos)
     except PermissionError:
         print("\n⚠ No se pudo generar el archivo CSV (el archivo puede estar abierto en otro programa)")
     
+    # Y en formato columnar (un .npy por columna), para analizar los resultados sin parsear texto
+    try:
+        generar_tablas_columnares_metodos('tablas_metodos_columnas', barridos)
+    except PermissionError:
+        print("\n⚠ No se pudieron generar los resultados columnares (sin permiso de escritura)")
+    
     # EJERCICIO 3.3: Generar gráficas de convergencia de los métodos
     print("\n\n")
     print("=" * 80)
     print("EJERCICIO 3.3: GRÁFICAS DE CONVERGENCIA DE MÉTODOS")
     print("=" * 80)
-    graficar_convergencia_metodos()
+    esperar_figuras(graficas)
+    if ejecutor is not None:
+        ejecutor.shutdown()
+    print("\n" + "=" * 70)
+    print("Todas las gráficas han sido generadas exitosamente")
+    print("=" * 70)
 
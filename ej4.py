@@ -1,26 +1,40 @@
 import math
 import random
 import csv
-import matplotlib.pyplot as plt
+from statistics import NormalDist
 import numpy as np
-
-# Función que estamos estudiando
-def funcion(x):
-    """
-    Calcula f(x) = 2 * sqrt(1 - x^2)
-    Esta función representa un semicírculo de radio 1.
-    """
-    result = 2 * (math.sqrt(1 - (x**2)))
-    return result
-
+from cache_resultados import memoizar_en_disco
+from barrido_paralelo import ejecutar_en_paralelo, ejecutar_grillas, crear_parser
+from integrandos import obtener_integrando, evaluar, integrando_cacheable
+from resultados_columnares import guardar_barridos
+from renderizado import ESTILO, figura, linea, error, crear_ejecutor_renderizado, enviar_figuras, esperar_figuras
 
 # ============================================================================
 # EJERCICIO 4 (BONUS): Integración Monte Carlo
 # ============================================================================
+#
+# Los métodos reciben integrando= (ver integrandos.py), por defecto el
+# semicírculo. Acierto o fallo sortea los puntos en el rectángulo
+# dominio × [0, cota], que para el semicírculo es [-1, 1] × [0, 2].
+
+def _caja(integrando):
+    """
+    Rectángulo [a, b] × [0, cota] donde acierto o fallo sortea los puntos.
+    
+    Retorna:
+    - (a, b, cota)
+    """
+    if integrando['cota'] is None:
+        raise ValueError(f"El integrando {integrando['nombre']} no declara una cota: "
+                         "no se puede usar acierto o fallo")
+    a, b = integrando['dominio']
+    return a, b, integrando['cota']
 
-def metodo_montecarlo(n):
+
+def metodo_montecarlo(n, integrando='semicirculo'):
     """
-    Método de Monte Carlo para aproximar la integral de f(x) = 2*sqrt(1-x²) en [-1, 1].
+    Método de Monte Carlo para aproximar la integral de f(x) = 2*sqrt(1-x²) en [-1, 1]
+    (o la del integrando indicado en su dominio).
     
     El método consiste en:
     1. Generar n puntos aleatorios (x, y) en el rectángulo [-1, 1] × [0, 2]
@@ -29,29 +43,33 @@ def metodo_montecarlo(n):
     
     Parámetros:
     - n: Cantidad de puntos aleatorios a generar
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
     
     Retorna:
     - Aproximación de π usando el método de Monte Carlo
     """
+    integrando = obtener_integrando(integrando)
+    a, b, cota = _caja(integrando)
+    f = integrando['escalar']
     puntos_debajo = 0
     
     # Generar n puntos aleatorios
     for _ in range(n):
         # Generar coordenadas aleatorias en el rectángulo [-1, 1] × [0, 2]
-        x = random.uniform(-1.0, 1.0)
-        y = random.uniform(0.0, 2.0)
+        x = random.uniform(a, b)
+        y = random.uniform(0.0, cota)
         
         # Verificar si el punto está en el dominio de la función
-        if -1.0 < x < 1.0:
+        if a < x < b:
             # Calcular el valor de la función en x
-            f_x = funcion(x)
+            f_x = f(x)
             
             # Verificar si el punto (x, y) está debajo de la curva
             if y <= f_x:
                 puntos_debajo += 1
     
-    # El área del rectángulo es base × altura = 2 × 2 = 4
-    area_rectangulo = 2.0 * 2.0
+    # El área del rectángulo es base × altura (2 × 2 = 4 para el semicírculo)
+    area_rectangulo = (b - a) * cota
     
     # Estimar el área bajo la curva
     area_estimada = (puntos_debajo / n) * area_rectangulo
@@ -59,11 +77,1077 @@ def metodo_montecarlo(n):
     return area_estimada
 
 
+def metodo_montecarlo_media(n, integrando='semicirculo'):
+    """
+    Método de Monte Carlo de la media muestral para aproximar la integral de
+    f(x) = 2*sqrt(1-x²) en [-1, 1] (o la del integrando indicado en su dominio).
+    
+    En lugar de sortear un punto (x, y) y solo preguntar si cae debajo de la
+    curva, se usa directamente el valor f(x):
+    1. Generar n valores aleatorios x uniformes en [-1, 1]
+    2. Promediar f(x)
+    3. Estimar la integral como: longitud_intervalo × promedio = 2 × promedio
+    
+    Usa la mitad de números aleatorios que metodo_montecarlo y tiene menor
+    varianza: Var[2 f(x)] = 32/3 - π² ≈ 0.80 contra π (4 - π) ≈ 2.70.
+    
+    Parámetros:
+    - n: Cantidad de valores aleatorios a generar
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Aproximación de π usando el método de Monte Carlo de la media muestral
+    """
+    integrando = obtener_integrando(integrando)
+    a, b = integrando['dominio']
+    f = integrando['escalar']
+    suma = 0.0
+    
+    for _ in range(n):
+        x = random.uniform(a, b)
+        
+        # Fuera del dominio la función no está definida (se cuenta como 0)
+        if a < x < b:
+            suma += f(x)
+    
+    # La longitud del intervalo (2 para [-1, 1])
+    return (b - a) * suma / n
+
+
+# ============================================================================
+# Monte Carlo vectorizado (NumPy) por bloques
+# ============================================================================
+
+# Cantidad de puntos que se generan por bloque: acota la memoria sin importar n
+TAMANO_BLOQUE = 1_000_000
+
+
+def contar_aciertos(n, rng, tamano_bloque=TAMANO_BLOQUE, integrando='semicirculo'):
+    """
+    Genera n puntos (x, y) uniformes en [-1, 1] × [0, 2] (dominio × [0, cota])
+    por bloques y cuenta cuántos caen debajo de la curva, con la misma regla
+    que metodo_montecarlo.
+    
+    Parámetros:
+    - n: Cantidad de puntos aleatorios a generar
+    - rng: Generador numpy.random.Generator
+    - tamano_bloque: Cantidad máxima de puntos generados a la vez
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Cantidad de puntos debajo de la curva
+    """
+    integrando = obtener_integrando(integrando)
+    a, b, cota = _caja(integrando)
+    aciertos = 0
+    restantes = n
+    
+    while restantes > 0:
+        m = min(restantes, tamano_bloque)
+        x = rng.uniform(a, b, m)
+        y = rng.uniform(0.0, cota, m)
+        
+        # Punto dentro del dominio (-1 < x < 1) y debajo de la curva
+        debajo = (x > a) & (x < b) & (y <= evaluar(integrando, x))
+        aciertos += int(np.count_nonzero(debajo))
+        restantes -= m
+    
+    return aciertos
+
+
+def _semilla_cacheable(argumentos):
+    """
+    Solo es determinista (y por lo tanto se guarda en la caché) cuando hay
+    semilla, no se pasa un generador y el integrando es del registro.
+    """
+    return argumentos['seed'] is not None and argumentos['rng'] is None and integrando_cacheable(argumentos)
+
+
+@memoizar_en_disco(version=1, cacheable=_semilla_cacheable)
+def metodo_montecarlo_vectorizado(n, seed=None, rng=None, tamano_bloque=TAMANO_BLOQUE, integrando='semicirculo'):
+    """
+    Mismo estimador que metodo_montecarlo, pero generando los puntos con
+    numpy.random.Generator en bloques de tamano_bloque y contando los aciertos
+    con una comparación vectorizada. La memoria queda acotada por el tamaño del
+    bloque aunque n sea del orden de 1e9.
+    
+    Parámetros:
+    - n: Cantidad de puntos aleatorios a generar
+    - seed: Semilla para reproducibilidad (se ignora si se pasa rng)
+    - rng: Generador numpy.random.Generator ya creado (opcional)
+    - tamano_bloque: Cantidad máxima de puntos generados a la vez
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Aproximación de π usando el método de Monte Carlo
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    
+    # El área del rectángulo es base × altura (2 × 2 = 4 para el semicírculo)
+    a, b, cota = _caja(obtener_integrando(integrando))
+    area_rectangulo = (b - a) * cota
+    
+    return (contar_aciertos(n, rng, tamano_bloque, integrando) / n) * area_rectangulo
+
+
+def sumar_funcion(n, rng, tamano_bloque=TAMANO_BLOQUE, integrando='semicirculo'):
+    """
+    Genera n valores x uniformes en [-1, 1] (el dominio del integrando) por
+    bloques y suma f(x), con la misma regla que metodo_montecarlo_media.
+    
+    Parámetros:
+    - n: Cantidad de valores aleatorios a generar
+    - rng: Generador numpy.random.Generator
+    - tamano_bloque: Cantidad máxima de valores generados a la vez
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Suma de f(x) sobre los valores generados
+    """
+    integrando = obtener_integrando(integrando)
+    a, b = integrando['dominio']
+    suma = 0.0
+    restantes = n
+    
+    while restantes > 0:
+        m = min(restantes, tamano_bloque)
+        x = rng.uniform(a, b, m)
+        suma += float(evaluar(integrando, x).sum())
+        restantes -= m
+    
+    return suma
+
+
+@memoizar_en_disco(version=1, cacheable=_semilla_cacheable)
+def metodo_montecarlo_media_vectorizado(n, seed=None, rng=None, tamano_bloque=TAMANO_BLOQUE, integrando='semicirculo'):
+    """
+    Mismo estimador que metodo_montecarlo_media, vectorizado y por bloques.
+    
+    Parámetros:
+    - n: Cantidad de valores aleatorios a generar
+    - seed: Semilla para reproducibilidad (se ignora si se pasa rng)
+    - rng: Generador numpy.random.Generator ya creado (opcional)
+    - tamano_bloque: Cantidad máxima de valores generados a la vez
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Aproximación de π usando el método de Monte Carlo de la media muestral
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    
+    a, b = obtener_integrando(integrando)['dominio']
+    return (b - a) * sumar_funcion(n, rng, tamano_bloque, integrando) / n
+
+
+# Estimadores disponibles: (versión con el módulo random, versión vectorizada)
+ESTIMADORES = {
+    'acierto': (metodo_montecarlo, metodo_montecarlo_vectorizado),
+    'media': (metodo_montecarlo_media, metodo_montecarlo_media_vectorizado),
+}
+
+
+# ============================================================================
+# Monte Carlo en paralelo y reproducible
+# ============================================================================
+
+def _aciertos_bloque(argumento):
+    """
+    Cuenta los aciertos de un bloque con su propio generador.
+    Es una función de nivel de módulo para poder enviarla a otro proceso.
+    
+    Parámetros:
+    - argumento: Tupla (semilla, cantidad de puntos, integrando) donde semilla es
+      un numpy.random.SeedSequence independiente para el bloque
+    """
+    semilla, m, integrando = argumento
+    return contar_aciertos(m, np.random.default_rng(semilla), integrando=integrando)
+
+
+def metodo_montecarlo_paralelo(n, seed=None, jobs=1, tamano_bloque=TAMANO_BLOQUE, integrando='semicirculo'):
+    """
+    Monte Carlo repartido entre varios procesos, con resultados reproducibles.
+    
+    Los n puntos se dividen en bloques de tamano_bloque (la división no depende
+    de jobs). Cada bloque usa su propio flujo aleatorio, obtenido con
+    SeedSequence(seed).spawn(...), y los aciertos (enteros) se suman en forma
+    exacta. Por eso una misma semilla da la misma aproximación con cualquier
+    cantidad de procesos.
+    
+    Parámetros:
+    - n: Cantidad de puntos aleatorios a generar
+    - seed: Semilla raíz (si es None se toma entropía del sistema)
+    - jobs: Cantidad de procesos
+    - tamano_bloque: Cantidad de puntos de cada bloque
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el
+      semicírculo); se envía tal cual a los procesos, así que conviene pasar el nombre
+    
+    Retorna:
+    - Aproximación de π usando el método de Monte Carlo
+    """
+    a, b, cota = _caja(obtener_integrando(integrando))
+    
+    cantidad_bloques = -(-n // tamano_bloque)
+    semillas = np.random.SeedSequence(seed).spawn(cantidad_bloques)
+    argumentos = [(semillas[i], min(tamano_bloque, n - i * tamano_bloque), integrando)
+                  for i in range(cantidad_bloques)]
+    
+    aciertos = sum(ejecutar_en_paralelo(_aciertos_bloque, argumentos, jobs))
+    
+    return (aciertos / n) * ((b - a) * cota)
+
+
+# ============================================================================
+# Monte Carlo secuencial con varianza en línea y parada por intervalo de confianza
+# ============================================================================
+
+def montecarlo_secuencial(tol, confianza=0.95, tamano_lote=1_000, max_muestras=10**9, seed=None, rng=None,
+                          integrando='semicirculo'):
+    """
+    Monte Carlo que procesa las muestras por lotes y mantiene la media y la
+    varianza en línea (Welford, combinando cada lote con la fórmula de Chan).
+    Se detiene en cuanto el semiancho del intervalo de confianza queda por
+    debajo de tol, así que usa solo las muestras necesarias para esa precisión,
+    en lugar de fijar N de antemano y repetir la corrida para estimar la dispersión.
+    
+    El primer lote es un piloto de tamano_lote muestras. Con la desviación
+    estimada hasta el momento se calcula cuántas muestras faltan para llegar a
+    tol, y el lote siguiente pide esas (redondeadas a un múltiplo de tamano_lote
+    y como mucho TAMANO_BLOQUE por lote, para acotar la memoria). Así una
+    tolerancia grande no paga un lote fijo mucho mayor que lo necesario.
+    
+    Cada muestra vale el área del rectángulo (4 para el semicírculo) si el punto
+    cae debajo de la curva y 0 si no, de modo que su media es el mismo estimador
+    que metodo_montecarlo.
+    
+    Parámetros:
+    - tol: Semiancho máximo del intervalo de confianza
+    - confianza: Nivel de confianza del intervalo (por defecto 0.95)
+    - tamano_lote: Tamaño del lote piloto; los demás lotes son múltiplos de él
+    - max_muestras: Cantidad máxima de muestras
+    - seed: Semilla para reproducibilidad (se ignora si se pasa rng)
+    - rng: Generador numpy.random.Generator ya creado (opcional)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Diccionario con 'aproximacion', 'intervalo' (tupla inferior, superior),
+      'semiancho', 'desv_est' (de una muestra), 'muestras' y 'convergio'
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    
+    integrando = obtener_integrando(integrando)
+    a, b, cota = _caja(integrando)
+    area_rectangulo = (b - a) * cota
+    
+    z = NormalDist().inv_cdf(0.5 + confianza / 2.0)
+    
+    muestras = 0
+    media = 0.0
+    m2 = 0.0  # Suma de cuadrados de las desviaciones respecto de la media
+    semiancho = math.inf
+    lote_maximo = max(tamano_lote, TAMANO_BLOQUE // tamano_lote * tamano_lote)
+    m = tamano_lote
+    
+    while muestras < max_muestras:
+        m = min(m, max_muestras - muestras)
+        x = rng.uniform(a, b, m)
+        y = rng.uniform(0.0, cota, m)
+        valores = area_rectangulo * ((x > a) & (x < b) & (y <= evaluar(integrando, x)))
+        
+        # Combinar las estadísticas del lote con las acumuladas
+        media_lote = valores.mean()
+        m2_lote = float(((valores - media_lote) ** 2).sum())
+        delta = media_lote - media
+        total = muestras + m
+        media += delta * m / total
+        m2 += m2_lote + delta * delta * muestras * m / total
+        muestras = total
+        
+        if muestras > 1:
+            semiancho = z * math.sqrt(m2 / (muestras - 1) / muestras)
+            if semiancho < tol:
+                break
+            
+            # Muestras que faltan según la desviación estimada: n ≈ (z s / tol)²
+            necesarias = math.ceil((z / tol) ** 2 * m2 / (muestras - 1)) - muestras
+            m = min(max(-(-necesarias // tamano_lote), 1) * tamano_lote, lote_maximo)
+        else:
+            m = tamano_lote
+    
+    media = float(media)
+    
+    return {
+        'aproximacion': media,
+        'intervalo': (media - semiancho, media + semiancho),
+        'semiancho': semiancho,
+        'desv_est': math.sqrt(m2 / (muestras - 1)) if muestras > 1 else math.inf,
+        'muestras': muestras,
+        'convergio': semiancho < tol,
+    }
+
+
+# ============================================================================
+# Reducción de varianza
+# ============================================================================
+#
+# Cada modo devuelve la aproximación y la varianza por muestra, es decir, la
+# varianza del estimador multiplicada por n. Así los modos se comparan con el
+# mismo presupuesto de n puntos: un factor de reducción 10 significa que hacen
+# falta 10 veces menos puntos para la misma precisión.
+#
+# Todos los modos reciben el diccionario del integrando; las fórmulas de los
+# comentarios son las del semicírculo en [-1, 1].
+
+def _reduccion_acierto(n, rng, integrando):
+    """
+    Acierto o fallo sobre [-1, 1] × [0, 2] (el estimador de metodo_montecarlo).
+    Cada muestra vale 4 o 0 (el área A del rectángulo o 0), así que su varianza
+    es 16 p (1 - p) = A² p (1 - p).
+    """
+    a, b, cota = _caja(integrando)
+    area_rectangulo = (b - a) * cota
+    
+    p = contar_aciertos(n, rng, integrando=integrando) / n
+    return area_rectangulo * p, area_rectangulo * area_rectangulo * p * (1.0 - p)
+
+
+def _reduccion_media(n, rng, integrando):
+    """
+    Media muestral de (b - a) f(x) con x uniforme (el estimador 'media', sin
+    reducción de varianza). Es la referencia de factor_media; en el
+    semicírculo su varianza por muestra es 32/3 - π² ≈ 0.80.
+    """
+    a, b = integrando['dominio']
+    valores = (b - a) * evaluar(integrando, rng.uniform(a, b, n))
+    
+    return float(valores.mean()), float(valores.var(ddof=1))
+
+
+def _reduccion_antitetica(n, rng, integrando):
+    """
+    Variables antitéticas: como f es par, la integral es 2 ∫[0,1] f(x) dx.
+    Se toma u uniforme en [0, 1) y se evalúa en u y en 1 - u; como f es
+    decreciente en [0, 1], los dos valores están correlacionados negativamente.
+    Si el integrando no es par respecto del centro del dominio, los pares son
+    x y a + b - x sobre todo el dominio.
+    """
+    a, b = integrando['dominio']
+    pares = max(1, n // 2)
+    u = rng.random(pares)
+    
+    if integrando['simetria'] == 'par':
+        # Mitad derecha del dominio, [centro, b]
+        centro, semiancho = (a + b) / 2.0, (b - a) / 2.0
+        valores = semiancho * (evaluar(integrando, centro + semiancho * u)
+                               + evaluar(integrando, centro + semiancho * (1.0 - u)))
+    else:
+        valores = (b - a) / 2.0 * (evaluar(integrando, a + (b - a) * u)
+                                   + evaluar(integrando, a + (b - a) * (1.0 - u)))
+    
+    # Cada par usa dos puntos: la varianza por muestra es 2 × la varianza del par
+    return float(valores.mean()), 2.0 * float(valores.var(ddof=1))
+
+
+def _reduccion_control(n, rng, integrando):
+    """
+    Variable de control: media muestral de 2 f(x) con x uniforme en [-1, 1],
+    corregida con g(x) = x², cuya media exacta es 1/3. En general g es el
+    cuadrado de la distancia al centro del dominio, con media h²/3 (h el
+    semiancho). El coeficiente β se ajusta con la covarianza de la propia muestra.
+    """
+    a, b = integrando['dominio']
+    centro, semiancho = (a + b) / 2.0, (b - a) / 2.0
+    
+    x = rng.uniform(a, b, n)
+    valores = (b - a) * evaluar(integrando, x)
+    control = (x - centro) * (x - centro)
+    
+    covarianza = np.cov(valores, control)
+    beta = covarianza[0, 1] / covarianza[1, 1]
+    corregidos = valores - beta * (control - semiancho * semiancho / 3.0)
+    
+    return float(corregidos.mean()), float(corregidos.var(ddof=1))
+
+
+def _reduccion_estratificada(n, rng, integrando, puntos_por_estrato=2):
+    """
+    Muestreo estratificado en x: [-1, 1] se divide en estratos de igual ancho y
+    en cada uno se toman puntos_por_estrato puntos uniformes. La varianza se
+    estima dentro de cada estrato (por eso hacen falta al menos dos puntos).
+    """
+    a, b = integrando['dominio']
+    estratos = max(1, n // puntos_por_estrato)
+    ancho = (b - a) / estratos
+    
+    u = rng.random((estratos, puntos_por_estrato))
+    x = a + (np.arange(estratos)[:, None] + u) * ancho
+    valores = (b - a) * evaluar(integrando, x)
+    
+    # Var(estimador) = Σ (1/H)² s_h² / n_h, con H estratos de igual peso
+    varianza_estimador = valores.var(axis=1, ddof=1).sum() / (estratos * estratos * puntos_por_estrato)
+    
+    return float(valores.mean()), float(varianza_estimador * estratos * puntos_por_estrato)
+
+
+def _reduccion_importancia(n, rng, integrando, peso=0.8):
+    """
+    Muestreo por importancia con la mezcla p(x) = w (2/π) √(1 - x²) + (1 - w) / 2:
+    con probabilidad w = peso el punto sale de la densidad del semicírculo
+    (2 Beta(3/2, 3/2) - 1) y si no, uniforme en [-1, 1]. Cada muestra vale
+    f(x) / p(x). La parte uniforme acota f / p por 2 f / (1 - w), así la
+    varianza es finita aunque f no se anule en los bordes; con w = 0.8 la
+    varianza por muestra del semicírculo baja de 32/3 - π² ≈ 0.80 (la del
+    estimador 'media') a ≈ 0.054. La densidad ¾ (1 - x²) que se usaba antes no
+    ganaba nada: su varianza también es ≈ 0.80. En otro dominio se usa la misma
+    densidad trasladada al centro.
+    """
+    a, b = integrando['dominio']
+    centro, semiancho = (a + b) / 2.0, (b - a) / 2.0
+    
+    de_la_curva = rng.random(n) < peso
+    u = np.where(de_la_curva, 2.0 * rng.beta(1.5, 1.5, n) - 1.0, rng.uniform(-1.0, 1.0, n))
+    densidad = peso * (2.0 / math.pi) * np.sqrt(np.maximum(1.0 - u * u, 0.0)) + (1.0 - peso) / 2.0
+    valores = semiancho * evaluar(integrando, centro + semiancho * u) / densidad
+    
+    return float(valores.mean()), float(valores.var(ddof=1))
+
+
+MODOS_REDUCCION = {
+    'acierto': _reduccion_acierto,
+    'media': _reduccion_media,
+    'antitetica': _reduccion_antitetica,
+    'control': _reduccion_control,
+    'estratificada': _reduccion_estratificada,
+    'importancia': _reduccion_importancia,
+}
+
+
+def metodo_montecarlo_reduccion(n, modo='antitetica', seed=None, rng=None, integrando='semicirculo'):
+    """
+    Monte Carlo con una técnica de reducción de varianza. Informa además el
+    factor de reducción respecto del acierto o fallo de metodo_montecarlo,
+    cuya varianza por muestra es 16 p (1 - p) con p = I / 4.
+    
+    Parámetros:
+    - n: Cantidad de puntos (evaluaciones de la función)
+    - modo: 'acierto', 'media', 'antitetica', 'control', 'estratificada' o 'importancia'
+    - seed: Semilla para reproducibilidad (se ignora si se pasa rng)
+    - rng: Generador numpy.random.Generator ya creado (opcional)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Diccionario con 'aproximacion', 'varianza' (por muestra), 'error_estandar'
+      y 'factor_reduccion' (None si el integrando no declara una cota)
+    """
+    if modo not in MODOS_REDUCCION:
+        raise ValueError(f"Modo de reducción de varianza desconocido: {modo}")
+    
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    
+    integrando = obtener_integrando(integrando)
+    aproximacion, varianza = MODOS_REDUCCION[modo](n, rng, integrando)
+    
+    # Varianza del acierto o fallo para la misma integral (estimada con este resultado)
+    factor_reduccion = None
+    if integrando['cota'] is not None:
+        a, b, cota = _caja(integrando)
+        area_rectangulo = (b - a) * cota
+        p = min(max(aproximacion / area_rectangulo, 0.0), 1.0)
+        varianza_base = area_rectangulo * area_rectangulo * p * (1.0 - p)
+        factor_reduccion = varianza_base / varianza if varianza > 0 else math.inf
+    
+    return {
+        'aproximacion': aproximacion,
+        'varianza': varianza,
+        'error_estandar': math.sqrt(varianza / n),
+        'factor_reduccion': factor_reduccion,
+    }
+
+
+# ============================================================================
+# Cuasi Monte Carlo (Sobol y Halton aleatorizados)
+# ============================================================================
+#
+# Las sucesiones de baja discrepancia cubren el cuadrado de forma más pareja
+# que los puntos pseudoaleatorios, y el error baja casi como 1/N en lugar de
+# 1/√N. Como los puntos son deterministas, se aleatorizan (scrambling) varias
+# veces de forma independiente: cada aleatorización sigue siendo de baja
+# discrepancia y la dispersión entre ellas da el error estándar.
+
+# Bits de precisión de los puntos de Sobol (admite hasta 2^32 puntos)
+BITS_SOBOL = 32
+
+# Números de dirección m_k de la segunda dimensión de Sobol (polinomio x + 1):
+# m_k = 2 m_(k-1) XOR m_(k-1), con m_1 = 1
+_m_sobol = [1]
+for _ in range(BITS_SOBOL - 1):
+    _m_sobol.append((2 * _m_sobol[-1]) ^ _m_sobol[-1])
+
+# Direcciones v_k = m_k / 2^k, como enteros de BITS_SOBOL bits.
+# La primera dimensión es la sucesión de van der Corput en base 2 (m_k = 1)
+DIRECCIONES_SOBOL = (
+    [1 << (BITS_SOBOL - 1 - k) for k in range(BITS_SOBOL)],
+    [_m_sobol[k] << (BITS_SOBOL - 1 - k) for k in range(BITS_SOBOL)],
+)
+
+
+def _mezclar_direcciones(direcciones, rng):
+    """
+    Scrambling lineal de Matoušek: multiplica cada dirección por una matriz
+    binaria triangular inferior aleatoria con unos en la diagonal (en GF(2)).
+    Los dígitos de cada dirección se leen del más significativo al menos.
+    """
+    filas = []
+    for j in range(BITS_SOBOL):
+        aleatorios = int(rng.integers(0, 1 << j)) if j > 0 else 0
+        filas.append((1 << (BITS_SOBOL - 1 - j)) | (aleatorios << (BITS_SOBOL - j)))
+    
+    mezcladas = []
+    for v in direcciones:
+        resultado = 0
+        for j, fila in enumerate(filas):
+            if bin(fila & v).count('1') % 2:
+                resultado |= 1 << (BITS_SOBOL - 1 - j)
+        mezcladas.append(resultado)
+    
+    return mezcladas
+
+
+def puntos_sobol(n, rng=None):
+    """
+    Primeros n puntos de la sucesión de Sobol en [0, 1)², generados en el orden
+    del código de Gray. Si se pasa rng se aplica scrambling lineal y un
+    desplazamiento digital aleatorio (XOR), independientes en cada dimensión.
+    
+    Parámetros:
+    - n: Cantidad de puntos (como máximo 2^BITS_SOBOL)
+    - rng: Generador numpy.random.Generator para la aleatorización (opcional)
+    
+    Retorna:
+    - Arreglo de forma (n, 2)
+    """
+    indices = np.arange(n, dtype=np.uint64)
+    gray = indices ^ (indices >> np.uint64(1))
+    
+    puntos = np.empty((n, 2))
+    for dimension, direcciones in enumerate(DIRECCIONES_SOBOL):
+        desplazamiento = 0
+        if rng is not None:
+            direcciones = _mezclar_direcciones(direcciones, rng)
+            desplazamiento = int(rng.integers(0, 1 << BITS_SOBOL))
+        
+        acumulado = np.full(n, desplazamiento, dtype=np.uint64)
+        for k, v in enumerate(direcciones):
+            bit = (gray >> np.uint64(k)) & np.uint64(1)
+            acumulado ^= bit * np.uint64(v)
+        
+        puntos[:, dimension] = acumulado / float(1 << BITS_SOBOL)
+    
+    return puntos
+
+
+def _inverso_radical(indices, base):
+    """
+    Inverso radical de los índices en la base dada (refleja los dígitos
+    respecto de la coma): es la coordenada de la sucesión de Halton.
+    """
+    resultado = np.zeros(len(indices))
+    restantes = indices.copy()
+    factor = 1.0 / base
+    
+    while np.any(restantes > 0):
+        resultado += (restantes % base) * factor
+        restantes //= base
+        factor /= base
+    
+    return resultado
+
+
+def puntos_halton(n, rng=None):
+    """
+    Primeros n puntos de la sucesión de Halton en [0, 1)² (bases 2 y 3),
+    empezando en el índice 1. Si se pasa rng se aplica un desplazamiento
+    aleatorio módulo 1 (Cranley-Patterson) en cada dimensión.
+    
+    Parámetros:
+    - n: Cantidad de puntos
+    - rng: Generador numpy.random.Generator para la aleatorización (opcional)
+    
+    Retorna:
+    - Arreglo de forma (n, 2)
+    """
+    indices = np.arange(1, n + 1, dtype=np.int64)
+    puntos = np.column_stack([_inverso_radical(indices, 2), _inverso_radical(indices, 3)])
+    
+    if rng is not None:
+        puntos = (puntos + rng.random(2)) % 1.0
+    
+    return puntos
+
+
+SECUENCIAS_QMC = {
+    'sobol': puntos_sobol,
+    'halton': puntos_halton,
+}
+
+
+def metodo_montecarlo_qmc(n, secuencia='sobol', estimador='acierto', seed=None, rng=None, integrando='semicirculo'):
+    """
+    Cuasi Monte Carlo con una aleatorización de la sucesión elegida.
+    
+    Parámetros:
+    - n: Cantidad de puntos
+    - secuencia: 'sobol' o 'halton'
+    - estimador: 'acierto' (acierto o fallo en [-1, 1] × [0, 2], como
+      metodo_montecarlo) o 'media' (promedio de 2 f(x), usa solo la coordenada x)
+    - seed: Semilla de la aleatorización (se ignora si se pasa rng)
+    - rng: Generador numpy.random.Generator ya creado (opcional)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Aproximación de π
+    """
+    if secuencia not in SECUENCIAS_QMC:
+        raise ValueError(f"Sucesión de baja discrepancia desconocida: {secuencia}")
+    if estimador not in ESTIMADORES:
+        raise ValueError(f"Estimador desconocido: {estimador}")
+    
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    
+    integrando = obtener_integrando(integrando)
+    a, b = integrando['dominio']
+    
+    puntos = SECUENCIAS_QMC[secuencia](n, rng)
+    x = a + (b - a) * puntos[:, 0]
+    
+    if estimador == 'media':
+        return (b - a) * float(evaluar(integrando, x).mean())
+    
+    cota = _caja(integrando)[2]
+    y = cota * puntos[:, 1]
+    debajo = (x > a) & (x < b) & (y <= evaluar(integrando, x))
+    return (b - a) * cota * np.count_nonzero(debajo) / n
+
+
+def montecarlo_qmc_aleatorizado(n, secuencia='sobol', estimador='acierto', aleatorizaciones=10, seed=None,
+                                integrando='semicirculo'):
+    """
+    Repite cuasi Monte Carlo con aleatorizaciones independientes y estima el
+    error estándar a partir de su dispersión.
+    
+    Parámetros:
+    - n: Cantidad de puntos por aleatorización
+    - secuencia: 'sobol' o 'halton'
+    - estimador: 'acierto' o 'media'
+    - aleatorizaciones: Cantidad de aleatorizaciones independientes
+    - seed: Semilla raíz (entero, SeedSequence o None)
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Diccionario con 'aproximacion' (promedio), 'error_estandar' y 'aproximaciones'
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    
+    aproximaciones = np.array([
+        metodo_montecarlo_qmc(n, secuencia, estimador, rng=np.random.default_rng(semilla), integrando=integrando)
+        for semilla in seed.spawn(aleatorizaciones)
+    ])
+    
+    return {
+        'aproximacion': float(aproximaciones.mean()),
+        'error_estandar': float(aproximaciones.std(ddof=1) / math.sqrt(aleatorizaciones)),
+        'aproximaciones': aproximaciones.tolist(),
+    }
+
+
+# ============================================================================
+# Matriz de repeticiones (repeticiones × N) para las tablas y gráficas
+# ============================================================================
+#
+# Todas las tablas y gráficas parten de la misma matriz de estimaciones, con
+# una fila por repetición y una columna por N; el promedio, la desviación
+# estándar y el residuo se calculan sobre el eje de las repeticiones.
+#
+# Por defecto cada N usa puntos nuevos, sorteados para todas las repeticiones
+# a la vez, así que una tabla cuesta suma(N) × repeticiones puntos. Con sumas
+# prefijas alcanza un flujo de max(N) puntos por repetición: la estimación con
+# los primeros N puntos es la suma acumulada hasta N dividida por N, y el costo
+# baja a max(N) × repeticiones. Las columnas de una misma repetición quedan
+# correlacionadas (comparten los primeros puntos), pero cada una por separado
+# tiene la misma distribución.
+
+def _valores_flujo(m, rng, muestreo='aleatorio', estimador='acierto', integrando='semicirculo'):
+    """
+    Valor de cada muestra de un flujo de m puntos: 4 si el punto cae debajo de
+    la curva y 0 si no (acierto o fallo), o 2 f(x) (media muestral); para otro
+    integrando, el área del rectángulo o (b - a) f(x). El promedio de los
+    primeros N valores es la estimación con N puntos.
+    Con muestreo pseudoaleatorio m también puede ser una forma, por ejemplo
+    (repeticiones, N), para sortear varias repeticiones a la vez.
+    """
+    integrando = obtener_integrando(integrando)
+    a, b = integrando['dominio']
+    cota = _caja(integrando)[2] if estimador == 'acierto' else None
+    
+    if muestreo in SECUENCIAS_QMC:
+        puntos = SECUENCIAS_QMC[muestreo](m, rng)
+        x = a + (b - a) * puntos[:, 0]
+        y = cota * puntos[:, 1] if estimador == 'acierto' else None
+    else:
+        x = rng.uniform(a, b, m)
+        y = rng.uniform(0.0, cota, m) if estimador == 'acierto' else None
+    
+    if estimador == 'media':
+        return (b - a) * evaluar(integrando, x)
+    
+    return (b - a) * cota * ((x > a) & (x < b) & (y <= evaluar(integrando, x)))
+
+
+def estimaciones_prefijos(n_valores, rng, muestreo='aleatorio', estimador='acierto', tamano_bloque=TAMANO_BLOQUE,
+                          integrando='semicirculo'):
+    """
+    Estimaciones de π para todos los N de n_valores a partir de un único flujo
+    de max(N) puntos, usando la suma acumulada de los valores de las muestras.
+    Con muestreo pseudoaleatorio el flujo se genera por bloques, así que la
+    memoria queda acotada por tamano_bloque; las sucesiones de cuasi Monte Carlo
+    se generan completas.
+    
+    Parámetros:
+    - n_valores: Valores de N (enteros positivos)
+    - rng: Generador numpy.random.Generator
+    - muestreo: 'aleatorio', 'sobol' o 'halton'
+    - estimador: 'acierto' o 'media'
+    - tamano_bloque: Cantidad máxima de puntos generados a la vez
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Arreglo con la estimación para cada N, en el orden de n_valores
+    """
+    n_valores = np.asarray(n_valores, dtype=np.int64)
+    n_max = int(n_valores.max())
+    
+    if muestreo in SECUENCIAS_QMC:
+        tamano_bloque = n_max
+    
+    sumas = np.empty(len(n_valores))
+    total = 0.0
+    inicio = 0
+    
+    while inicio < n_max:
+        m = min(tamano_bloque, n_max - inicio)
+        acumulado = total + np.cumsum(_valores_flujo(m, rng, muestreo, estimador, integrando))
+        
+        # Los N que terminan dentro de este bloque
+        en_bloque = (n_valores > inicio) & (n_valores <= inicio + m)
+        sumas[en_bloque] = acumulado[n_valores[en_bloque] - inicio - 1]
+        
+        total = acumulado[-1]
+        inicio += m
+    
+    return sumas / n_valores
+
+
+def _fila_prefijos(argumento):
+    """
+    Una repetición del barrido con sumas prefijas (función de nivel de módulo
+    para poder enviarla a otro proceso).
+    
+    Parámetros:
+    - argumento: Tupla (n_valores, semilla, muestreo, estimador, integrando)
+    
+    Retorna:
+    - Lista con la estimación para cada N
+    """
+    n_valores, semilla, muestreo, estimador, integrando = argumento
+    rng = np.random.default_rng(semilla)
+    return estimaciones_prefijos(n_valores, rng, muestreo, estimador, integrando=integrando).tolist()
+
+
+def estimaciones_repetidas(n, repeticiones, rng, muestreo='aleatorio', estimador='acierto', tamano_bloque=TAMANO_BLOQUE,
+                           integrando='semicirculo'):
+    """
+    Estimaciones independientes de π con n puntos, todas las repeticiones a la
+    vez: los puntos se sortean como una matriz (repeticiones × columnas) y se
+    suman por filas, recorriendo n por bloques de a lo sumo tamano_bloque puntos.
+    Con cuasi Monte Carlo cada repetición es una aleatorización de la sucesión.
+    
+    Parámetros:
+    - n: Cantidad de puntos de cada estimación
+    - repeticiones: Cantidad de estimaciones independientes
+    - rng: Generador numpy.random.Generator
+    - muestreo: 'aleatorio', 'sobol' o 'halton'
+    - estimador: 'acierto' o 'media'
+    - tamano_bloque: Cantidad máxima de puntos generados a la vez
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - Arreglo con una estimación por repetición
+    """
+    if muestreo in SECUENCIAS_QMC:
+        return np.array([metodo_montecarlo_qmc(n, muestreo, estimador, rng=rng, integrando=integrando)
+                         for _ in range(repeticiones)])
+    
+    columnas = max(1, tamano_bloque // repeticiones)
+    sumas = np.zeros(repeticiones)
+    inicio = 0
+    
+    while inicio < n:
+        m = min(columnas, n - inicio)
+        sumas += _valores_flujo((repeticiones, m), rng, muestreo, estimador, integrando).sum(axis=1)
+        inicio += m
+    
+    return sumas / n
+
+
+def _columna_repeticiones(argumento):
+    """
+    Todas las repeticiones de un N (función de nivel de módulo para poder
+    enviarla a otro proceso).
+    
+    Parámetros:
+    - argumento: Tupla (n, repeticiones, semilla, muestreo, estimador, integrando)
+    
+    Retorna:
+    - Lista con una estimación por repetición
+    """
+    n, repeticiones, semilla, muestreo, estimador, integrando = argumento
+    rng = np.random.default_rng(semilla)
+    return estimaciones_repetidas(n, repeticiones, rng, muestreo, estimador, integrando=integrando).tolist()
+
+
+def _costo_columna(argumento):
+    """
+    Costo estimado de un N: cantidad total de puntos generados.
+    """
+    n, repeticiones = argumento[:2]
+    return n * repeticiones
+
+
+def _costo_prefijos(argumento):
+    """
+    Costo estimado de una repetición con sumas prefijas: largo del flujo.
+    """
+    return max(argumento[0])
+
+
+def _trabajos_matriz(n_valores, repeticiones, seed, muestreo, estimador, prefijos, integrando='semicirculo'):
+    """
+    Arma los trabajos que calculan la matriz (repeticiones × N): uno por N, o
+    uno por repetición con sumas prefijas. Cada trabajo usa su propio flujo
+    derivado de seed (sin semilla se toma entropía del sistema operativo).
+    
+    Retorna:
+    - (función del trabajo, lista de argumentos, función de costo)
+    """
+    if seed is None:
+        seed = np.random.SeedSequence()
+    
+    if prefijos:
+        argumentos = [(n_valores, semilla, muestreo, estimador, integrando)
+                      for semilla in _semillas_filas(seed, repeticiones)]
+        return _fila_prefijos, argumentos, _costo_prefijos
+    
+    argumentos = [(n, repeticiones, semilla, muestreo, estimador, integrando)
+                  for n, semilla in zip(n_valores, _semillas_filas(seed, len(n_valores)))]
+    return _columna_repeticiones, argumentos, _costo_columna
+
+
+def _ensamblar_matriz(resultados, prefijos):
+    """
+    Junta los resultados de los trabajos en la matriz (repeticiones × N).
+    """
+    matriz = np.array(resultados, dtype=float)
+    return matriz if prefijos else matriz.T
+
+
+def matriz_repeticiones(n_valores, repeticiones, jobs=1, seed=None, muestreo='aleatorio', estimador='acierto',
+                        prefijos=False, integrando='semicirculo'):
+    """
+    Calcula la matriz de estimaciones (repeticiones × N) de una grilla de N.
+    
+    Parámetros:
+    - n_valores: Valores de N
+    - repeticiones: Cantidad de repeticiones para cada N
+    - jobs: Cantidad de procesos (por defecto 1)
+    - seed: Semilla raíz (entero, SeedSequence o None); con semilla la matriz
+      es reproducible sin importar jobs
+    - muestreo: 'aleatorio', 'sobol' o 'halton'
+    - estimador: 'acierto' o 'media'
+    - prefijos: Si es True, cada fila sale de un único flujo de max(N) puntos
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el
+      semicírculo); se envía tal cual a los procesos, así que conviene pasar el nombre
+    
+    Retorna:
+    - Arreglo de forma (repeticiones, len(n_valores))
+    """
+    funcion_trabajo, argumentos, costo = _trabajos_matriz(list(n_valores), repeticiones, seed, muestreo, estimador,
+                                                          prefijos, integrando)
+    return _ensamblar_matriz(ejecutar_en_paralelo(funcion_trabajo, argumentos, jobs, costo), prefijos)
+
+
+def estadisticas_repeticiones(matriz, valor_exacto=math.pi):
+    """
+    Promedio, desviación estándar (poblacional, como en las tablas) y residuo
+    del promedio para cada N, calculados sobre el eje de las repeticiones.
+    
+    Parámetros:
+    - matriz: Arreglo (repeticiones × N) de estimaciones
+    - valor_exacto: Valor de referencia para el residuo (por defecto π)
+    
+    Retorna:
+    - Diccionario con los arreglos 'promedio', 'desv_est' y 'residuo'
+    """
+    promedio = matriz.mean(axis=0)
+    return {
+        'promedio': promedio,
+        'desv_est': matriz.std(axis=0),
+        'residuo': np.abs(promedio - valor_exacto),
+    }
+
+
 # ============================================================================
 # EJERCICIO 4.2: Tablas comparativas del método Monte Carlo
 # ============================================================================
 
-def generar_tabla_comparativa_montecarlo(n_inicio, n_fin, incremento, numero_tabla, repeticiones=5):
+def _armar_barrido_montecarlo(n_inicio, n_fin, incremento, repeticiones, matriz, muestreo='aleatorio', estimador='acierto',
+                              prefijos=False, tiempos=None):
+    """
+    Arma el diccionario del barrido a partir de la matriz (repeticiones × N) y
+    de los segundos de cada trabajo. Solo sin sumas prefijas hay un trabajo por
+    N; con prefijos (un trabajo por repetición) el tiempo de cada N queda en NaN.
+    """
+    estadisticas = estadisticas_repeticiones(matriz)
+    n_valores = list(range(n_inicio, n_fin + 1, incremento))
+    if tiempos is None or prefijos:
+        tiempos = [math.nan] * len(n_valores)
+    
+    return {'n_inicio': n_inicio, 'n_fin': n_fin, 'incremento': incremento,
+            'repeticiones': repeticiones, 'muestreo': muestreo, 'estimador': estimador,
+            'prefijos': prefijos,
+            'n': n_valores,
+            'promedio': estadisticas['promedio'].tolist(),
+            'residuo': estadisticas['residuo'].tolist(),
+            'desv_est': estadisticas['desv_est'].tolist(),
+            'tiempo': list(tiempos)}
+
+
+def _semillas_filas(seed, cantidad):
+    """
+    Una semilla independiente por fila, derivadas de la semilla raíz
+    (o None para todas si no hay semilla).
+    
+    Parámetros:
+    - seed: Entero, numpy.random.SeedSequence o None
+    - cantidad: Cantidad de filas
+    """
+    if seed is None:
+        return [None] * cantidad
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(cantidad)
+
+
+def _semilla_derivada(seed, indice):
+    """
+    Flujo independiente número indice de la semilla raíz, igual al que
+    devolvería SeedSequence(seed).spawn(indice + 1)[indice].
+    Los hijos 0 a 2 son las tres tablas; los siguientes se usan para el zoom
+    de las gráficas, la prueba inicial, Monte Carlo secuencial, la reducción
+    de varianza y cuasi Monte Carlo, así no comparten flujo con las tablas.
+    """
+    if seed is None:
+        return None
+    return np.random.SeedSequence(seed, spawn_key=(indice,))
+
+
+def calcular_barrido_montecarlo(n_inicio, n_fin, incremento, repeticiones=5, jobs=1, seed=None, muestreo='aleatorio',
+                                estimador='acierto', prefijos=False):
+    """
+    Ejecuta una sola vez Monte Carlo (con sus repeticiones) para cada N del rango.
+    El resultado lo leen la tabla por consola, el CSV y las gráficas,
+    así no se vuelve a simular lo mismo tres veces.
+    
+    Parámetros:
+    - n_inicio: Valor inicial de N
+    - n_fin: Valor final de N
+    - incremento: Paso entre valores consecutivos de N
+    - repeticiones: Número de veces que se ejecuta Monte Carlo para cada N (para promediar)
+    - jobs: Cantidad de procesos para calcular las filas (por defecto 1)
+    - seed: Semilla raíz; si se indica, el barrido es reproducible sin importar jobs
+    - muestreo: 'aleatorio' (pseudoaleatorio), 'sobol' o 'halton' (cuasi Monte Carlo;
+      las repeticiones son aleatorizaciones independientes de la sucesión)
+    - estimador: 'acierto' (acierto o fallo) o 'media' (media muestral de 2 f(x))
+    - prefijos: Si es True, cada repetición usa un único flujo de max(N) puntos y
+      las estimaciones de todos los N salen de sus sumas prefijas
+    
+    Retorna:
+    - Diccionario con las listas 'n', 'promedio', 'residuo', 'desv_est' y
+      'tiempo' (segundos de cada N; NaN con prefijos)
+    """
+    # Los mismos trabajos que matriz_repeticiones, cronometrados
+    n_valores = list(range(n_inicio, n_fin + 1, incremento))
+    funcion_trabajo, argumentos, costo = _trabajos_matriz(n_valores, repeticiones, seed, muestreo, estimador, prefijos)
+    resultados, tiempos = ejecutar_en_paralelo(funcion_trabajo, argumentos, jobs, costo, cronometrar=True)
+    return _armar_barrido_montecarlo(n_inicio, n_fin, incremento, repeticiones, _ensamblar_matriz(resultados, prefijos),
+                                     muestreo, estimador, prefijos, tiempos)
+
+
+def calcular_barridos_montecarlo(jobs=1, seed=None, muestreo='aleatorio', estimador='acierto', prefijos=False):
+    """
+    Calcula los barridos de las tres tablas (10 a 100, 100 a 1000 y 1000 a 10000).
+    Se usan 10 repeticiones para las dos primeras y 5 para la tercera.
+    Con jobs > 1 las filas de las tres tablas se reparten en un único pool de
+    procesos, empezando por las más costosas.
+    
+    Parámetros:
+    - jobs: Cantidad de procesos (por defecto 1)
+    - seed: Semilla raíz; si se indica, los barridos son reproducibles sin importar jobs
+    - muestreo: 'aleatorio', 'sobol' o 'halton'
+    - estimador: 'acierto' o 'media'
+    - prefijos: Si es True, un flujo de max(N) puntos por repetición (ver calcular_barrido_montecarlo)
+    
+    Retorna:
+    - Lista con los tres barridos, en el orden de las tablas
+    """
+    rangos = [(10, 100, 10, 10), (100, 1000, 100, 10), (1000, 10000, 1000, 5)]
+    semillas_tablas = _semillas_filas(seed, len(rangos))
+    grillas = []
+    for (n_inicio, n_fin, incremento, repeticiones), semilla_tabla in zip(rangos, semillas_tablas):
+        n_valores = list(range(n_inicio, n_fin + 1, incremento))
+        funcion_trabajo, argumentos, costo = _trabajos_matriz(n_valores, repeticiones, semilla_tabla,
+                                                              muestreo, estimador, prefijos)
+        grillas.append(argumentos)
+
+    resultados, tiempos = ejecutar_grillas(funcion_trabajo, grillas, jobs, costo, cronometrar=True)
+    return [_armar_barrido_montecarlo(*rango, _ensamblar_matriz(resultados_rango, prefijos), muestreo, estimador, prefijos,
+                                      tiempos_rango)
+            for rango, resultados_rango, tiempos_rango in zip(rangos, resultados, tiempos)]
+
+
+def _descripcion_repeticiones(barrido):
+    """
+    Texto que indica cómo se obtuvieron el promedio y la desviación de cada fila.
+    """
+    muestreo = barrido.get('muestreo', 'aleatorio')
+    if muestreo in SECUENCIAS_QMC:
+        descripcion = f"Promedio de {barrido['repeticiones']} aleatorizaciones de {muestreo.capitalize()} por cada N"
+    else:
+        descripcion = f"Promedio de {barrido['repeticiones']} ejecuciones por cada N"
+    
+    if barrido.get('estimador', 'acierto') == 'media':
+        descripcion += ", estimador de la media muestral"
+    if barrido.get('prefijos', False):
+        descripcion += f", un flujo de {barrido['n_fin']} puntos por repetición"
+    return descripcion
+
+
+def generar_tabla_comparativa_montecarlo(n_inicio, n_fin, incremento, numero_tabla, repeticiones=5, barrido=None, muestreo='aleatorio',
+                                         estimador='acierto', prefijos=False):
     """
     Genera una tabla comparativa del método Monte Carlo para un rango específico de N.
     Como Monte Carlo es aleatorio, se ejecuta varias veces y se muestra el promedio.
@@ -74,42 +1158,48 @@ def generar_tabla_comparativa_montecarlo(n_inicio, n_fin, incremento, numero_tab
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para el título
     - repeticiones: Número de veces que se ejecuta Monte Carlo para cada N (para promediar)
+    - barrido: Resultado de calcular_barrido_montecarlo (si es None se calcula)
+    - muestreo: 'aleatorio', 'sobol' o 'halton' (solo si se calcula el barrido)
+    - estimador: 'acierto' o 'media' (solo si se calcula el barrido)
+    - prefijos: Reutilizar un flujo por repetición (solo si se calcula el barrido)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido_montecarlo(n_inicio, n_fin, incremento, repeticiones, muestreo=muestreo,
+                                              estimador=estimador, prefijos=prefijos)
     
     print("\n" + "=" * 100)
     print(f"TABLA {numero_tabla}: Método Monte Carlo - N variando de {n_inicio} a {n_fin} (incremento de {incremento})")
-    print(f"(Promedio de {repeticiones} ejecuciones por cada N)")
+    print(f"({_descripcion_repeticiones(barrido)})")
     print("=" * 100)
     print(f"{'N':>8} | {'Aproximación':>15} | {'Residuo':>12} | {'Desv. Est.':>12}")
     print("-" * 100)
     
-    for n in range(n_inicio, n_fin + 1, incremento):
-        # Ejecutar Monte Carlo varias veces para cada N
-        aproximaciones = [metodo_montecarlo(n) for _ in range(repeticiones)]
-        
-        # Calcular promedio y desviación estándar
-        aprox_promedio = sum(aproximaciones) / repeticiones
-        desv_est = math.sqrt(sum((x - aprox_promedio)**2 for x in aproximaciones) / repeticiones)
-        
-        # Calcular residuo
-        residuo = abs(aprox_promedio - valor_pi)
-        
+    for n, aprox_promedio, residuo, desv_est in zip(barrido['n'], barrido['promedio'],
+                                                    barrido['residuo'], barrido['desv_est']):
         print(f"{n:8d} | {aprox_promedio:15.10f} | {residuo:12.10f} | {desv_est:12.10f}")
 
 
-def generar_tablas_comparativas_montecarlo():
+def generar_tablas_comparativas_montecarlo(barridos=None, muestreo='aleatorio', estimador='acierto', prefijos=False):
     """
     Genera tres tablas comparativas del método Monte Carlo.
+    
+    Parámetros:
+    - barridos: Resultado de calcular_barridos_montecarlo (si es None se calcula)
+    - muestreo: 'aleatorio', 'sobol' o 'halton' (solo si se calculan los barridos)
+    - estimador: 'acierto' o 'media' (solo si se calculan los barridos)
+    - prefijos: Reutilizar un flujo por repetición (solo si se calculan los barridos)
     """
+    if barridos is None:
+        barridos = calcular_barridos_montecarlo(muestreo=muestreo, estimador=estimador, prefijos=prefijos)
+    
     # Tabla 1: N de 10 a 100, variando de 10 en 10
-    generar_tabla_comparativa_montecarlo(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, repeticiones=10)
+    generar_tabla_comparativa_montecarlo(n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, repeticiones=10, barrido=barridos[0])
     
     # Tabla 2: N de 100 a 1000, variando de 100 en 100
-    generar_tabla_comparativa_montecarlo(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, repeticiones=10)
+    generar_tabla_comparativa_montecarlo(n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, repeticiones=10, barrido=barridos[1])
     
     # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-    generar_tabla_comparativa_montecarlo(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, repeticiones=5)
+    generar_tabla_comparativa_montecarlo(n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, repeticiones=5, barrido=barridos[2])
     
     # Mostrar valor de referencia de π
     print("\n" + "=" * 100)
@@ -117,7 +1207,8 @@ def generar_tablas_comparativas_montecarlo():
     print("=" * 100)
 
 
-def generar_tabla_individual_csv_montecarlo(archivo_csv, n_inicio, n_fin, incremento, numero_tabla, repeticiones=5):
+def generar_tabla_individual_csv_montecarlo(archivo_csv, n_inicio, n_fin, incremento, numero_tabla, repeticiones=5, barrido=None, muestreo='aleatorio',
+                                            estimador='acierto', prefijos=False):
     """
     Genera una tabla comparativa del método Monte Carlo y la escribe en un archivo CSV.
     
@@ -128,35 +1219,42 @@ def generar_tabla_individual_csv_montecarlo(archivo_csv, n_inicio, n_fin, increm
     - incremento: Paso entre valores consecutivos de N
     - numero_tabla: Número de la tabla para identificación
     - repeticiones: Número de veces que se ejecuta Monte Carlo para cada N
+    - barrido: Resultado de calcular_barrido_montecarlo (si es None se calcula)
+    - muestreo: 'aleatorio', 'sobol' o 'halton' (solo si se calcula el barrido)
+    - estimador: 'acierto' o 'media' (solo si se calcula el barrido)
+    - prefijos: Reutilizar un flujo por repetición (solo si se calcula el barrido)
     """
-    valor_pi = math.pi
+    if barrido is None:
+        barrido = calcular_barrido_montecarlo(n_inicio, n_fin, incremento, repeticiones, muestreo=muestreo,
+                                              estimador=estimador, prefijos=prefijos)
     
     # Escribir encabezado de la tabla
     archivo_csv.writerow([])  # Línea en blanco
     archivo_csv.writerow([f"TABLA {numero_tabla}: N variando de {n_inicio} a {n_fin} (incremento de {incremento})"])
-    archivo_csv.writerow([f"Promedio de {repeticiones} ejecuciones por cada N"])
+    archivo_csv.writerow([_descripcion_repeticiones(barrido)])
     archivo_csv.writerow(['N', 'Aproximación Monte Carlo', 'Residuo', 'Desviación Estándar'])
     
-    # Calcular y escribir los datos
-    for n in range(n_inicio, n_fin + 1, incremento):
-        # Ejecutar Monte Carlo varias veces
-        aproximaciones = [metodo_montecarlo(n) for _ in range(repeticiones)]
-        
-        # Calcular estadísticas
-        aprox_promedio = sum(aproximaciones) / repeticiones
-        desv_est = math.sqrt(sum((x - aprox_promedio)**2 for x in aproximaciones) / repeticiones)
-        residuo = abs(aprox_promedio - valor_pi)
-        
+    # Escribir los datos
+    for n, aprox_promedio, residuo, desv_est in zip(barrido['n'], barrido['promedio'],
+                                                    barrido['residuo'], barrido['desv_est']):
         archivo_csv.writerow([n, aprox_promedio, residuo, desv_est])
 
 
-def generar_tablas_csv_montecarlo(nombre_archivo='tablas_montecarlo.csv'):
+def generar_tablas_csv_montecarlo(nombre_archivo='tablas_montecarlo.csv', barridos=None, muestreo='aleatorio', estimador='acierto',
+                                  prefijos=False):
     """
     Genera un archivo CSV con las tres tablas comparativas del método Monte Carlo.
     
     Parámetros:
     - nombre_archivo: Nombre del archivo CSV a crear
+    - barridos: Resultado de calcular_barridos_montecarlo (si es None se calcula)
+    - muestreo: 'aleatorio', 'sobol' o 'halton' (solo si se calculan los barridos)
+    - estimador: 'acierto' o 'media' (solo si se calculan los barridos)
+    - prefijos: Reutilizar un flujo por repetición (solo si se calculan los barridos)
     """
+    if barridos is None:
+        barridos = calcular_barridos_montecarlo(muestreo=muestreo, estimador=estimador, prefijos=prefijos)
+    
     with open(nombre_archivo, 'w', newline='', encoding='utf-8') as archivo:
         writer = csv.writer(archivo)
         
@@ -165,261 +1263,293 @@ def generar_tablas_csv_montecarlo(nombre_archivo='tablas_montecarlo.csv'):
         writer.writerow([f'Valor de π (referencia): {math.pi:.10f}'])
         
         # Tabla 1: N de 10 a 100, variando de 10 en 10
-        generar_tabla_individual_csv_montecarlo(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, repeticiones=10)
+        generar_tabla_individual_csv_montecarlo(writer, n_inicio=10, n_fin=100, incremento=10, numero_tabla=1, repeticiones=10, barrido=barridos[0])
         
         # Tabla 2: N de 100 a 1000, variando de 100 en 100
-        generar_tabla_individual_csv_montecarlo(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, repeticiones=10)
+        generar_tabla_individual_csv_montecarlo(writer, n_inicio=100, n_fin=1000, incremento=100, numero_tabla=2, repeticiones=10, barrido=barridos[1])
         
         # Tabla 3: N de 1000 a 10000, variando de 1000 en 1000
-        generar_tabla_individual_csv_montecarlo(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, repeticiones=5)
+        generar_tabla_individual_csv_montecarlo(writer, n_inicio=1000, n_fin=10000, incremento=1000, numero_tabla=3, repeticiones=5, barrido=barridos[2])
     
     print(f"\n✓ Archivo CSV generado: {nombre_archivo}")
 
 
+def generar_tablas_columnares_montecarlo(directorio='tablas_montecarlo_columnas', barridos=None, muestreo='aleatorio',
+                                         estimador='acierto', prefijos=False):
+    """
+    Escribe las tres tablas de Monte Carlo en formato columnar (ver
+    resultados_columnares.py): promedio, residuo y desviación estándar de las
+    repeticiones en precisión completa, y el tiempo de cada N.
+    
+    Parámetros:
+    - directorio: Directorio de salida
+    - barridos: Resultado de calcular_barridos_montecarlo (si es None se calcula)
+    - muestreo: 'aleatorio', 'sobol' o 'halton' (solo si se calculan los barridos)
+    - estimador: 'acierto' o 'media' (solo si se calculan los barridos)
+    - prefijos: Reutilizar un flujo por repetición (solo si se calculan los barridos)
+    """
+    if barridos is None:
+        barridos = calcular_barridos_montecarlo(muestreo=muestreo, estimador=estimador, prefijos=prefijos)
+    
+    guardar_barridos(directorio, barridos,
+                     {'montecarlo': ('promedio', 'residuo', 'desv_est')},
+                     {'descripcion': 'Monte Carlo para f(x) = 2√(1-x²) en [-1, 1]', 'valor_exacto': math.pi,
+                      'repeticiones': [barrido['repeticiones'] for barrido in barridos],
+                      'muestreo': barridos[0].get('muestreo', 'aleatorio'),
+                      'estimador': barridos[0].get('estimador', 'acierto'),
+                      'prefijos': barridos[0].get('prefijos', False)})
+    
+    print(f"\n✓ Resultados columnares generados: {directorio}")
+
+
 # ============================================================================
 # EJERCICIO 4.3: Gráficas de convergencia del método Monte Carlo
 # ============================================================================
 
-def graficar_convergencia_montecarlo():
+def _series_montecarlo(barrido, etiqueta, tamano_marcador, tapa, grosor_tapa, grosor_error):
+    """
+    Serie del promedio con barras de desviación estándar, más la referencia π.
+    """
+    n_valores = barrido['n']
+    return [
+        error(n_valores, barrido['promedio'], barrido['desv_est'], 'b-o',
+              label=f'{etiqueta} (promedio)', linewidth=2, markersize=tamano_marcador,
+              capsize=tapa, capthick=grosor_tapa, elinewidth=grosor_error, alpha=0.7),
+        linea(n_valores, [math.pi] * len(n_valores), 'g--', label='π (teórico)', linewidth=2.5),
+    ]
+
+
+def graficar_convergencia_montecarlo(barridos=None, seed=None, muestreo='aleatorio', estimador='acierto', prefijos=False,
+                                     ejecutor=None, esperar=True):
     """
     Genera gráficas mostrando la convergencia del método Monte Carlo hacia π.
     Crea gráficas separadas para diferentes rangos de N.
     Como Monte Carlo es aleatorio, se ejecuta varias veces y se grafica el promedio.
-    """
-    valor_pi = math.pi
     
-    # Configuración general de estilo
-    plt.style.use('seaborn-v0_8-darkgrid')
+    Parámetros:
+    - barridos: Resultado de calcular_barridos_montecarlo (si es None se calcula)
+    - seed: Semilla raíz para los barridos que se calculan acá (opcional)
+    - muestreo: 'aleatorio', 'sobol' o 'halton' (si se pasan barridos, se usa el de ellos)
+    - estimador: 'acierto' o 'media' (si se pasan barridos, se usa el de ellos)
+    - prefijos: Reutilizar un flujo por repetición (si se pasan barridos, se usa el de ellos)
+    - ejecutor: Pool de crear_ejecutor_renderizado para dibujar en paralelo (opcional)
+    - esperar: Si es False no espera a que se terminen de dibujar (ver esperar_figuras)
+    
+    Retorna:
+    - Lista de figuras pendientes (ver enviar_figuras)
+    """
+    if barridos is None:
+        barridos = calcular_barridos_montecarlo(seed=seed, muestreo=muestreo, estimador=estimador, prefijos=prefijos)
+    muestreo = barridos[0].get('muestreo', muestreo)
+    estimador = barridos[0].get('estimador', estimador)
+    prefijos = barridos[0].get('prefijos', prefijos)
+    etiqueta = 'Monte Carlo, media muestral' if estimador == 'media' else 'Monte Carlo'
     
     repeticiones = 10  # Número de ejecuciones para promediar
     
-    # Gráfica 1: N de 10 a 100, variando de 10 en 10
     print("\nGenerando gráficas de convergencia del método Monte Carlo...")
-    n_valores_1 = list(range(10, 101, 10))
-    aprox_mc_1 = []
-    desv_mc_1 = []
-    
-    for n in n_valores_1:
-        aproximaciones = [metodo_montecarlo(n) for _ in range(repeticiones)]
-        promedio = sum(aproximaciones) / repeticiones
-        desv = math.sqrt(sum((x - promedio)**2 for x in aproximaciones) / repeticiones)
-        aprox_mc_1.append(promedio)
-        desv_mc_1.append(desv)
-    
-    pi_valores_1 = [valor_pi] * len(n_valores_1)
-    
-    plt.figure(figsize=(10, 6))
-    plt.errorbar(n_valores_1, aprox_mc_1, yerr=desv_mc_1, fmt='b-o', 
-                 label='Monte Carlo (promedio)', linewidth=2, markersize=6, 
-                 capsize=5, capthick=2, elinewidth=1.5, alpha=0.7)
-    plt.plot(n_valores_1, pi_valores_1, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (cantidad de puntos aleatorios)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia del método Monte Carlo hacia π\n(N = 10 a 100)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_montecarlo_10_100.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_montecarlo_10_100.png")
-    
-    # Gráfica 2: N de 100 a 1000, variando de 100 en 100
-    n_valores_2 = list(range(100, 1001, 100))
-    aprox_mc_2 = []
-    desv_mc_2 = []
-    
-    for n in n_valores_2:
-        aproximaciones = [metodo_montecarlo(n) for _ in range(repeticiones)]
-        promedio = sum(aproximaciones) / repeticiones
-        desv = math.sqrt(sum((x - promedio)**2 for x in aproximaciones) / repeticiones)
-        aprox_mc_2.append(promedio)
-        desv_mc_2.append(desv)
-    
-    pi_valores_2 = [valor_pi] * len(n_valores_2)
-    
-    plt.figure(figsize=(10, 6))
-    plt.errorbar(n_valores_2, aprox_mc_2, yerr=desv_mc_2, fmt='b-o', 
-                 label='Monte Carlo (promedio)', linewidth=2, markersize=6, 
-                 capsize=5, capthick=2, elinewidth=1.5, alpha=0.7)
-    plt.plot(n_valores_2, pi_valores_2, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (cantidad de puntos aleatorios)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia del método Monte Carlo hacia π\n(N = 100 a 1000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_montecarlo_100_1000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_montecarlo_100_1000.png")
-    
-    # Gráfica 3: N de 1000 a 10000, variando de 1000 en 1000
-    n_valores_3 = list(range(1000, 10001, 1000))
-    aprox_mc_3 = []
-    desv_mc_3 = []
-    
-    repeticiones_3 = 5  # Menos repeticiones para valores grandes de N (más rápido)
-    
-    for n in n_valores_3:
-        aproximaciones = [metodo_montecarlo(n) for _ in range(repeticiones_3)]
-        promedio = sum(aproximaciones) / repeticiones_3
-        desv = math.sqrt(sum((x - promedio)**2 for x in aproximaciones) / repeticiones_3)
-        aprox_mc_3.append(promedio)
-        desv_mc_3.append(desv)
-    
-    pi_valores_3 = [valor_pi] * len(n_valores_3)
-    
-    plt.figure(figsize=(10, 6))
-    plt.errorbar(n_valores_3, aprox_mc_3, yerr=desv_mc_3, fmt='b-o', 
-                 label='Monte Carlo (promedio)', linewidth=2, markersize=6, 
-                 capsize=5, capthick=2, elinewidth=1.5, alpha=0.7)
-    plt.plot(n_valores_3, pi_valores_3, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (cantidad de puntos aleatorios)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia del método Monte Carlo hacia π\n(N = 1000 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_montecarlo_1000_10000.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_montecarlo_1000_10000.png")
+    figuras = []
+    
+    # Gráficas 1 a 3: una por rango de N
+    rangos = ['N = 10 a 100', 'N = 100 a 1000', 'N = 1000 a 10000']
+    archivos = ['grafica_montecarlo_10_100.png', 'grafica_montecarlo_100_1000.png', 'grafica_montecarlo_1000_10000.png']
+    
+    for barrido, rango, archivo in zip(barridos, rangos, archivos):
+        figuras.append(figura(archivo, (10, 6), _series_montecarlo(barrido, etiqueta, 6, 5, 2, 1.5),
+                              titulo=f'Convergencia del método Monte Carlo hacia π\n({rango})',
+                              xlabel='N (cantidad de puntos aleatorios)', ylabel='Valor de la aproximación',
+                              leyenda={'fontsize': 10}, grilla={'alpha': 0.3}))
     
     # Gráfica 4: Visión completa con todos los valores
-    n_valores_todos = n_valores_1 + n_valores_2 + n_valores_3
-    aprox_mc_todos = aprox_mc_1 + aprox_mc_2 + aprox_mc_3
-    desv_mc_todos = desv_mc_1 + desv_mc_2 + desv_mc_3
-    pi_valores_todos = [valor_pi] * len(n_valores_todos)
-    
-    plt.figure(figsize=(12, 7))
-    plt.errorbar(n_valores_todos, aprox_mc_todos, yerr=desv_mc_todos, fmt='b-o', 
-                 label='Monte Carlo (promedio)', linewidth=2, markersize=4, 
-                 capsize=4, capthick=1.5, elinewidth=1, alpha=0.7)
-    plt.plot(n_valores_todos, pi_valores_todos, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (cantidad de puntos aleatorios)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia del método Monte Carlo hacia π\n(Visión completa: N = 10 a 10000)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_montecarlo_completa.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_montecarlo_completa.png")
+    barrido_todos = {clave: barridos[0][clave] + barridos[1][clave] + barridos[2][clave]
+                     for clave in ('n', 'promedio', 'desv_est', 'residuo')}
+    
+    figuras.append(figura('grafica_montecarlo_completa.png', (12, 7),
+                          _series_montecarlo(barrido_todos, etiqueta, 4, 4, 1.5, 1),
+                          titulo='Convergencia del método Monte Carlo hacia π\n(Visión completa: N = 10 a 10000)',
+                          xlabel='N (cantidad de puntos aleatorios)', ylabel='Valor de la aproximación',
+                          leyenda={'fontsize': 11}, grilla={'alpha': 0.3}))
     
     # Gráfica 5: Zoom en rango pequeño (10 a 50)
-    n_valores_zoom = list(range(10, 51, 5))
-    aprox_mc_zoom = []
-    desv_mc_zoom = []
-    
-    for n in n_valores_zoom:
-        aproximaciones = [metodo_montecarlo(n) for _ in range(repeticiones)]
-        promedio = sum(aproximaciones) / repeticiones
-        desv = math.sqrt(sum((x - promedio)**2 for x in aproximaciones) / repeticiones)
-        aprox_mc_zoom.append(promedio)
-        desv_mc_zoom.append(desv)
-    
-    pi_valores_zoom = [valor_pi] * len(n_valores_zoom)
-    
-    plt.figure(figsize=(10, 6))
-    plt.errorbar(n_valores_zoom, aprox_mc_zoom, yerr=desv_mc_zoom, fmt='b-o', 
-                 label='Monte Carlo (promedio)', linewidth=2, markersize=7, 
-                 capsize=5, capthick=2, elinewidth=1.5, alpha=0.7)
-    plt.plot(n_valores_zoom, pi_valores_zoom, 'g--', label='π (teórico)', linewidth=2.5)
-    plt.xlabel('N (cantidad de puntos aleatorios)', fontsize=12)
-    plt.ylabel('Valor de la aproximación', fontsize=12)
-    plt.title('Convergencia del método Monte Carlo hacia π\n(Zoom: N = 10 a 50, para observar comportamiento inicial)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('grafica_montecarlo_zoom_10_50.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_montecarlo_zoom_10_50.png")
+    barrido_zoom = calcular_barrido_montecarlo(n_inicio=10, n_fin=50, incremento=5, repeticiones=repeticiones,
+                                               seed=_semilla_derivada(seed, 3), muestreo=muestreo, estimador=estimador,
+                                               prefijos=prefijos)
+    
+    figuras.append(figura('grafica_montecarlo_zoom_10_50.png', (10, 6),
+                          _series_montecarlo(barrido_zoom, etiqueta, 7, 5, 2, 1.5),
+                          titulo='Convergencia del método Monte Carlo hacia π\n(Zoom: N = 10 a 50, para observar comportamiento inicial)',
+                          xlabel='N (cantidad de puntos aleatorios)', ylabel='Valor de la aproximación',
+                          leyenda={'fontsize': 10}, grilla={'alpha': 0.3}))
     
     # Gráfica 6: Gráfica de residuos (errores) - escala logarítmica
-    residuos_mc = [abs(aprox - valor_pi) for aprox in aprox_mc_todos]
-    
-    plt.figure(figsize=(12, 7))
-    plt.semilogy(n_valores_todos, residuos_mc, 'b-o', label='Monte Carlo', 
-                 linewidth=2, markersize=4, alpha=0.7)
-    plt.xlabel('N (cantidad de puntos aleatorios)', fontsize=12)
-    plt.ylabel('Residuo (error) - Escala logarítmica', fontsize=12)
-    plt.title('Evolución del residuo |aproximación - π| con Monte Carlo\n(Escala logarítmica)', fontsize=14, fontweight='bold')
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3, which='both')
-    plt.tight_layout()
-    plt.savefig('grafica_residuos_montecarlo.png', dpi=300)
-    print("✓ Gráfica guardada: grafica_residuos_montecarlo.png")
+    figuras.append(figura('grafica_residuos_montecarlo.png', (12, 7),
+                          [linea(barrido_todos['n'], barrido_todos['residuo'], 'b-o', label=etiqueta,
+                                 linewidth=2, markersize=4, alpha=0.7)],
+                          titulo='Evolución del residuo |aproximación - π| con Monte Carlo\n(Escala logarítmica)',
+                          xlabel='N (cantidad de puntos aleatorios)', ylabel='Residuo (error) - Escala logarítmica',
+                          leyenda={'fontsize': 11}, grilla={'alpha': 0.3, 'which': 'both'}, escala_y='log'))
+    
+    pendientes = enviar_figuras(figuras, ejecutor)
+    
+    if esperar:
+        esperar_figuras(pendientes)
+        print("\n" + "=" * 70)
+        print("Todas las gráficas han sido generadas exitosamente")
+        print("=" * 70)
+    
+    return pendientes
+
+
+# Hasta esta cantidad de puntos visualizar_montecarlo (modo 'auto') dibuja cada
+# punto; por encima usa el modo de densidad, cuyo costo no depende de n
+MAX_PUNTOS_DISPERSION = 200_000
+
+
+def histogramas_montecarlo(n, rng, celdas=800, tamano_bloque=TAMANO_BLOQUE, integrando='semicirculo'):
+    """
+    Genera n puntos uniformes en [-1, 1] × [0, 2] (dominio × [0, cota]) por
+    bloques y los acumula en dos histogramas 2D de tamaño fijo: puntos debajo
+    de la curva y puntos fuera. La memoria es O(celdas²) sin importar n.
     
-    print("\n" + "=" * 70)
-    print("Todas las gráficas han sido generadas exitosamente")
-    print("=" * 70)
+    Parámetros:
+    - n: Cantidad de puntos aleatorios a generar
+    - rng: Generador numpy.random.Generator
+    - celdas: Cantidad de celdas por eje
+    - tamano_bloque: Cantidad máxima de puntos generados a la vez
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el semicírculo)
+    
+    Retorna:
+    - (histograma_dentro, histograma_fuera, puntos_dentro); los histogramas tienen
+      forma (celdas, celdas), con la fila 0 en y = 0
+    """
+    integrando = obtener_integrando(integrando)
+    a, b, cota = _caja(integrando)
+    dentro = np.zeros(celdas * celdas, dtype=np.int64)
+    fuera = np.zeros(celdas * celdas, dtype=np.int64)
+    restantes = n
+    
+    while restantes > 0:
+        m = min(restantes, tamano_bloque)
+        x = rng.uniform(a, b, m)
+        y = rng.uniform(0.0, cota, m)
+        
+        en_dominio = (x > a) & (x < b)
+        debajo = en_dominio & (y <= evaluar(integrando, x))
+        encima = en_dominio & ~debajo
+        
+        # Índice de la celda de cada punto (equivale a np.histogram2d con rango fijo)
+        columna = np.minimum(((x - a) * (celdas / (b - a))).astype(np.int64), celdas - 1)
+        fila = np.minimum((y * (celdas / cota)).astype(np.int64), celdas - 1)
+        celda = fila * celdas + columna
+        
+        dentro += np.bincount(celda[debajo], minlength=celdas * celdas)
+        fuera += np.bincount(celda[encima], minlength=celdas * celdas)
+        restantes -= m
+    
+    return dentro.reshape(celdas, celdas), fuera.reshape(celdas, celdas), int(dentro.sum())
 
 
-def visualizar_montecarlo(n=1000, seed=42):
+def visualizar_montecarlo(n=1000, seed=42, modo='auto', celdas=800, integrando='semicirculo'):
     """
     Visualiza el método Monte Carlo mostrando los puntos generados.
     Los puntos debajo de la curva se muestran en verde, los de arriba en rojo.
     
     Parámetros:
     - n: Cantidad de puntos aleatorios a generar
-    - seed: Semilla para reproducibilidad
+    - seed: Semilla para reproducibilidad (se usa un generador propio, no el módulo random)
+    - modo: 'puntos' (un punto por muestra), 'densidad' (histograma 2D por bloques,
+      dibujado con imshow; memoria y tiempo de dibujo constantes) o 'auto'
+      (puntos hasta MAX_PUNTOS_DISPERSION, densidad por encima)
+    - celdas: Cantidad de celdas por eje en el modo 'densidad'
+    - integrando: Nombre en integrandos.INTEGRANDOS o diccionario (por defecto el
+      semicírculo); los puntos se sortean en dominio × [0, cota]
     """
-    print(f"\nGenerando visualización del método Monte Carlo (N={n})...")
+    if modo == 'auto':
+        modo = 'puntos' if n <= MAX_PUNTOS_DISPERSION else 'densidad'
+    if modo not in ('puntos', 'densidad'):
+        raise ValueError(f"Modo de visualización desconocido: {modo}")
     
-    # Fijar semilla para reproducibilidad
-    random.seed(seed)
+    # matplotlib se importa recién acá: los métodos de cálculo no lo necesitan
+    import matplotlib.pyplot as plt
     
-    # Generar puntos aleatorios y clasificarlos
-    x_dentro = []
-    y_dentro = []
-    x_fuera = []
-    y_fuera = []
+    print(f"\nGenerando visualización del método Monte Carlo (N={n})...")
     
-    for _ in range(n):
-        x = random.uniform(-1.0, 1.0)
-        y = random.uniform(0.0, 2.0)
-        
-        if -1.0 < x < 1.0:
-            f_x = funcion(x)
-            if y <= f_x:
-                x_dentro.append(x)
-                y_dentro.append(y)
-            else:
-                x_fuera.append(x)
-                y_fuera.append(y)
+    # Generador propio con la semilla, para no tocar el estado global de random
+    rng = np.random.default_rng(seed)
+    
+    nombre = integrando if isinstance(integrando, str) else None
+    integrando = obtener_integrando(integrando)
+    a, b, cota = _caja(integrando)
     
     # Graficar la función continua
-    x_continuo = np.linspace(-1, 1, 1000)
-    y_continuo = [funcion(x) for x in x_continuo]
+    x_continuo = np.linspace(a, b, 1000)
+    y_continuo = evaluar(integrando, x_continuo)
     
+    # El mismo estilo que las gráficas de convergencia (ver renderizado.py)
+    plt.style.use(ESTILO)
     plt.figure(figsize=(12, 8))
     
-    # Dibujar puntos
-    plt.scatter(x_dentro, y_dentro, c='green', s=1, alpha=0.5, label='Puntos debajo de la curva')
-    plt.scatter(x_fuera, y_fuera, c='red', s=1, alpha=0.5, label='Puntos fuera de la curva')
+    if modo == 'puntos':
+        # Generar puntos aleatorios y clasificarlos
+        x = rng.uniform(a, b, n)
+        y = rng.uniform(0.0, cota, n)
+        
+        en_dominio = (x > a) & (x < b)
+        debajo = en_dominio & (y <= evaluar(integrando, x))
+        encima = en_dominio & ~debajo
+        
+        x_dentro, y_dentro = x[debajo], y[debajo]
+        x_fuera, y_fuera = x[encima], y[encima]
+        puntos_dentro = len(x_dentro)
+        
+        # Dibujar puntos
+        plt.scatter(x_dentro, y_dentro, c='green', s=1, alpha=0.5, label='Puntos debajo de la curva')
+        plt.scatter(x_fuera, y_fuera, c='red', s=1, alpha=0.5, label='Puntos fuera de la curva')
+    else:
+        from matplotlib.colors import LogNorm
+        from matplotlib.patches import Patch
+        
+        hist_dentro, hist_fuera, puntos_dentro = histogramas_montecarlo(n, rng, celdas, integrando=integrando)
+        
+        # Cada histograma en su propio mapa de colores; las celdas vacías quedan transparentes
+        for histograma, mapa, etiqueta in ((hist_dentro, 'Greens', 'debajo'), (hist_fuera, 'Reds', 'fuera')):
+            imagen = plt.imshow(np.ma.masked_equal(histograma, 0), cmap=mapa, origin='lower',
+                                extent=(a, b, 0.0, cota), norm=LogNorm(vmin=1, vmax=max(1, histograma.max())),
+                                interpolation='nearest', aspect='auto')
+            plt.colorbar(imagen, fraction=0.04, pad=0.02, label=f'Puntos por celda ({etiqueta})')
+        
+        # imshow no aparece en la leyenda: se agregan parches con los colores
+        plt.gca().add_artist(plt.legend(handles=[Patch(color='green', label='Densidad debajo de la curva'),
+                                                 Patch(color='red', label='Densidad fuera de la curva')],
+                                        fontsize=10, loc='upper left'))
     
     # Dibujar la curva
-    plt.plot(x_continuo, y_continuo, 'b-', linewidth=3, label='f(x) = 2√(1-x²)', zorder=3)
+    plt.plot(x_continuo, y_continuo, 'b-', linewidth=3, label=integrando['nombre'], zorder=3)
     
     # Dibujar el rectángulo de muestreo
-    rect_x = [-1, 1, 1, -1, -1]
-    rect_y = [0, 0, 2, 2, 0]
+    rect_x = [a, b, b, a, a]
+    rect_y = [0, 0, cota, cota, 0]
     plt.plot(rect_x, rect_y, 'k--', linewidth=2, label='Rectángulo de muestreo', alpha=0.7)
     
-    # Calcular aproximación
-    puntos_dentro = len(x_dentro)
-    aproximacion = (puntos_dentro / n) * 4.0
+    # Calcular aproximación (el área del rectángulo es 4 para el semicírculo)
+    aproximacion = (puntos_dentro / n) * ((b - a) * cota)
+    simbolo = 'π' if integrando['valor_exacto'] == math.pi else '∫f'
     
     plt.xlabel('x', fontsize=12)
     plt.ylabel('y', fontsize=12)
     plt.title(f'Visualización del Método Monte Carlo (N={n} puntos)\n' + 
-              f'Puntos dentro: {puntos_dentro} | Aproximación: π ≈ {aproximacion:.6f}', 
+              f'Puntos dentro: {puntos_dentro} | Aproximación: {simbolo} ≈ {aproximacion:.6f}', 
               fontsize=14, fontweight='bold')
     plt.legend(fontsize=10, loc='upper right')
     plt.grid(True, alpha=0.3)
     plt.axis('equal')
     plt.tight_layout()
     
-    nombre_archivo = f'grafica_visualizacion_montecarlo_n{n}.png'
+    sufijo = '' if nombre in (None, 'semicirculo') else f'_{nombre}'
+    nombre_archivo = f'grafica_visualizacion_montecarlo{sufijo}_n{n}.png'
     plt.savefig(nombre_archivo, dpi=300, bbox_inches='tight')
     plt.close()
     print(f"✓ Gráfica guardada: {nombre_archivo}")
-    
-    # Restaurar el generador aleatorio
-    random.seed()
 
 
 # ============================================================================
@@ -427,6 +1557,19 @@ def visualizar_montecarlo(n=1000, seed=42):
 # ============================================================================
 
 if __name__ == "__main__":
+    parser = crear_parser("Ejercicio 4: integración Monte Carlo")
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Semilla raíz para que las tablas y gráficas sean reproducibles')
+    parser.add_argument('--muestreo', choices=['aleatorio'] + list(SECUENCIAS_QMC), default='aleatorio',
+                        help='Puntos pseudoaleatorios o cuasi Monte Carlo (Sobol, Halton) para las tablas y gráficas')
+    parser.add_argument('--estimador', choices=list(ESTIMADORES), default='acierto',
+                        help='Acierto o fallo, o media muestral de 2 f(x), para las tablas y gráficas')
+    parser.add_argument('--prefijos', action='store_true',
+                        help='Un único flujo de max(N) puntos por repetición para todos los N de cada tabla')
+    argumentos = parser.parse_args()
+    jobs, seed = argumentos.jobs, argumentos.seed
+    muestreo, estimador, prefijos = argumentos.muestreo, argumentos.estimador, argumentos.prefijos
+    
     # EJERCICIO 4.1: Prueba inicial del método Monte Carlo
     print("\n")
     print("=" * 80)
@@ -447,37 +1590,108 @@ if __name__ == "__main__":
     print(f"\n{'N':>6} | {'Aproximación':>15} | {'Residuo':>12} | {'Desv. Est.':>12}")
     print("-" * 60)
     
-    for n in n_valores:
-        aproximaciones = [metodo_montecarlo(n) for _ in range(repeticiones)]
-        promedio = sum(aproximaciones) / repeticiones
-        desv_est = math.sqrt(sum((x - promedio)**2 for x in aproximaciones) / repeticiones)
-        residuo = abs(promedio - valor_pi)
-        
+    matriz = matriz_repeticiones(n_valores, repeticiones, jobs, _semilla_derivada(seed, 4), muestreo, estimador)
+    estadisticas = estadisticas_repeticiones(matriz)
+    for n, promedio, residuo, desv_est in zip(n_valores, estadisticas['promedio'],
+                                              estadisticas['residuo'], estadisticas['desv_est']):
         print(f"{n:6d} | {promedio:15.10f} | {residuo:12.10f} | {desv_est:12.10f}")
     
     print("\n" + "=" * 80)
     print(f"Valor de π (referencia): {valor_pi:.10f}")
     print("=" * 80)
     
+    # Monte Carlo secuencial: se detiene al alcanzar la precisión pedida
+    print("\n" + "=" * 80)
+    print("MONTE CARLO SECUENCIAL (INTERVALO DE CONFIANZA DEL 95%)")
+    print("=" * 80)
+    
+    print(f"\n{'Tolerancia':>10} | {'Aproximación':>15} | {'Residuo':>12} | {'Semiancho':>12} | {'Muestras':>12}")
+    print("-" * 75)
+    
+    tolerancias = [1e-1, 1e-2, 1e-3]
+    semillas = _semillas_filas(_semilla_derivada(seed, 5), len(tolerancias))
+    for tol, semilla in zip(tolerancias, semillas):
+        resultado = montecarlo_secuencial(tol, seed=semilla)
+        residuo = abs(resultado['aproximacion'] - valor_pi)
+        
+        print(f"{tol:10.0e} | {resultado['aproximacion']:15.10f} | {residuo:12.10f} | "
+              f"{resultado['semiancho']:12.10f} | {resultado['muestras']:12d}")
+    
+    # Reducción de varianza: comparación de los modos con el mismo N
+    print("\n" + "=" * 80)
+    print("REDUCCIÓN DE VARIANZA (N = 100000)")
+    print("=" * 80)
+    
+    # Factor: respecto del acierto o fallo; Factor media: respecto del modo 'media'
+    print(f"\n{'Modo':>14} | {'Aproximación':>15} | {'Residuo':>12} | {'Error est.':>12} | {'Factor':>12} | {'Factor media':>12}")
+    print("-" * 95)
+    
+    semillas = _semillas_filas(_semilla_derivada(seed, 6), len(MODOS_REDUCCION))
+    resultados = {modo: metodo_montecarlo_reduccion(100000, modo, seed=semilla)
+                  for modo, semilla in zip(MODOS_REDUCCION, semillas)}
+    varianza_media = resultados['media']['varianza']
+    for modo, resultado in resultados.items():
+        residuo = abs(resultado['aproximacion'] - valor_pi)
+        
+        print(f"{modo:>14} | {resultado['aproximacion']:15.10f} | {residuo:12.10f} | "
+              f"{resultado['error_estandar']:12.10f} | {resultado['factor_reduccion']:12.1f} | "
+              f"{varianza_media / resultado['varianza']:12.1f}")
+    
+    # Cuasi Monte Carlo: error estándar a partir de 10 aleatorizaciones
+    print("\n" + "=" * 80)
+    print("CUASI MONTE CARLO (10 ALEATORIZACIONES POR N)")
+    print("=" * 80)
+    
+    print(f"\n{'Sucesión':>8} | {'Estimador':>9} | {'N':>6} | {'Aproximación':>15} | {'Residuo':>12} | {'Error est.':>12}")
+    print("-" * 80)
+    
+    combinaciones = [(secuencia, forma, n) for secuencia in SECUENCIAS_QMC
+                     for forma in ('acierto', 'media') for n in (1000, 10000)]
+    semillas = _semillas_filas(_semilla_derivada(seed, 7), len(combinaciones))
+    for (secuencia, forma, n), semilla in zip(combinaciones, semillas):
+        resultado = montecarlo_qmc_aleatorizado(n, secuencia, forma, seed=semilla)
+        residuo = abs(resultado['aproximacion'] - valor_pi)
+        
+        print(f"{secuencia:>8} | {forma:>9} | {n:6d} | {resultado['aproximacion']:15.10f} | "
+              f"{residuo:12.10f} | {resultado['error_estandar']:12.10f}")
+    
     # EJERCICIO 4.2: Generar tablas comparativas del método Monte Carlo
     print("\n\n")
     print("=" * 80)
     print("EJERCICIO 4.2: TABLAS COMPARATIVAS DEL MÉTODO MONTE CARLO")
     print("=" * 80)
-    generar_tablas_comparativas_montecarlo()
+    # Los barridos se calculan una sola vez y los usan las tablas, el CSV y las gráficas
+    barridos = calcular_barridos_montecarlo(jobs, seed, muestreo, estimador, prefijos)
+    
+    # Las gráficas se empiezan a dibujar en paralelo mientras se escriben las tablas
+    ejecutor = crear_ejecutor_renderizado(jobs)
+    graficas = graficar_convergencia_montecarlo(barridos, seed, ejecutor=ejecutor, esperar=False)
+    
+    generar_tablas_comparativas_montecarlo(barridos)
     
     # Generar también archivo CSV con las tablas
     try:
-        generar_tablas_csv_montecarlo('tablas_montecarlo.csv')
+        generar_tablas_csv_montecarlo('tablas_montecarlo.csv', barridos)
     except PermissionError:
         print("\n⚠ No se pudo generar el archivo CSV (el archivo puede estar abierto en otro programa)")
     
+    # Y en formato columnar (un .npy por columna), para analizar los resultados sin parsear texto
+    try:
+        generar_tablas_columnares_montecarlo('tablas_montecarlo_columnas', barridos)
+    except PermissionError:
+        print("\n⚠ No se pudieron generar los resultados columnares (sin permiso de escritura)")
+    
     # EJERCICIO 4.3: Generar gráficas de convergencia del método Monte Carlo
     print("\n\n")
     print("=" * 80)
     print("EJERCICIO 4.3: GRÁFICAS DE CONVERGENCIA DEL MÉTODO MONTE CARLO")
     print("=" * 80)
-    graficar_convergencia_montecarlo()
+    esperar_figuras(graficas)
+    if ejecutor is not None:
+        ejecutor.shutdown()
+    print("\n" + "=" * 70)
+    print("Todas las gráficas han sido generadas exitosamente")
+    print("=" * 70)
     
     # EJERCICIO 4.4: Visualización del método Monte Carlo
     print("\n\n")
@@ -486,5 +1700,6 @@ if __name__ == "__main__":
     print("=" * 80)
     visualizar_montecarlo(n=1000, seed=42)
     visualizar_montecarlo(n=5000, seed=42)
+    visualizar_montecarlo(n=10_000_000, seed=42)
 
 
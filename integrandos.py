@@ -0,0 +1,183 @@
+import math
+import numpy as np
+
+# ============================================================================
+# Registro de integrandos
+# ============================================================================
+#
+# Los métodos de ej1 a ej4 reciben el integrando por nombre (o como diccionario)
+# en el parámetro integrando=, por defecto el semicírculo de la consigna.
+# Cada integrando es un diccionario con:
+# - 'nombre': Descripción para mostrar, por ejemplo 'f(x) = 2√(1-x²)'
+# - 'escalar': f(x) para un float
+# - 'vectorizada': f(x) sobre un arreglo de NumPy (None si no hay); los métodos
+#   la usan siempre que existe
+# - 'dominio': Intervalo de integración (a, b)
+# - 'puntos_singulares': Puntos donde f o sus derivadas no son suaves
+# - 'simetria': 'par' o 'impar' respecto del punto medio del dominio, o None
+# - 'tramos_monotonos': Intervalos (a, b) consecutivos donde f es monótona, o
+#   None si no se conocen (las sumas de Darboux los necesitan)
+# - 'valor_exacto': Valor de la integral, o None si no se conoce
+# - 'cota': Máximo de f en el dominio, o None (acierto o fallo la necesita)
+#
+# Los integrandos del registro se guardan en la caché en disco por su nombre;
+# los que se pasan como diccionario se calculan siempre.
+
+
+def _semicirculo(x):
+    return 2 * (math.sqrt(1 - (x**2)))
+
+
+def _semicirculo_vectorizada(x):
+    # Se recorta 1 - x² a 0 para que el redondeo en los extremos no dé negativos
+    return 2.0 * np.sqrt(np.clip(1.0 - x * x, 0.0, None))
+
+
+def _cuarto_circulo(x):
+    return math.sqrt(1 - (x**2))
+
+
+def _cuarto_circulo_vectorizada(x):
+    return np.sqrt(np.clip(1.0 - x * x, 0.0, None))
+
+
+def _gaussiana(x):
+    return math.exp(-x * x)
+
+
+def _gaussiana_vectorizada(x):
+    return np.exp(-x * x)
+
+
+def _seno_vectorizada(x):
+    return np.sin(x)
+
+
+INTEGRANDOS = {}
+
+
+def registrar_integrando(nombre, escalar, vectorizada=None, dominio=(-1.0, 1.0), puntos_singulares=(),
+                         simetria=None, tramos_monotonos=None, valor_exacto=None, cota=None, descripcion=None):
+    """
+    Agrega un integrando al registro (o reemplaza el que tenga el mismo nombre).
+
+    Parámetros:
+    - nombre: Clave del registro, la que se pasa en integrando=
+    - escalar, vectorizada, dominio, ...: Campos del integrando (ver el comentario del módulo)
+    - descripcion: Texto para mostrar (por defecto el nombre)
+
+    Retorna:
+    - Diccionario del integrando
+    """
+    a, b = float(dominio[0]), float(dominio[1])
+    if not a < b:
+        raise ValueError(f"Dominio inválido para {nombre}: {dominio}")
+    if simetria not in (None, 'par', 'impar'):
+        raise ValueError(f"Simetría desconocida: {simetria}")
+
+    if tramos_monotonos is not None:
+        tramos_monotonos = tuple((float(inicio), float(fin)) for inicio, fin in tramos_monotonos)
+        bordes = [tramos_monotonos[0][0]] + [fin for _, fin in tramos_monotonos]
+        contiguos = all(inicio == fin for (_, fin), (inicio, _) in zip(tramos_monotonos, tramos_monotonos[1:]))
+        if bordes[0] != a or bordes[-1] != b or not contiguos:
+            raise ValueError(f"Los tramos monótonos de {nombre} tienen que cubrir {dominio} sin huecos")
+
+    integrando = {
+        'nombre': descripcion or nombre,
+        'escalar': escalar,
+        'vectorizada': vectorizada,
+        'dominio': (a, b),
+        'puntos_singulares': tuple(float(p) for p in puntos_singulares),
+        'simetria': simetria,
+        'tramos_monotonos': tramos_monotonos,
+        'valor_exacto': valor_exacto,
+        'cota': cota,
+    }
+    INTEGRANDOS[nombre] = integrando
+
+    return integrando
+
+
+registrar_integrando('semicirculo', _semicirculo, _semicirculo_vectorizada, dominio=(-1.0, 1.0),
+                     puntos_singulares=(-1.0, 1.0), simetria='par', tramos_monotonos=((-1.0, 0.0), (0.0, 1.0)),
+                     valor_exacto=math.pi, cota=2.0, descripcion='f(x) = 2√(1-x²)')
+registrar_integrando('cuarto_circulo', _cuarto_circulo, _cuarto_circulo_vectorizada, dominio=(0.0, 1.0),
+                     puntos_singulares=(1.0,), tramos_monotonos=((0.0, 1.0),),
+                     valor_exacto=math.pi / 4.0, cota=1.0, descripcion='f(x) = √(1-x²)')
+registrar_integrando('gaussiana', _gaussiana, _gaussiana_vectorizada, dominio=(-1.0, 1.0),
+                     simetria='par', tramos_monotonos=((-1.0, 0.0), (0.0, 1.0)),
+                     valor_exacto=math.sqrt(math.pi) * math.erf(1.0), cota=1.0, descripcion='f(x) = e^(-x²)')
+registrar_integrando('seno', math.sin, _seno_vectorizada, dominio=(0.0, math.pi),
+                     simetria='par', tramos_monotonos=((0.0, math.pi / 2.0), (math.pi / 2.0, math.pi)),
+                     valor_exacto=2.0, cota=1.0, descripcion='f(x) = sen(x)')
+
+
+def obtener_integrando(integrando):
+    """
+    Devuelve el diccionario de un integrando.
+
+    Parámetros:
+    - integrando: Nombre en INTEGRANDOS o un diccionario armado con registrar_integrando
+
+    Retorna:
+    - Diccionario del integrando
+    """
+    if isinstance(integrando, dict):
+        return integrando
+    if integrando not in INTEGRANDOS:
+        raise ValueError(f"Integrando desconocido: {integrando}")
+    return INTEGRANDOS[integrando]
+
+
+def evaluar(integrando, x):
+    """
+    Evalúa el integrando sobre un arreglo, con su versión vectorizada si la tiene
+    y si no punto por punto con la escalar.
+
+    Parámetros:
+    - integrando: Diccionario del integrando (ver obtener_integrando)
+    - x: Arreglo de NumPy
+
+    Retorna:
+    - Arreglo de float64 con la forma de x
+    """
+    if integrando['vectorizada'] is not None:
+        return integrando['vectorizada'](x)
+
+    x = np.asarray(x, dtype=np.float64)
+    valores = np.fromiter(map(integrando['escalar'], x.ravel().tolist()), dtype=np.float64, count=x.size)
+    return valores.reshape(x.shape)
+
+
+def puntos_de_giro(integrando):
+    """
+    Bordes interiores de los tramos monótonos: los únicos puntos donde f puede
+    tener un máximo o un mínimo local.
+
+    Retorna:
+    - Tupla ordenada de puntos
+    """
+    tramos = integrando['tramos_monotonos']
+    if tramos is None:
+        raise ValueError(f"El integrando {integrando['nombre']} no declara sus tramos monótonos")
+    return tuple(fin for _, fin in tramos[:-1])
+
+
+def integrando_cacheable(argumentos):
+    """
+    Para el parámetro cacheable de memoizar_en_disco: solo los integrandos del
+    registro (pasados por nombre) tienen una clave estable en la caché.
+    """
+    return isinstance(argumentos.get('integrando'), str)
+
+
+def ruta_escalar_cacheable(argumentos):
+    """
+    Como integrando_cacheable, pero solo cuando el método recorre la partición
+    con la versión escalar de f: con la vectorizada el cálculo tarda menos que
+    la consulta a la caché. Los métodos con parámetro vectorizado usan la ruta
+    escalar si es False; los que no lo tienen, siempre que no hay vectorizada.
+    """
+    if not integrando_cacheable(argumentos):
+        return False
+    return obtener_integrando(argumentos['integrando'])['vectorizada'] is None or not argumentos.get('vectorizado', True)
@@ -0,0 +1,117 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# ============================================================================
+# Presupuesto de tiempo de importación de los ejercicios
+# ============================================================================
+#
+# Los métodos de integración se llaman también desde scripts cortos, donde el
+# tiempo de arranque es casi todo el tiempo de ejecución. Por eso importar un
+# ejercicio no debe cargar matplotlib (lo importan recién las funciones
+# graficar_* y visualizar_*) y tiene que entrar en el presupuesto de abajo.
+#
+# Cada módulo se importa en un intérprete nuevo con "python -X importtime"
+# y se toma el tiempo acumulado de su importación (sin el arranque del
+# intérprete), el mínimo de varias mediciones. numpy se importa siempre porque
+# lo usan los métodos vectorizados, y es la mayor parte del presupuesto.
+#
+# Uso: python presupuesto_importacion.py [--repeticiones 5] [--factor 1.0]
+# Termina con código 1 si algún módulo se pasa del presupuesto o carga un
+# paquete prohibido.
+
+# Presupuesto en milisegundos del tiempo acumulado de importación
+PRESUPUESTOS_MS = {
+    'ej1': 250,
+    'tarea1': 250,
+    'ej2': 250,
+    'ej3': 250,
+    'ej4': 300,
+}
+
+# Paquetes que no se pueden cargar al importar un ejercicio
+MODULOS_PROHIBIDOS = ('matplotlib',)
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+
+def medir_importacion(modulo):
+    """
+    Importa un módulo en un intérprete nuevo y mide el tiempo de importación.
+
+    Parámetros:
+    - modulo: Nombre del módulo (por ejemplo 'ej1')
+
+    Retorna:
+    - (milisegundos, lista de paquetes prohibidos que quedaron cargados)
+    """
+    codigo = (f"import sys, {modulo}; "
+              f"print(','.join(sorted({{m.split('.')[0] for m in sys.modules}} & set({MODULOS_PROHIBIDOS!r}))))")
+    resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo],
+                               cwd=DIRECTORIO, capture_output=True, text=True, check=True)
+
+    # Líneas de la forma "import time: propio | acumulado | módulo" (en microsegundos)
+    microsegundos = None
+    for linea in resultado.stderr.splitlines():
+        partes = linea.split('|')
+        if len(partes) == 3 and partes[2].strip() == modulo:
+            microsegundos = int(partes[1])
+    if microsegundos is None:
+        raise RuntimeError(f"No se encontró la importación de {modulo} en la salida de -X importtime")
+
+    cargados = [nombre for nombre in resultado.stdout.strip().split(',') if nombre]
+    return microsegundos / 1000.0, cargados
+
+
+def verificar_presupuesto(repeticiones=5, factor=1.0):
+    """
+    Mide todos los módulos de PRESUPUESTOS_MS y los compara con su presupuesto.
+
+    Parámetros:
+    - repeticiones: Cantidad de mediciones por módulo (se toma la mínima)
+    - factor: Multiplica los presupuestos (por ejemplo 2.0 en una máquina lenta)
+
+    Retorna:
+    - Lista de diccionarios con modulo, ms, presupuesto_ms, prohibidos y cumple
+    """
+    resultados = []
+
+    for modulo, presupuesto in PRESUPUESTOS_MS.items():
+        mediciones = [medir_importacion(modulo) for _ in range(repeticiones)]
+        ms = min(medicion[0] for medicion in mediciones)
+        prohibidos = sorted({nombre for _, cargados in mediciones for nombre in cargados})
+        presupuesto_ms = presupuesto * factor
+
+        resultados.append({'modulo': modulo, 'ms': ms, 'presupuesto_ms': presupuesto_ms,
+                           'prohibidos': prohibidos, 'cumple': ms <= presupuesto_ms and not prohibidos})
+
+    return resultados
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Presupuesto de tiempo de importación de los ejercicios")
+    parser.add_argument('--repeticiones', type=int, default=5,
+                        help='Mediciones por módulo; se informa la mínima (por defecto 5)')
+    parser.add_argument('--factor', type=float, default=1.0,
+                        help='Factor que multiplica los presupuestos (por defecto 1.0)')
+    argumentos = parser.parse_args()
+
+    print("=" * 70)
+    print("PRESUPUESTO DE TIEMPO DE IMPORTACIÓN")
+    print("=" * 70)
+    print(f"\n{'Módulo':>8} | {'Tiempo (ms)':>12} | {'Presupuesto':>12} | {'Prohibidos':>12} | {'Estado':>6}")
+    print("-" * 65)
+
+    resultados = verificar_presupuesto(argumentos.repeticiones, argumentos.factor)
+    for resultado in resultados:
+        prohibidos = ','.join(resultado['prohibidos']) or '-'
+        estado = 'OK' if resultado['cumple'] else 'FALLA'
+        print(f"{resultado['modulo']:>8} | {resultado['ms']:12.1f} | {resultado['presupuesto_ms']:12.1f} | "
+              f"{prohibidos[:12]:>12} | {estado:>6}")
+
+    if not all(resultado['cumple'] for resultado in resultados):
+        print("\n⚠ Hay módulos fuera del presupuesto de importación")
+        sys.exit(1)
+
+    print("\n✓ Todos los módulos están dentro del presupuesto")
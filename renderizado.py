@@ -0,0 +1,288 @@
+import time
+import numpy as np
+
+# ============================================================================
+# Renderizado de gráficas a partir de especificaciones declarativas
+# ============================================================================
+#
+# Las funciones graficar_* de cada ejercicio no dibujan: arman una lista de
+# figuras descritas con diccionarios (datos y estilo) y las envían acá. Cada
+# figura se dibuja con una Figure propia sobre el lienzo Agg (sin pyplot ni
+# ventanas), así que se puede dibujar en otro proceso. Con un ejecutor las
+# figuras se rasterizan en paralelo mientras el proceso principal sigue
+# calculando; sin ejecutor se dibujan en el proceso actual al esperarlas.
+#
+# Una figura es un diccionario con:
+# - 'archivo': nombre del PNG
+# - 'tamano': (ancho, alto) en pulgadas
+# - 'series': lista de series (ver abajo)
+# - 'titulo', 'xlabel', 'ylabel': textos de los ejes
+# - 'leyenda': argumentos de legend (None = sin leyenda)
+# - 'grilla': argumentos de grid (None = sin grilla)
+# - 'escala_y': 'linear' o 'log'
+# - 'ejes_iguales': si es True, misma escala en x e y
+# - 'estilo': estilo de matplotlib, 'dpi' y 'guardar' (argumentos extra de savefig)
+#
+# Una serie es un diccionario con 'tipo' y sus datos, más 'opciones' (argumentos
+# de matplotlib):
+# - 'linea': 'x', 'y', 'formato'                (Axes.plot)
+# - 'error': 'x', 'y', 'yerr', 'formato'        (Axes.errorbar)
+# - 'barras': 'x', 'altura', 'ancho'            (Axes.bar, con arreglos)
+# - 'rectangulos': 'izquierda', 'derecha', 'altura' (una sola PolyCollection)
+# - 'dispersion': 'x', 'y'                      (Axes.scatter)
+
+ESTILO = 'seaborn-v0_8-darkgrid'
+DPI = 300
+
+
+def linea(x, y, formato='', **opciones):
+    """
+    Serie de tipo línea (equivale a plt.plot(x, y, formato, **opciones)).
+    """
+    return {'tipo': 'linea', 'x': x, 'y': y, 'formato': formato, 'opciones': opciones}
+
+
+def error(x, y, yerr, formato='', **opciones):
+    """
+    Serie con barras de error (equivale a plt.errorbar(x, y, yerr=yerr, fmt=formato, **opciones)).
+    """
+    return {'tipo': 'error', 'x': x, 'y': y, 'yerr': yerr, 'formato': formato, 'opciones': opciones}
+
+
+def barras(x, altura, ancho, **opciones):
+    """
+    Serie de barras dibujadas con una sola llamada (x, altura y ancho son arreglos).
+    """
+    return {'tipo': 'barras', 'x': x, 'altura': altura, 'ancho': ancho, 'opciones': opciones}
+
+
+def rectangulos(izquierda, derecha, altura, **opciones):
+    """
+    Serie de rectángulos apoyados en y = 0, dibujados como una única PolyCollection
+    (un solo artista sin importar cuántos sean). Las opciones son las de
+    PolyCollection: facecolor, edgecolor, alpha, zorder, label...
+    """
+    return {'tipo': 'rectangulos', 'izquierda': izquierda, 'derecha': derecha, 'altura': altura,
+            'opciones': opciones}
+
+
+def diezmar_rectangulos(nodos, altura, max_rectangulos):
+    """
+    Reduce los rectángulos de una partición a lo sumo a max_rectangulos, uniendo
+    los contiguos que caen en la misma columna de una grilla de max_rectangulos
+    columnas sobre [nodos[0], nodos[-1]] (la resolución de la imagen). Cada
+    rectángulo unido tiene como altura el promedio de las alturas ponderado por
+    el ancho, así el área total no cambia. Los subintervalos más anchos que una
+    columna quedan como están.
+
+    Parámetros:
+    - nodos: Puntos ordenados de la partición (n puntos, n - 1 rectángulos)
+    - altura: Altura de cada rectángulo (n - 1 valores)
+    - max_rectangulos: Cantidad máxima de rectángulos a dibujar
+
+    Retorna:
+    - (izquierda, derecha, altura) como arreglos de NumPy
+    """
+    nodos = np.asarray(nodos, dtype=np.float64)
+    altura = np.asarray(altura, dtype=np.float64)
+    izquierda, derecha = nodos[:-1], nodos[1:]
+
+    if len(altura) <= max_rectangulos:
+        return izquierda, derecha, altura
+
+    # Columna de cada subintervalo según su extremo izquierdo; como los nodos están
+    # ordenados, los subintervalos de una misma columna son contiguos
+    escala = max_rectangulos / (nodos[-1] - nodos[0])
+    columna = np.minimum(((izquierda - nodos[0]) * escala).astype(np.int64), max_rectangulos - 1)
+    inicios = np.flatnonzero(np.diff(columna, prepend=-1))
+    finales = np.append(inicios[1:], len(altura)) - 1
+
+    area = np.add.reduceat(altura * (derecha - izquierda), inicios)
+    izquierda, derecha = izquierda[inicios], derecha[finales]
+    ancho = derecha - izquierda
+
+    return izquierda, derecha, np.divide(area, ancho, out=np.zeros_like(area), where=ancho > 0)
+
+
+def dispersion(x, y, **opciones):
+    """
+    Serie de puntos sueltos (equivale a plt.scatter(x, y, **opciones)).
+    """
+    return {'tipo': 'dispersion', 'x': x, 'y': y, 'opciones': opciones}
+
+
+def figura(archivo, tamano, series, titulo='', xlabel='', ylabel='', leyenda=None, grilla=None,
+           escala_y='linear', ejes_iguales=False, estilo=ESTILO, dpi=DPI, guardar=None):
+    """
+    Arma la especificación de una figura con un único par de ejes.
+    Los títulos usan fontsize=14 en negrita y las etiquetas fontsize=12,
+    como en las gráficas de los ejercicios.
+
+    Retorna:
+    - Diccionario con la especificación (ver el comentario del módulo)
+    """
+    return {
+        'archivo': archivo,
+        'tamano': tamano,
+        'series': series,
+        'titulo': titulo,
+        'xlabel': xlabel,
+        'ylabel': ylabel,
+        'leyenda': leyenda,
+        'grilla': grilla,
+        'escala_y': escala_y,
+        'ejes_iguales': ejes_iguales,
+        'estilo': estilo,
+        'dpi': dpi,
+        'guardar': guardar or {},
+    }
+
+
+def _dibujar_serie(ejes, serie):
+    """
+    Dibuja una serie sobre los ejes según su tipo.
+    """
+    tipo = serie['tipo']
+    opciones = serie.get('opciones', {})
+
+    if tipo == 'linea':
+        ejes.plot(serie['x'], serie['y'], serie.get('formato', ''), **opciones)
+    elif tipo == 'error':
+        ejes.errorbar(serie['x'], serie['y'], yerr=serie['yerr'], fmt=serie.get('formato', ''), **opciones)
+    elif tipo == 'barras':
+        ejes.bar(serie['x'], serie['altura'], width=serie['ancho'], **opciones)
+    elif tipo == 'rectangulos':
+        from matplotlib.collections import PolyCollection
+
+        izquierda = np.asarray(serie['izquierda'], dtype=np.float64)
+        derecha = np.asarray(serie['derecha'], dtype=np.float64)
+        altura = np.asarray(serie['altura'], dtype=np.float64)
+        cero = np.zeros_like(altura)
+
+        # Vértices (k, 4, 2): abajo-izquierda, arriba-izquierda, arriba-derecha, abajo-derecha
+        vertices = np.stack([np.column_stack([izquierda, izquierda, derecha, derecha]),
+                             np.column_stack([cero, altura, altura, cero])], axis=-1)
+        coleccion = PolyCollection(vertices, **opciones)
+        # Como en Axes.bar, el eje y no agrega margen por debajo de la base
+        coleccion.sticky_edges.y.append(0.0)
+        ejes.add_collection(coleccion)
+        ejes.autoscale_view()
+    elif tipo == 'dispersion':
+        ejes.scatter(serie['x'], serie['y'], **opciones)
+    else:
+        raise ValueError(f"Tipo de serie desconocido: {tipo}")
+
+
+def renderizar_figura(especificacion):
+    """
+    Dibuja una figura y la guarda como PNG. Usa Figure y el lienzo Agg
+    directamente, así no depende del backend de pyplot ni de su estado global.
+
+    Parámetros:
+    - especificacion: Diccionario armado con figura()
+
+    Retorna:
+    - (nombre del archivo, segundos que tardó el dibujo y el guardado)
+    """
+    import matplotlib.style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    inicio = time.perf_counter()
+
+    with matplotlib.style.context(especificacion['estilo'] or 'default'):
+        fig = Figure(figsize=especificacion['tamano'])
+        FigureCanvasAgg(fig)
+        ejes = fig.add_subplot()
+
+        for serie in especificacion['series']:
+            _dibujar_serie(ejes, serie)
+
+        if especificacion['escala_y'] != 'linear':
+            ejes.set_yscale(especificacion['escala_y'])
+        ejes.set_xlabel(especificacion['xlabel'], fontsize=12)
+        ejes.set_ylabel(especificacion['ylabel'], fontsize=12)
+        ejes.set_title(especificacion['titulo'], fontsize=14, fontweight='bold')
+        if especificacion['leyenda'] is not None:
+            ejes.legend(**especificacion['leyenda'])
+        if especificacion['grilla'] is not None:
+            ejes.grid(True, **especificacion['grilla'])
+        if especificacion['ejes_iguales']:
+            ejes.axis('equal')
+
+        fig.tight_layout()
+        fig.savefig(especificacion['archivo'], dpi=especificacion['dpi'], **especificacion['guardar'])
+
+    return especificacion['archivo'], time.perf_counter() - inicio
+
+
+def crear_ejecutor_renderizado(jobs):
+    """
+    Crea el pool de procesos para dibujar figuras en paralelo.
+
+    Parámetros:
+    - jobs: Cantidad de procesos (con 1 o menos no se crea pool)
+
+    Retorna:
+    - ProcessPoolExecutor, o None para dibujar en el proceso actual
+    """
+    if jobs is None or jobs <= 1:
+        return None
+
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=jobs)
+
+
+def enviar_figuras(figuras, ejecutor=None):
+    """
+    Envía las figuras a dibujar. Con ejecutor empiezan a dibujarse enseguida en
+    otros procesos; sin ejecutor se dibujan recién en esperar_figuras.
+
+    Parámetros:
+    - figuras: Lista de especificaciones
+    - ejecutor: Resultado de crear_ejecutor_renderizado (opcional)
+
+    Retorna:
+    - Lista de pendientes para esperar_figuras
+    """
+    if ejecutor is None:
+        return list(figuras)
+    return [ejecutor.submit(renderizar_figura, especificacion) for especificacion in figuras]
+
+
+def esperar_figuras(pendientes):
+    """
+    Espera a que se terminen de dibujar las figuras e informa el tiempo de cada una.
+
+    Parámetros:
+    - pendientes: Resultado de enviar_figuras
+
+    Retorna:
+    - Lista de (nombre del archivo, segundos), en el orden en que se enviaron
+    """
+    tiempos = []
+
+    for pendiente in pendientes:
+        if isinstance(pendiente, dict):
+            archivo, segundos = renderizar_figura(pendiente)
+        else:
+            archivo, segundos = pendiente.result()
+
+        print(f"✓ Gráfica guardada: {archivo} ({segundos:.2f} s)")
+        tiempos.append((archivo, segundos))
+
+    return tiempos
+
+
+def renderizar_figuras(figuras, ejecutor=None):
+    """
+    Dibuja las figuras (en paralelo si hay ejecutor) y espera a que terminen.
+
+    Parámetros:
+    - figuras: Lista de especificaciones
+    - ejecutor: Resultado de crear_ejecutor_renderizado (opcional)
+
+    Retorna:
+    - Lista de (nombre del archivo, segundos)
+    """
+    return esperar_figuras(enviar_figuras(figuras, ejecutor))
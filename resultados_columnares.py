@@ -0,0 +1,163 @@
+import json
+import math
+import os
+import numpy as np
+
+# ============================================================================
+# Resultados de los barridos en columnas binarias (.npy)
+# ============================================================================
+#
+# Los CSV de las tablas son para leer: mezclan títulos con los datos y guardan
+# los números como texto. Para analizar barridos grandes los mismos resultados
+# se escriben también en formato columnar: un directorio con un archivo .npy
+# por columna y un esquema.json que los describe. Cada columna se puede abrir con np.load(..., mmap_mode='r'), así
+# que leer un barrido de millones de filas no obliga a cargarlo ni a parsearlo.
+#
+# Hay una fila por (tabla, N, método), con las columnas de COLUMNAS:
+# - 'tabla': Número de tabla (1, 2, 3)
+# - 'n': Tamaño de la partición o cantidad de puntos
+# - 'metodo': Índice del método en esquema['metodos']
+# - 'estimacion': Aproximación (el promedio de las repeticiones en Monte Carlo)
+# - 'residuo': |estimación - valor exacto|
+# - 'desv_est': Desviación estándar entre repeticiones (NaN si el método es determinista)
+# - 'tiempo': Segundos que tardó la fila del barrido, la misma para todos los
+#   métodos de un N porque se calculan juntos (NaN si no se midió o si la fila
+#   salió de la caché en disco)
+#
+# Ningún archivo se reescribe en su lugar: cada columna y el esquema se
+# escriben en un archivo temporal que después reemplaza al anterior con
+# os.replace. Así un lector que tiene una columna vieja mapeada en memoria la
+# sigue viendo entera (np.save sobre el mismo archivo lo truncaría debajo del
+# mapeo), y nunca se lee una columna a medio escribir. El esquema va al final.
+
+COLUMNAS = (
+    ('tabla', np.int16),
+    ('n', np.int64),
+    ('metodo', np.int16),
+    ('estimacion', np.float64),
+    ('residuo', np.float64),
+    ('desv_est', np.float64),
+    ('tiempo', np.float64),
+)
+
+ARCHIVO_ESQUEMA = 'esquema.json'
+
+
+def _reemplazar_npy(ruta, valores):
+    """
+    Escribe un .npy en un archivo temporal y lo pone en lugar de ruta de una vez.
+    """
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as archivo:
+        np.save(archivo, valores, allow_pickle=False)
+    os.replace(temporal, ruta)
+
+
+def guardar_columnas(directorio, columnas, metadatos=None):
+    """
+    Escribe cada columna en su propio .npy y el esquema que las describe.
+
+    Parámetros:
+    - directorio: Directorio de salida (se crea si no existe)
+    - columnas: Diccionario nombre -> arreglo; todos con la misma cantidad de filas
+    - metadatos: Diccionario serializable en JSON que se agrega al esquema (opcional)
+
+    Retorna:
+    - Diccionario del esquema escrito
+    """
+    columnas = {nombre: np.ascontiguousarray(valores) for nombre, valores in columnas.items()}
+    filas = {len(valores) for valores in columnas.values()}
+    if len(filas) > 1:
+        raise ValueError(f"Las columnas tienen distinta cantidad de filas: {sorted(filas)}")
+
+    os.makedirs(directorio, exist_ok=True)
+
+    esquema = {'filas': filas.pop() if filas else 0, 'columnas': []}
+    for nombre, valores in columnas.items():
+        archivo = f'{nombre}.npy'
+        _reemplazar_npy(os.path.join(directorio, archivo), valores)
+        esquema['columnas'].append({'nombre': nombre, 'dtype': valores.dtype.str, 'archivo': archivo})
+    esquema.update(metadatos or {})
+
+    temporal = os.path.join(directorio, ARCHIVO_ESQUEMA + '.tmp')
+    with open(temporal, 'w', encoding='utf-8') as archivo:
+        json.dump(esquema, archivo, ensure_ascii=False, indent=2)
+    os.replace(temporal, os.path.join(directorio, ARCHIVO_ESQUEMA))
+
+    return esquema
+
+
+def leer_columnas(directorio, mmap_mode='r'):
+    """
+    Abre las columnas de un directorio escrito con guardar_columnas.
+
+    Parámetros:
+    - directorio: Directorio con esquema.json y los .npy
+    - mmap_mode: Modo de np.load (por defecto 'r', mapeo en memoria de solo
+      lectura; None para cargar las columnas completas)
+
+    Retorna:
+    - (diccionario nombre -> arreglo, esquema)
+    """
+    with open(os.path.join(directorio, ARCHIVO_ESQUEMA), encoding='utf-8') as archivo:
+        esquema = json.load(archivo)
+
+    columnas = {}
+    for columna in esquema['columnas']:
+        valores = np.load(os.path.join(directorio, columna['archivo']), mmap_mode=mmap_mode, allow_pickle=False)
+        if valores.dtype.str != columna['dtype'] or len(valores) != esquema['filas']:
+            raise ValueError(f"La columna {columna['nombre']} no coincide con el esquema de {directorio}")
+        columnas[columna['nombre']] = valores
+
+    return columnas, esquema
+
+
+def columnas_barridos(barridos, metodos):
+    """
+    Pasa los barridos de las tablas (diccionarios de listas) a las columnas de
+    COLUMNAS, una fila por (tabla, N, método).
+
+    Parámetros:
+    - barridos: Lista de barridos, uno por tabla y en el orden de las tablas
+    - metodos: Diccionario nombre -> (clave de la estimación, clave del residuo,
+      clave de la desviación estándar o None) dentro de cada barrido
+
+    Retorna:
+    - Diccionario nombre -> arreglo, con los tipos de COLUMNAS
+    """
+    partes = {nombre: [] for nombre, _ in COLUMNAS}
+
+    for numero_tabla, barrido in enumerate(barridos, start=1):
+        n_valores = np.asarray(barrido['n'], dtype=np.int64)
+        sin_dato = np.full(len(n_valores), math.nan)
+        tiempos = np.asarray(barrido.get('tiempo', sin_dato), dtype=np.float64)
+
+        for indice, (clave_estimacion, clave_residuo, clave_desv_est) in enumerate(metodos.values()):
+            partes['tabla'].append(np.full(len(n_valores), numero_tabla))
+            partes['n'].append(n_valores)
+            partes['metodo'].append(np.full(len(n_valores), indice))
+            partes['estimacion'].append(barrido[clave_estimacion])
+            partes['residuo'].append(barrido[clave_residuo])
+            partes['desv_est'].append(sin_dato if clave_desv_est is None else barrido[clave_desv_est])
+            partes['tiempo'].append(tiempos)
+
+    return {nombre: np.concatenate(partes[nombre]).astype(tipo) if partes[nombre] else np.empty(0, dtype=tipo)
+            for nombre, tipo in COLUMNAS}
+
+
+def guardar_barridos(directorio, barridos, metodos, metadatos=None):
+    """
+    Escribe los barridos de las tablas en formato columnar.
+
+    Parámetros:
+    - directorio: Directorio de salida
+    - barridos: Lista de barridos, uno por tabla
+    - metodos: Ver columnas_barridos; sus nombres quedan en esquema['metodos']
+    - metadatos: Diccionario extra para el esquema (opcional)
+
+    Retorna:
+    - Diccionario del esquema escrito
+    """
+    rangos = [[barrido['n_inicio'], barrido['n_fin'], barrido['incremento']] for barrido in barridos]
+    return guardar_columnas(directorio, columnas_barridos(barridos, metodos),
+                            {'metodos': list(metodos), 'tablas': rangos, **(metadatos or {})})
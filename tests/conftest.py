@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Las pruebas no leen ni escriben la caché en disco (ver cache_resultados.py)
+os.environ['CACHE_INTEGRALES_DESACTIVADA'] = '1'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,24 @@
+import ej1
+import ej3
+from barrido_paralelo import ejecutar_en_paralelo, ejecutar_grillas
+
+
+def _cuadrado(x):
+    return x * x
+
+
+def test_resultados_en_el_orden_de_los_argumentos():
+    argumentos = [3, 1, 4, 1, 5, 9, 2, 6]
+    esperado = [x * x for x in argumentos]
+
+    assert ejecutar_en_paralelo(_cuadrado, argumentos, jobs=3, costo=lambda x: x) == esperado
+    assert ejecutar_grillas(_cuadrado, [argumentos[:3], argumentos[3:]], jobs=3) == [esperado[:3], esperado[3:]]
+
+
+def test_barridos_no_dependen_de_jobs():
+    for calcular in (ej1.calcular_barridos, ej3.calcular_barridos_metodos):
+        secuencial = calcular(1)
+        paralelo = calcular(4)
+        for barrido_secuencial, barrido_paralelo in zip(secuencial, paralelo):
+            assert barrido_secuencial.pop('tiempo') and barrido_paralelo.pop('tiempo')
+            assert barrido_secuencial == barrido_paralelo
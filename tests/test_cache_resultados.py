@@ -0,0 +1,123 @@
+import importlib
+import math
+import os
+
+import pytest
+
+import cache_resultados
+from barrido_paralelo import ejecutar_en_paralelo
+from cache_resultados import contadores_cache, guardar_accesos, memoizar_en_disco
+
+llamadas = []
+
+
+def _contar(n, seed=None):
+    llamadas.append((n, seed))
+    return n, n * n
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv('CACHE_INTEGRALES_DESACTIVADA')
+    monkeypatch.setattr(cache_resultados, 'ARCHIVO_CACHE', str(tmp_path / 'cache.sqlite'))
+    monkeypatch.setattr(cache_resultados, '_conexion', None)
+    monkeypatch.setattr(cache_resultados, '_accesos_pendientes', {})
+    monkeypatch.setattr(cache_resultados, '_inserciones_sin_desalojo', 0)
+    llamadas.clear()
+    yield
+    if cache_resultados._conexion is not None:
+        cache_resultados._conexion.close()
+    monkeypatch.setattr(cache_resultados, '_conexion', None)
+
+
+def test_segunda_llamada_sale_de_la_cache(cache):
+    memoizada = memoizar_en_disco(version=1)(_contar)
+
+    antes = contadores_cache()
+    assert memoizada(5) == memoizada(5) == (5, 25)
+    despues = contadores_cache()
+
+    assert llamadas == [(5, None)]
+    assert despues['calculos'] - antes['calculos'] == 1 and despues['aciertos'] - antes['aciertos'] == 1
+
+
+def test_cambiar_la_version_recalcula(cache):
+    memoizar_en_disco(version=1)(_contar)(5)
+    memoizar_en_disco(version=2)(_contar)(5)
+
+    assert llamadas == [(5, None), (5, None)]
+
+
+def test_no_cacheable_siempre_recalcula(cache):
+    memoizada = memoizar_en_disco(version=1, cacheable=lambda argumentos: argumentos['seed'] is not None)(_contar)
+    memoizada(5)
+    memoizada(5)
+    memoizada(5, seed=1)
+    memoizada(5, seed=1)
+
+    assert llamadas == [(5, None), (5, None), (5, 1)]
+
+
+def _ultimo_acceso():
+    return dict(cache_resultados._obtener_conexion().execute("SELECT clave, ultimo_acceso FROM resultados").fetchall())
+
+
+def test_los_aciertos_no_escriben_hasta_guardar_los_accesos(cache):
+    memoizada = memoizar_en_disco(version=1)(_contar)
+    memoizada(5)
+    antes = _ultimo_acceso()
+
+    memoizada(5)
+    assert _ultimo_acceso() == antes
+
+    guardar_accesos()
+    despues = _ultimo_acceso()
+    assert despues.keys() == antes.keys() and all(despues[clave] > antes[clave] for clave in antes)
+
+
+def test_desalojo_cada_k_inserciones(cache, monkeypatch):
+    monkeypatch.setattr(cache_resultados, 'MAX_ENTRADAS', 3)
+    monkeypatch.setattr(cache_resultados, 'INSERCIONES_POR_DESALOJO', 5)
+    memoizada = memoizar_en_disco(version=1)(_contar)
+
+    for n in range(4):
+        memoizada(n)
+    assert len(_ultimo_acceso()) == 4
+
+    memoizada(4)
+    assert len(_ultimo_acceso()) == 3
+
+
+def test_trabajo_desde_la_cache_no_tiene_tiempo(cache):
+    memoizada = memoizar_en_disco(version=1)(_contar)
+
+    _, calculado = ejecutar_en_paralelo(memoizada, [5, 6], cronometrar=True)
+    _, desde_cache = ejecutar_en_paralelo(memoizada, [5, 6], cronometrar=True)
+
+    assert all(segundos >= 0 for segundos in calculado)
+    assert all(math.isnan(segundos) for segundos in desde_cache)
+
+
+def test_solo_se_guardan_las_rutas_escalares(cache):
+    import ej1
+    import ej3
+
+    ej3.metodo_trapecio(100)
+    ej3.metodos_fusionados(100)
+    ej1.sumas_darboux(100)
+    ej1.suma_inferior(100, vectorizado=True)
+    assert _ultimo_acceso() == {}
+
+    ej1.suma_inferior(100)
+    assert [clave for clave in _ultimo_acceso() if '"suma_inferior"' in clave]
+
+
+def test_archivo_por_defecto_junto_al_modulo(tmp_path, monkeypatch):
+    monkeypatch.delenv('CACHE_INTEGRALES', raising=False)
+    monkeypatch.chdir(tmp_path)
+    try:
+        modulo = importlib.reload(cache_resultados)
+        assert os.path.dirname(modulo.ARCHIVO_CACHE) == os.path.dirname(os.path.abspath(modulo.__file__))
+    finally:
+        monkeypatch.undo()
+        importlib.reload(cache_resultados)
@@ -0,0 +1,16 @@
+import pytest
+
+import ej2
+
+
+@pytest.mark.parametrize('integrando', ['semicirculo', 'cuarto_circulo', 'gaussiana', 'seno'])
+def test_duplicacion_igual_al_calculo_directo(integrando):
+    evaluaciones_previas = None
+    for n, aproximacion, evaluaciones in ej2.refinar_clenshaw_curtis(3, 8, integrando=integrando):
+        assert aproximacion == pytest.approx(ej2.metodo_clenshaw_curtis(n, integrando=integrando), rel=1e-13)
+        # Se reutilizan todos los nodos anteriores: solo se evalúan los n/2 nuevos
+        assert evaluaciones == n + 1
+        if evaluaciones_previas is not None:
+            assert evaluaciones - evaluaciones_previas == n // 2
+        evaluaciones_previas = evaluaciones
+
@@ -0,0 +1,56 @@
+import math
+
+import pytest
+
+import ej3
+
+
+@pytest.mark.parametrize('integrando', ['semicirculo', 'gaussiana', 'seno'])
+def test_refinar_trapecio_igual_al_trapecio_directo(integrando):
+    for n, aproximacion, _ in ej3.refinar_trapecio(3, 8, integrando=integrando):
+        assert aproximacion == pytest.approx(ej3.metodo_trapecio(n, integrando=integrando), rel=1e-13)
+
+
+def test_refinar_trapecio_solo_evalua_los_puntos_nuevos():
+    # Cada nivel agrega n - 1 puntos medios: el total es el tamaño de la última partición
+    for n, _, evaluaciones in ej3.refinar_trapecio(2, 10):
+        assert evaluaciones == n
+
+
+@pytest.mark.parametrize('integrando', ['semicirculo', 'cuarto_circulo', 'gaussiana', 'seno'])
+def test_romberg_dentro_de_la_tolerancia(integrando):
+    resultado = ej3.metodo_romberg(tol=1e-10, integrando=integrando)
+    exacto = ej3.obtener_integrando(integrando)['valor_exacto']
+
+    assert resultado['convergio']
+    assert abs(resultado['aproximacion'] - exacto) <= 1e-10
+
+
+@pytest.mark.parametrize('integrando', ['semicirculo', 'cuarto_circulo', 'gaussiana', 'seno'])
+def test_adaptativo_dentro_de_la_tolerancia(integrando):
+    resultado = ej3.metodo_adaptativo(tol=1e-8, integrando=integrando)
+    exacto = ej3.obtener_integrando(integrando)['valor_exacto']
+
+    assert resultado['convergio']
+    assert abs(resultado['aproximacion'] - exacto) <= 1e-8
+    assert resultado['evaluaciones'] <= 100000
+
+
+def test_adaptativo_respeta_el_maximo_de_evaluaciones():
+    resultado = ej3.metodo_adaptativo(tol=1e-15, max_evals=200)
+    assert not resultado['convergio'] and resultado['evaluaciones'] <= 200
+    assert abs(resultado['aproximacion'] - math.pi) < 1e-3
+
+
+@pytest.mark.parametrize('integrando', ['semicirculo', 'gaussiana', 'seno', 'seno_escalar'])
+@pytest.mark.parametrize('n', [2, 3, 10, 101, 1000])
+def test_metodos_fusionados_igual_a_los_metodos_separados(integrando, n):
+    if integrando == 'seno_escalar':
+        # Sin versión vectorizada: se recorre la partición con la versión escalar
+        integrando = dict(ej3.obtener_integrando('seno'), vectorizada=None)
+    rectangulos, trapecio, punto_medio, simpson = ej3.metodos_fusionados(n, integrando)
+
+    assert (rectangulos, trapecio, punto_medio) == (ej3.metodo_rectangulos(n, integrando),
+                                                    ej3.metodo_trapecio(n, integrando),
+                                                    ej3.metodo_punto_medio(n, integrando))
+    assert simpson == pytest.approx((trapecio + 2.0 * punto_medio) / 3.0, rel=1e-15)
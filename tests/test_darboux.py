@@ -0,0 +1,22 @@
+import math
+
+import pytest
+
+import ej1
+
+
+@pytest.mark.parametrize('integrando', ['semicirculo', 'cuarto_circulo', 'gaussiana', 'seno'])
+@pytest.mark.parametrize('n', [2, 3, 10, 101, 1000])
+def test_ruta_escalar_y_vectorizada_coinciden(integrando, n):
+    for suma in (ej1.suma_inferior, ej1.suma_superior):
+        assert suma(n, integrando, vectorizado=True) == pytest.approx(suma(n, integrando), rel=1e-12, abs=1e-14)
+
+
+@pytest.mark.parametrize('n', [10, 11, 1000])
+def test_sumas_darboux_igual_a_las_sumas_separadas(n):
+    inferior, superior, diferencia = ej1.sumas_darboux(n)
+    assert inferior == pytest.approx(ej1.suma_inferior(n), rel=1e-12)
+    assert superior == pytest.approx(ej1.suma_superior(n), rel=1e-12)
+    assert diferencia == pytest.approx(superior - inferior, rel=1e-9)
+    assert inferior < math.pi < superior
+
@@ -0,0 +1,23 @@
+import math
+
+import numpy as np
+import pytest
+
+import ej3
+
+
+def test_nodos_en_memoria_igual_se_guardan_en_disco(tmp_path):
+    nodos, pesos = ej3.nodos_pesos_gauss('legendre', 7)
+    assert not list(tmp_path.iterdir())
+
+    assert ej3.nodos_pesos_gauss('legendre', 7, tmp_path) == (nodos, pesos)
+    with np.load(tmp_path / 'gauss_legendre_7.npz') as datos:
+        np.testing.assert_array_equal(datos['nodos'], nodos)
+        np.testing.assert_array_equal(datos['pesos'], pesos)
+    assert [archivo.name for archivo in tmp_path.iterdir()] == ['gauss_legendre_7.npz']
+
+
+@pytest.mark.parametrize('tipo', ['legendre', 'chebyshev'])
+def test_pesos_integran_el_peso_de_la_cuadratura(tipo):
+    _, pesos = ej3.nodos_pesos_gauss(tipo, 20)
+    assert pesos.sum() == pytest.approx(2.0 if tipo == 'legendre' else math.pi / 2, rel=1e-13)
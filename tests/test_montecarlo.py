@@ -0,0 +1,134 @@
+import csv
+import io
+import math
+import random
+
+import numpy as np
+import pytest
+
+import ej4
+
+
+def test_semilla_reproducible_con_cualquier_jobs():
+    referencia = ej4.metodo_montecarlo_paralelo(50000, seed=7, jobs=1, tamano_bloque=4096)
+    for jobs in (2, 4):
+        assert ej4.metodo_montecarlo_paralelo(50000, seed=7, jobs=jobs, tamano_bloque=4096) == referencia
+
+
+def test_secuencial_se_detiene_con_la_precision_pedida():
+    resultado = ej4.montecarlo_secuencial(1e-2, tamano_lote=10_000, seed=3)
+    inferior, superior = resultado['intervalo']
+
+    assert resultado['convergio'] and resultado['semiancho'] <= 1e-2
+    assert resultado['muestras'] % 10_000 == 0
+    assert inferior <= math.pi <= superior
+
+
+def test_secuencial_con_tolerancia_grande_usa_pocas_muestras():
+    resultado = ej4.montecarlo_secuencial(1e-1, seed=3)
+    inferior, superior = resultado['intervalo']
+    assert resultado['convergio'] and resultado['semiancho'] <= 1e-1
+    assert resultado['muestras'] % 1_000 == 0 and resultado['muestras'] < 10_000
+    assert inferior <= math.pi <= superior
+
+
+@pytest.mark.parametrize('aleatorizar', [False, True])
+def test_sobol_un_punto_por_celda_diadica(aleatorizar):
+    k = 8
+    puntos = ej4.puntos_sobol(2 ** k, np.random.default_rng(1) if aleatorizar else None)
+    for a in range(k + 1):
+        # Celdas de 2^-a × 2^-(k-a): todas de área 2^-k
+        i = np.floor(puntos[:, 0] * 2 ** a).astype(int)
+        j = np.floor(puntos[:, 1] * 2 ** (k - a)).astype(int)
+        assert np.all(np.bincount(i * 2 ** (k - a) + j, minlength=2 ** k) == 1)
+
+
+@pytest.mark.parametrize('secuencia', ['sobol', 'halton'])
+def test_puntos_qmc_en_el_cuadrado_unitario(secuencia):
+    for rng in (None, np.random.default_rng(2)):
+        puntos = ej4.SECUENCIAS_QMC[secuencia](5000, rng)
+        assert puntos.shape == (5000, 2)
+        assert np.all((puntos >= 0.0) & (puntos < 1.0))
+
+
+@pytest.mark.parametrize('secuencia', ['sobol', 'halton'])
+@pytest.mark.parametrize('estimador, mejora', [('acierto', 4), ('media', 100)])
+def test_qmc_reproducible_y_con_menos_error(secuencia, estimador, mejora):
+    n, aleatorizaciones = 4096, 10
+    resultado = ej4.montecarlo_qmc_aleatorizado(n, secuencia, estimador, aleatorizaciones, seed=5)
+    assert ej4.montecarlo_qmc_aleatorizado(n, secuencia, estimador, aleatorizaciones, seed=5) == resultado
+
+    # Error estándar con los mismos aleatorizaciones × n puntos pseudoaleatorios
+    varianza = 16 * (math.pi / 4) * (1 - math.pi / 4) if estimador == 'acierto' else 32 / 3 - math.pi ** 2
+    assert resultado['error_estandar'] < math.sqrt(varianza / (n * aleatorizaciones)) / mejora
+
+
+def test_media_no_depende_del_tamano_de_bloque():
+    referencia = ej4.metodo_montecarlo_media_vectorizado(200000, seed=9)
+    for tamano_bloque in (1000, 65536):
+        resultado = ej4.metodo_montecarlo_media_vectorizado(200000, seed=9, tamano_bloque=tamano_bloque)
+        assert resultado == pytest.approx(referencia, rel=1e-12)
+
+    error_estandar = math.sqrt((32 / 3 - math.pi ** 2) / 200000)
+    assert abs(referencia - math.pi) < 5 * error_estandar
+
+
+def test_media_escalar_cerca_de_pi():
+    random.seed(4)
+    error_estandar = math.sqrt((32 / 3 - math.pi ** 2) / 20000)
+    assert abs(ej4.metodo_montecarlo_media(20000) - math.pi) < 5 * error_estandar
+
+
+@pytest.mark.parametrize('prefijos', [False, True])
+def test_matriz_repeticiones_reproducible_con_cualquier_jobs(prefijos):
+    secuencial = ej4.matriz_repeticiones([100, 1000], 4, jobs=1, seed=11, prefijos=prefijos)
+    paralelo = ej4.matriz_repeticiones([100, 1000], 4, jobs=3, seed=11, prefijos=prefijos)
+
+    assert secuencial.shape == (4, 2)
+    np.testing.assert_array_equal(secuencial, paralelo)
+    assert not np.array_equal(secuencial, ej4.matriz_repeticiones([100, 1000], 4, jobs=1, seed=12, prefijos=prefijos))
+
+
+def test_estadisticas_de_las_repeticiones():
+    matriz = np.random.default_rng(0).normal(math.pi, 0.1, (6, 4))
+    estadisticas = ej4.estadisticas_repeticiones(matriz)
+
+    np.testing.assert_allclose(estadisticas['promedio'], matriz.mean(axis=0))
+    np.testing.assert_allclose(estadisticas['desv_est'], matriz.std(axis=0))
+    np.testing.assert_allclose(estadisticas['residuo'], np.abs(matriz.mean(axis=0) - math.pi))
+
+
+def test_prefijos_igual_a_la_estimacion_directa():
+    n_valores = [100, 1000, 5000]
+    matriz = ej4.matriz_repeticiones(n_valores, 3, seed=11, prefijos=True)
+
+    for fila, semilla in zip(matriz, ej4._semillas_filas(11, 3)):
+        # Flujo de la fila: max(N) valores de x y después max(N) valores de y
+        rng = np.random.default_rng(semilla)
+        x = rng.uniform(-1.0, 1.0, 5000)
+        y = rng.uniform(0.0, 2.0, 5000)
+        valores = 4.0 * (y <= 2.0 * np.sqrt(1.0 - x * x))
+        for n, estimacion in zip(n_valores, fila):
+            assert estimacion == pytest.approx(valores[:n].mean(), rel=1e-15)
+
+
+def test_tabla_comparativa_calcula_el_barrido(capsys):
+    for prefijos in (False, True):
+        ej4.generar_tabla_comparativa_montecarlo(10, 30, 10, 1, repeticiones=2, prefijos=prefijos)
+    assert 'TABLA 1' in capsys.readouterr().out
+
+
+def test_tabla_csv_calcula_el_barrido():
+    salida = io.StringIO()
+    ej4.generar_tabla_individual_csv_montecarlo(csv.writer(salida), 10, 30, 10, 1, repeticiones=2, prefijos=True)
+    filas = list(csv.reader(io.StringIO(salida.getvalue())))
+    assert [fila[0] for fila in filas[-3:]] == ['10', '20', '30']
+
+
+def test_importancia_reduce_la_varianza_de_la_media():
+    media = ej4.metodo_montecarlo_reduccion(100000, 'media', seed=1)
+    importancia = ej4.metodo_montecarlo_reduccion(100000, 'importancia', seed=1)
+
+    assert media['varianza'] == pytest.approx(32 / 3 - math.pi ** 2, rel=0.02)
+    assert media['varianza'] / importancia['varianza'] > 10
+    assert importancia['aproximacion'] == pytest.approx(math.pi, abs=5 * importancia['error_estandar'])
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+import pytest
+
+from presupuesto_importacion import DIRECTORIO, MODULOS_PROHIBIDOS, PRESUPUESTOS_MS, medir_importacion
+
+
+def test_importar_los_ejercicios_no_carga_matplotlib():
+    codigo = (f"import sys, {', '.join(PRESUPUESTOS_MS)}; "
+              f"cargados = sorted(m for m in sys.modules if m.split('.')[0] in {MODULOS_PROHIBIDOS!r}); "
+              f"assert 'matplotlib' not in sys.modules and not cargados, cargados")
+    resultado = subprocess.run([sys.executable, '-c', codigo], cwd=DIRECTORIO, capture_output=True, text=True)
+    assert resultado.returncode == 0, resultado.stderr
+
+
+@pytest.mark.parametrize('modulo', list(PRESUPUESTOS_MS))
+def test_medir_importacion_sin_paquetes_prohibidos(modulo):
+    milisegundos, cargados = medir_importacion(modulo)
+    assert milisegundos > 0 and cargados == []
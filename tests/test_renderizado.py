@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+import pytest
+
+from renderizado import (crear_ejecutor_renderizado, diezmar_rectangulos, enviar_figuras, esperar_figuras, figura, linea,
+                         renderizar_figura)
+
+
+def _especificacion(archivo):
+    return figura(archivo, (4, 3), [linea([0.0, 1.0, 2.0], [0.0, 1.0, 4.0], 'b-', label='x²')],
+                  titulo='Prueba', xlabel='x', ylabel='y', leyenda={'fontsize': 8}, dpi=50)
+
+
+def _es_png(archivo):
+    with open(archivo, 'rb') as entrada:
+        return entrada.read(8) == b'\x89PNG\r\n\x1a\n'
+
+
+def test_renderizar_figura_en_el_proceso(tmp_path):
+    archivo = str(tmp_path / 'figura.png')
+    nombre, segundos = renderizar_figura(_especificacion(archivo))
+
+    assert nombre == archivo and _es_png(archivo)
+    assert isinstance(segundos, float) and segundos > 0
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_enviar_y_esperar_figuras(tmp_path, capsys, jobs):
+    archivos = [str(tmp_path / f'figura_{i}.png') for i in range(3)]
+    ejecutor = crear_ejecutor_renderizado(jobs)
+    try:
+        tiempos = esperar_figuras(enviar_figuras([_especificacion(archivo) for archivo in archivos], ejecutor))
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+
+    assert [nombre for nombre, _ in tiempos] == archivos
+    assert all(isinstance(segundos, float) for _, segundos in tiempos)
+    assert all(os.path.exists(archivo) and _es_png(archivo) for archivo in archivos)
+    assert capsys.readouterr().out.count('Gráfica guardada') == 3
+
+
+def _particiones():
+    rng = np.random.default_rng(3)
+    yield np.linspace(-1.0, 1.0, 100001)
+    yield np.cos(np.linspace(np.pi, 0.0, 50001))
+    yield np.concatenate(([-1.0], np.sort(rng.uniform(-1.0, 1.0, 20000)), [1.0]))
+    # Unos pocos subintervalos más anchos que una columna entre muchos angostos
+    yield np.concatenate((np.linspace(-1.0, -0.5, 30000), [0.0, 0.25], np.linspace(0.5, 1.0, 30000)))
+
+
+@pytest.mark.parametrize('nodos', list(_particiones()))
+def test_diezmar_conserva_area_y_contiguidad(nodos):
+    altura = 2.0 * np.sqrt(np.maximum(1.0 - ((nodos[:-1] + nodos[1:]) / 2.0) ** 2, 0.0))
+    izquierda, derecha, altura_diezmada = diezmar_rectangulos(nodos, altura, 500)
+
+    assert len(altura_diezmada) <= 500
+    assert izquierda[0] == nodos[0] and derecha[-1] == nodos[-1]
+    np.testing.assert_array_equal(izquierda[1:], derecha[:-1])
+    assert np.sum(altura_diezmada * (derecha - izquierda)) == pytest.approx(np.sum(altura * np.diff(nodos)), rel=1e-12)
+
+
+def test_pocos_rectangulos_quedan_como_estan():
+    nodos = np.linspace(0.0, 1.0, 11)
+    izquierda, derecha, altura = diezmar_rectangulos(nodos, np.arange(10.0), 500)
+
+    np.testing.assert_array_equal(izquierda, nodos[:-1])
+    np.testing.assert_array_equal(derecha, nodos[1:])
+    np.testing.assert_array_equal(altura, np.arange(10.0))
@@ -0,0 +1,32 @@
+import numpy as np
+
+from resultados_columnares import COLUMNAS, guardar_columnas, leer_columnas
+
+
+def _columnas(filas, desplazamiento=0.0):
+    return {nombre: np.arange(filas).astype(tipo) + tipo(desplazamiento) for nombre, tipo in COLUMNAS}
+
+
+def test_ida_y_vuelta_conserva_los_tipos(tmp_path):
+    guardar_columnas(tmp_path, _columnas(5), {'origen': 'prueba'})
+    columnas, esquema = leer_columnas(tmp_path)
+
+    assert esquema['filas'] == 5 and esquema['origen'] == 'prueba'
+    for nombre, tipo in COLUMNAS:
+        assert isinstance(columnas[nombre], np.memmap)
+        assert columnas[nombre].dtype == np.dtype(tipo)
+        np.testing.assert_array_equal(columnas[nombre], _columnas(5)[nombre])
+
+
+def test_reescribir_no_toca_las_columnas_mapeadas(tmp_path):
+    guardar_columnas(tmp_path, _columnas(1000))
+    viejas, _ = leer_columnas(tmp_path)
+
+    guardar_columnas(tmp_path, _columnas(10, desplazamiento=7))
+    nuevas, esquema = leer_columnas(tmp_path)
+
+    assert esquema['filas'] == 10
+    np.testing.assert_array_equal(viejas['estimacion'], np.arange(1000.0))
+    np.testing.assert_array_equal(nuevas['estimacion'], np.arange(10.0) + 7)
+    assert not list(tmp_path.glob('*.tmp'))
+